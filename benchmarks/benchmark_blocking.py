@@ -0,0 +1,60 @@
+import argparse
+import random
+import time
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_local_circuit(local_qubits, depth, rng):
+    """
+    Builds layers of rotations and CX gates on the local_qubits low-order qubits.
+    """
+    c = MimiqCircuit()
+    for layer in range(depth):
+        for q in range(local_qubits):
+            c.push(GateRY(rng.uniform(0, 6.28)), q)
+        for q in range(layer % 2, local_qubits - 1, 2):
+            c.push(GateCX(), q, q + 1)
+    return c
+
+
+def main():
+    """
+    Compares plain and cache-blocked evolution of circuits acting on
+    low-order qubits of a large state, reporting the wall time and the
+    effective memory bandwidth (one read and one write of the state per gate).
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_blocking.py --qubits 24 26 28 --blocking 14
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--qubits", type=int, nargs="+", default=[24, 26, 28])
+    parser.add_argument("--blocking", type=int, default=14)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'qubits':>6} {'gates':>6} {'plain [s]':>10} {'blocked [s]':>12} "
+          f"{'plain [GB/s]':>13} {'blocked [GB/s]':>15}")
+    for n in args.qubits:
+        circuit = build_local_circuit(args.blocking, args.depth, random.Random(args.seed))
+        # Touch the highest qubit so the state spans n qubits
+        circuit.push(GateID(), n - 1)
+        traffic = len(circuit) * 2 * 2**n * 16 / 1e9
+
+        timings = []
+        for blocking in (0, args.blocking):
+            processor = Quantanium(blocking=blocking)
+            start = time.perf_counter()
+            processor.evolve(circuit, seed=1)
+            timings.append(time.perf_counter() - start)
+
+        print(f"{n:>6} {len(circuit):>6} {timings[0]:>10.3f} {timings[1]:>12.3f} "
+              f"{traffic / timings[0]:>13.1f} {traffic / timings[1]:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import random
+import time
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_circuit(num_qubits, depth, rng):
+    """
+    Builds a small random circuit of RX/RZ layers entangled by CX ladders.
+    """
+    c = MimiqCircuit()
+    for _ in range(depth):
+        for q in range(num_qubits):
+            c.push(GateRX(rng.uniform(0, 6.28)), q)
+            c.push(GateRZ(rng.uniform(0, 6.28)), q)
+        for q in range(num_qubits - 1):
+            c.push(GateCX(), q, q + 1)
+    c.push(Measure(), range(num_qubits), range(num_qubits))
+    return c
+
+
+def main():
+    """
+    Compares `Quantanium.execute` called in a loop with `Quantanium.execute_batch`.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_execute_batch.py --circuits 1000 --qubits 8
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--circuits", type=int, default=1000)
+    parser.add_argument("--qubits", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--nsamples", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    circuits = [build_circuit(args.qubits, args.depth, rng) for _ in range(args.circuits)]
+    processor = Quantanium()
+
+    start = time.perf_counter()
+    for i, circuit in enumerate(circuits):
+        processor.execute(circuit, nsamples=args.nsamples, seed=i)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    processor.execute_batch(
+        circuits, nsamples=args.nsamples, seeds=0, num_threads=args.threads
+    )
+    batch_time = time.perf_counter() - start
+
+    print(f"loop  : {loop_time:.3f} s")
+    print(f"batch : {batch_time:.3f} s  (x{loop_time / batch_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import math
+import random
+import time
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_qft_circuit(num_qubits):
+    """
+    Builds the quantum Fourier transform, without the final swaps.
+    """
+    c = MimiqCircuit()
+    for i in range(num_qubits):
+        c.push(GateH(), i)
+        for j in range(i + 1, num_qubits):
+            c.push(GateCP(math.pi / 2 ** (j - i)), j, i)
+    return c
+
+
+def build_random_circuit(num_qubits, depth, rng):
+    """
+    Builds a random circuit of rotation layers entangled by CX gates on
+    neighbouring pairs.
+    """
+    c = MimiqCircuit()
+    for layer in range(depth):
+        for q in range(num_qubits):
+            c.push(GateRX(rng.uniform(0, 6.28)), q)
+            c.push(GateRZ(rng.uniform(0, 6.28)), q)
+        for q in range(layer % 2, num_qubits - 1, 2):
+            c.push(GateCX(), q, q + 1)
+    return c
+
+
+def build_qaoa_circuit(num_qubits, depth, rng):
+    """
+    Builds a QAOA circuit for MaxCut on a ring, whose cost layers are diagonal.
+    """
+    c = MimiqCircuit()
+    for q in range(num_qubits):
+        c.push(GateH(), q)
+    for _ in range(depth):
+        gamma, beta = rng.uniform(0, 3.14), rng.uniform(0, 3.14)
+        for q in range(num_qubits):
+            c.push(GateRZZ(gamma), q, (q + 1) % num_qubits)
+        for q in range(num_qubits):
+            c.push(GateRX(beta), q)
+    return c
+
+
+def main():
+    """
+    Compares execution without and with gate fusion on QFT, QAOA and random circuits,
+    reporting the number of full statevector sweeps and the wall time.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_fusion.py --qubits 20 24 --depth 20
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--qubits", type=int, nargs="+", default=[20, 24])
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    plain = Quantanium()
+    fused = Quantanium(fusion=2)
+
+    print(f"{'circuit':>8} {'qubits':>6} {'sweeps':>7} {'fused':>7} "
+          f"{'plain [s]':>10} {'fused [s]':>10} {'speedup':>8}")
+    for n in args.qubits:
+        circuits = {
+            "qft": build_qft_circuit(n),
+            "qaoa": build_qaoa_circuit(n, args.depth, random.Random(args.seed)),
+            "random": build_random_circuit(n, args.depth, random.Random(args.seed)),
+        }
+        for name, circuit in circuits.items():
+            start = time.perf_counter()
+            plain.execute(circuit, nsamples=1, seed=1)
+            plain_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            fused.execute(circuit, nsamples=1, seed=1)
+            fused_time = time.perf_counter() - start
+
+            stats = fused.fusion_stats()
+            print(f"{name:>8} {n:>6} {stats['sweeps_before']:>7} {stats['sweeps_after']:>7} "
+                  f"{plain_time:>10.3f} {fused_time:>10.3f} {plain_time / fused_time:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import time
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_circuit(num_instructions, num_qubits):
+    """
+    Builds a deep circuit cycling through supported, wrapped and decomposed operations.
+    """
+    ops = [
+        (GateH(), 1),
+        (GateRX(0.3), 1),
+        (GateCX(), 2),
+        (Power(GateX(), 0.5), 1),
+        (Inverse(GateT()), 1),
+        (GateCCX(), 3),
+    ]
+    c = MimiqCircuit()
+    for i in range(num_instructions):
+        op, n = ops[i % len(ops)]
+        first = i % (num_qubits - n + 1)
+        c.push(op, *range(first, first + n))
+    return c
+
+
+def main():
+    """
+    Times `Quantanium.issupported` and `_decompose_mimiq` over a deep circuit.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_issupported.py --instructions 1000000
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--instructions", type=int, default=10**6)
+    parser.add_argument("--qubits", type=int, default=16)
+    args = parser.parse_args()
+
+    circuit = build_circuit(args.instructions, args.qubits)
+    ops = [inst.get_operation() for inst in circuit]
+    processor = Quantanium()
+
+    start = time.perf_counter()
+    for op in ops:
+        processor.issupported(op)
+    support_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    processor._decompose_mimiq(circuit)
+    decompose_time = time.perf_counter() - start
+
+    n = len(ops)
+    print(f"issupported : {support_time:.3f} s ({1e9 * support_time / n:.0f} ns/instruction)")
+    print(f"decompose   : {decompose_time:.3f} s ({1e9 * decompose_time / n:.0f} ns/instruction)")
+
+
+if __name__ == "__main__":
+    main()
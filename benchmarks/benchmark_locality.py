@@ -0,0 +1,63 @@
+import argparse
+import random
+import time
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_skewed_circuit(num_qubits, depth, active, rng):
+    """
+    Builds a circuit whose layers mostly act on the `active` highest qubits,
+    with a single layer touching every qubit.
+    """
+    c = MimiqCircuit()
+    for q in range(num_qubits):
+        c.push(GateH(), q)
+    high = list(range(num_qubits - active, num_qubits))
+    for _ in range(depth):
+        for q in high:
+            c.push(GateU(*(rng.uniform(0, 6.28) for _ in range(3))), q)
+        for a, b in zip(high[::2], high[1::2]):
+            c.push(GateCX(), a, b)
+    return c
+
+
+def main():
+    """
+    Compares execution without and with qubit-locality reordering on circuits
+    whose work is concentrated on high-order qubits.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_locality.py --qubits 26 28 30 --depth 20
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--qubits", type=int, nargs="+", default=[26, 28, 30])
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--active", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    plain = Quantanium()
+    reordered = Quantanium(reorder_qubits=True)
+
+    print(f"{'qubits':>6} {'plain [s]':>10} {'reordered [s]':>14} {'speedup':>8}")
+    for n in args.qubits:
+        circuit = build_skewed_circuit(n, args.depth, args.active, random.Random(args.seed))
+
+        start = time.perf_counter()
+        plain.execute(circuit, nsamples=1, seed=1)
+        plain_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reordered.execute(circuit, nsamples=1, seed=1)
+        reordered_time = time.perf_counter() - start
+
+        print(f"{n:>6} {plain_time:>10.3f} {reordered_time:>14.3f} "
+              f"{plain_time / reordered_time:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import os
+import random
+import time
+from quantanium.Quantanium import Quantanium
+from quantanium import outofcore
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_random_circuit(num_qubits, depth, rng):
+    """
+    Builds a random circuit of U layers entangled by CX gates on random pairs.
+    """
+    c = MimiqCircuit()
+    for _ in range(depth):
+        for q in range(num_qubits):
+            c.push(GateU(*(rng.uniform(0, 6.28) for _ in range(3))), q)
+        qubits = list(range(num_qubits))
+        rng.shuffle(qubits)
+        for a, b in zip(qubits[::2], qubits[1::2]):
+            c.push(GateCX(), a, b)
+    c.push(Measure(), range(num_qubits), range(num_qubits))
+    return c
+
+
+def main():
+    """
+    Executes random circuits in RAM and with the out-of-core storage, around
+    the number of qubits whose state fills the physical memory, reporting the
+    passes over the backing file and the time of both. In-RAM runs are
+    skipped for states larger than the physical memory.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_outofcore.py --qubits 31 32 33 --path /nvme/state.qua
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--qubits", type=int, nargs="+", default=None,
+                        help="defaults to the RAM limit and the 2 following sizes")
+    parser.add_argument("--path", default="state.qua")
+    parser.add_argument("--chunk-qubits", type=int, default=None)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--nsamples", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    memory = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    limit = (memory // 16).bit_length() - 1
+    qubits = args.qubits or [limit, limit + 1, limit + 2]
+    print(f"physical memory: {memory / 2**30:.1f} GiB, largest in-RAM state: {limit} qubits")
+
+    print(f"{'qubits':>6} {'state [GiB]':>11} {'chunk':>5} {'gates':>6} {'passes':>6} "
+          f"{'in RAM [s]':>10} {'mmap [s]':>9}")
+    for n in qubits:
+        circuit = build_random_circuit(n, args.depth, random.Random(args.seed))
+        available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        chunk_qubits = args.chunk_qubits or outofcore.default_chunk_qubits(n, 16, available)
+        processor = Quantanium(storage="mmap", path=args.path, chunk_qubits=chunk_qubits)
+        stages = outofcore.schedule(
+            outofcore.unitary_gates(processor._prepare_mimiq(circuit)), chunk_qubits
+        )
+
+        start = time.perf_counter()
+        processor.execute(circuit, nsamples=args.nsamples, seed=1)
+        mapped = time.perf_counter() - start
+        del processor
+
+        in_ram = "skipped"
+        if 16 * 2**n <= memory:
+            start = time.perf_counter()
+            Quantanium().execute(circuit, nsamples=args.nsamples, seed=1)
+            in_ram = f"{time.perf_counter() - start:.3f}"
+
+        print(f"{n:>6} {16 * 2**n / 2**30:>11.1f} {chunk_qubits:>5} {len(circuit):>6} "
+              f"{len(stages):>6} {in_ram:>10} {mapped:>9.3f}")
+
+    if os.path.exists(args.path):
+        os.remove(args.path)
+
+
+if __name__ == "__main__":
+    main()
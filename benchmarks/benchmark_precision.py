@@ -0,0 +1,65 @@
+import argparse
+import random
+import time
+import numpy as np
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_random_circuit(num_qubits, depth, rng):
+    """
+    Builds a random circuit of U layers entangled by CX gates on random pairs.
+    """
+    c = MimiqCircuit()
+    for _ in range(depth):
+        for q in range(num_qubits):
+            c.push(GateU(*(rng.uniform(0, 6.28) for _ in range(3))), q)
+        qubits = list(range(num_qubits))
+        rng.shuffle(qubits)
+        for a, b in zip(qubits[::2], qubits[1::2]):
+            c.push(GateCX(), a, b)
+    return c
+
+
+def main():
+    """
+    Compares single and double precision CPU execution on random circuits:
+    wall time and fidelity of the single precision state to the double one.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_precision.py --qubits 16 20 24 --depth 20
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--qubits", type=int, nargs="+", default=[16, 20, 24])
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    double = Quantanium(precision="double")
+    single = Quantanium(precision="single")
+
+    print(f"{'qubits':>6} {'double [s]':>11} {'single [s]':>11} {'speedup':>8} {'1 - fidelity':>13}")
+    for n in args.qubits:
+        circuit = build_random_circuit(n, args.depth, random.Random(args.seed))
+
+        start = time.perf_counter()
+        double.execute(circuit, nsamples=1, seed=1, return_statevector=True)
+        double_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single.execute(circuit, nsamples=1, seed=1, return_statevector=True)
+        single_time = time.perf_counter() - start
+
+        psi = double.get_statevector()
+        phi = single.get_statevector().astype(np.complex128)
+        infidelity = 1.0 - abs(np.vdot(psi, phi)) ** 2
+
+        print(f"{n:>6} {double_time:>11.3f} {single_time:>11.3f} "
+              f"{double_time / single_time:>8.2f} {infidelity:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import time
+from quantanium.Quantanium import Quantanium
+from quantanium._core import execute_double_cpu
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_circuit(num_qubits):
+    """
+    Builds a GHZ-like circuit measuring every qubit, so that every sample
+    carries a full classical register.
+    """
+    c = MimiqCircuit()
+    c.push(GateH(), 0)
+    c.push(GateCX(), 0, range(1, num_qubits))
+    c.push(Measure(), range(num_qubits), range(num_qubits))
+    return c
+
+
+def main():
+    """
+    Measures the cost of converting native QCSResults to mimiqcircuits
+    QCSResults as a function of the number of samples.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_results_conversion.py --qubits 20 --repeat 3
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--qubits", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--nsamples", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6]
+    )
+    args = parser.parse_args()
+
+    processor = Quantanium()
+    qua_circuit = processor.convert_mimiq_to_qua_circuit(build_circuit(args.qubits))
+
+    print(f"{'nsamples':>10} {'simulate [s]':>14} {'convert [s]':>14}")
+    for nsamples in args.nsamples:
+        best_sim = best_conv = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            qua_result, _ = execute_double_cpu(qua_circuit, nsamples, 1, [])
+            best_sim = min(best_sim, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            processor.convert_qua_results_to_mimiq_results(qua_result)
+            best_conv = min(best_conv, time.perf_counter() - start)
+        print(f"{nsamples:>10} {best_sim:>14.4f} {best_conv:>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import os
+import random
+import time
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_random_circuit(num_qubits, depth, rng):
+    """
+    Builds a random circuit of U layers entangled by CX gates on random pairs.
+    """
+    c = MimiqCircuit()
+    for _ in range(depth):
+        for q in range(num_qubits):
+            c.push(GateU(*(rng.uniform(0, 6.28) for _ in range(3))), q)
+        qubits = list(range(num_qubits))
+        rng.shuffle(qubits)
+        for a, b in zip(qubits[::2], qubits[1::2]):
+            c.push(GateCX(), a, b)
+    return c
+
+
+def main():
+    """
+    Times the execution of a random circuit from one thread up to every core,
+    for each NUMA placement policy, reporting the speedup over one thread.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_scaling.py --qubits 28 --numa none local interleave
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--qubits", type=int, default=26)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--numa", nargs="+", default=["none", "local", "interleave"])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--bind-openmp", action="store_true",
+                        help="pin the OpenMP threads of the engine, see Quantanium.bind_openmp_threads")
+    args = parser.parse_args()
+    if args.bind_openmp:
+        Quantanium.bind_openmp_threads()
+
+    circuit = build_random_circuit(args.qubits, args.depth, random.Random(args.seed))
+    cores = os.cpu_count() or 1
+    threads = sorted({1 << k for k in range(cores.bit_length()) if 1 << k <= cores} | {cores})
+
+    print(f"{'numa':>10} {'threads':>7} {'time [s]':>9} {'speedup':>8}")
+    for numa in args.numa:
+        baseline = None
+        for num_threads in threads:
+            processor = Quantanium(num_threads=num_threads, numa=numa)
+            start = time.perf_counter()
+            processor.evolve(circuit, seed=1)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{numa:>10} {num_threads:>7} {elapsed:>9.3f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from quantanium.Quantanium import Quantanium
+from mimiqcircuits import *
+from mimiqcircuits import Circuit as MimiqCircuit
+
+
+def build_circuit(num_qubits, depth):
+    """
+    Builds layers of H gates entangled by a CX fan-out from qubit 0.
+    """
+    c = MimiqCircuit()
+    for _ in range(depth):
+        for q in range(num_qubits):
+            c.push(GateH(), q)
+        c.push(GateCX(), 0, range(1, num_qubits))
+    c.push(Measure(), range(num_qubits), range(num_qubits))
+    return c
+
+
+def main():
+    """
+    Compares independent Quantanium instances executed one after the other with
+    the same instances driven from a pool of Python threads.
+
+    Usage Example:
+        ```bash
+        python benchmarks/benchmark_threads.py --threads 4 --qubits 20
+        ```
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--qubits", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--nsamples", type=int, default=100)
+    args = parser.parse_args()
+
+    circuit = build_circuit(args.qubits, args.depth)
+
+    def run(seed):
+        return Quantanium().execute(circuit, nsamples=args.nsamples, seed=seed)
+
+    # Warm up
+    run(0)
+
+    start = time.perf_counter()
+    for seed in range(args.threads):
+        run(seed)
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(run, range(args.threads)))
+    threaded_time = time.perf_counter() - start
+
+    print(f"sequential : {sequential_time:.3f} s")
+    print(f"threaded   : {threaded_time:.3f} s  (x{sequential_time / threaded_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ def main():
     g = GateCustom(np.matrix([[0.0, 1.0], [1.0, 0.0]]))
     circ = Circuit()
     circ.push(g, 4)
-    results = processor.execute(circ, nsamples=100, seed=1)
+    results = processor.execute(circ, nsamples=100, seed=1, return_statevector=True)
     sv = processor.get_statevector()
     # Print the results of the execution
     print(results)
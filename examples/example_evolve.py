@@ -72,6 +72,23 @@ def main():
         print("\n=== Histogram ===")
         for state, count in sorted(histogram.items()):
             print(f"{state}: {count}")
+
+        print("\nThird example: second example with the shot loop run natively")
+        # Expected result 50% - 100 50% - 111
+        mimiq_circuit = MimiqCircuit()
+        mimiq_circuit.push(GateX(), 4)
+        mimiq_circuit.push(Measure(), 4, 0)
+
+        mimiq_circuit2 = MimiqCircuit()
+        mimiq_circuit2.push(GateH(), 0)
+        mimiq_circuit2.push(GateCX(), 0, range(2, 4))
+        mimiq_circuit2.push(MeasureZZ(), 0, 1, 1)
+        mimiq_circuit2.push(Measure(), 3, 2)
+
+        histogram = processor.evolve_shots([mimiq_circuit, mimiq_circuit2], nshots=1000)
+        print("\n=== Histogram ===")
+        for state, count in sorted(histogram.items()):
+            print(f"{state}: {count}")
             
 
 
@@ -32,12 +32,40 @@
 #include <quantanium/proto/ProtoResult.hpp>
 
 // Python Wrapper
+#include <pybind11/complex.h>
 #include <pybind11/iostream.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/stl_bind.h>
 
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <exception>
+#include <filesystem>
+#include <fstream>
+#include <iterator>
+#include <mutex>
+#include <random>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <type_traits>
+#include <utility>
+
+#ifdef __linux__
+#include <pthread.h>
+#include <sched.h>
+#include <sys/mman.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+#endif
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
 #if QUANTANIUM_USE_CUDA
 #include <cuda_runtime.h>
 #include <custatevec.h>
@@ -93,6 +121,909 @@ namespace py = pybind11;
 
 namespace qua = quantanium;
 
+/// Moves a native amplitude buffer into a NumPy array without copying it.
+/// The capsule owns the vector and frees it once the array is collected.
+template <typename T>
+static py::array_t<std::complex<T>> as_numpy_array(std::vector<std::complex<T>> &&amplitudes)
+{
+    auto *owned = new std::vector<std::complex<T>>(std::move(amplitudes));
+    py::capsule free_when_done(owned, [](void *ptr)
+                               { delete static_cast<std::vector<std::complex<T>> *>(ptr); });
+    return py::array_t<std::complex<T>>(owned->size(), owned->data(), free_when_done);
+}
+
+/// A uniquely named file in the temporary directory, removed when leaving
+/// scope. The engine only reads and writes protobuf messages through files.
+class TemporaryFile
+{
+public:
+    TemporaryFile()
+    {
+        static std::atomic<std::uint64_t> counter{0};
+        std::random_device device;
+        std::uint64_t tag = (static_cast<std::uint64_t>(device()) << 32) ^ counter.fetch_add(1);
+        path_ = std::filesystem::temp_directory_path() / ("quantanium_" + std::to_string(tag) + ".pb");
+    }
+
+    TemporaryFile(const TemporaryFile &) = delete;
+    TemporaryFile &operator=(const TemporaryFile &) = delete;
+
+    ~TemporaryFile()
+    {
+        std::error_code ec;
+        std::filesystem::remove(path_, ec);
+    }
+
+    std::string path() const { return path_.string(); }
+
+    void write(const char *data, std::size_t size) const
+    {
+        std::ofstream out(path_, std::ios::binary | std::ios::trunc);
+        out.write(data, static_cast<std::streamsize>(size));
+        if (!out)
+        {
+            throw std::runtime_error("Could not write " + path_.string());
+        }
+    }
+
+    std::string read() const
+    {
+        std::ifstream in(path_, std::ios::binary);
+        if (!in)
+        {
+            throw std::runtime_error("Could not read " + path_.string());
+        }
+        return std::string(std::istreambuf_iterator<char>(in), std::istreambuf_iterator<char>());
+    }
+
+private:
+    std::filesystem::path path_;
+};
+
+/// Whether the engine gives direct access to the amplitudes of a statevector
+/// through StateVector::Data(). Engines that do not only hand out copies.
+template <typename SV, typename = void>
+struct has_state_data : std::false_type
+{
+};
+
+template <typename SV>
+struct has_state_data<SV, std::void_t<decltype(std::declval<SV &>().Data())>> : std::true_type
+{
+};
+
+template <typename T>
+constexpr bool state_data_available = has_state_data<qua::StateVector<T, qua::CPU>>::value;
+
+/// Returns the amplitudes of a CPU statevector, or throws if the engine does
+/// not expose them.
+template <typename T>
+static std::complex<T> *state_data(qua::StateVector<T, qua::CPU> &sv)
+{
+    if constexpr (state_data_available<T>)
+    {
+        return sv.Data();
+    }
+    else
+    {
+        (void)sv;
+        throw std::runtime_error("this engine build does not expose the statevector memory");
+    }
+}
+
+/// Describes the amplitudes of a CPU statevector to the Python buffer protocol,
+/// so that numpy.asarray(sv) is a writable view on the engine memory.
+template <typename T>
+static py::buffer_info statevector_buffer(qua::StateVector<T, qua::CPU> &sv)
+{
+    return py::buffer_info(
+        state_data(sv),
+        sizeof(std::complex<T>),
+        py::format_descriptor<std::complex<T>>::format(),
+        1,
+        {std::size_t{1} << sv.NumQubits()},
+        {sizeof(std::complex<T>)},
+        false);
+}
+
+/// Packs the bits of bv into nwords words, bit i going to word
+/// i / (8 * sizeof(Word)) at position i % (8 * sizeof(Word)) (little bit order,
+/// as numpy.unpackbits(..., bitorder="little") expects).
+template <typename Word>
+static void pack_bits(const qua::from_proto::BitVector &bv, Word *out, std::size_t nwords)
+{
+    constexpr std::size_t word_bits = 8 * sizeof(Word);
+    std::fill(out, out + nwords, Word{0});
+    for (std::size_t i = 0; i < bv.Size(); ++i)
+    {
+        if (bv[i])
+        {
+            out[i / word_bits] |= Word{1} << (i % word_bits);
+        }
+    }
+}
+
+/// Packs a list of bit vectors into a (len(bvs), words) array, padding the
+/// shorter ones with zeros.
+template <typename Word>
+static py::array_t<Word> pack_bitvectors(const std::vector<qua::from_proto::BitVector> &bvs)
+{
+    constexpr std::size_t word_bits = 8 * sizeof(Word);
+    std::size_t nbits = 0;
+    for (const auto &bv : bvs)
+    {
+        nbits = std::max<std::size_t>(nbits, bv.Size());
+    }
+    const std::size_t nwords = (nbits + word_bits - 1) / word_bits;
+
+    py::array_t<Word> packed({bvs.size(), nwords});
+    Word *data = packed.mutable_data();
+    for (std::size_t i = 0; i < bvs.size(); ++i)
+    {
+        pack_bits(bvs[i], data + i * nwords, nwords);
+    }
+    return packed;
+}
+
+static py::array pack_bitvectors_as(const std::vector<qua::from_proto::BitVector> &bvs, int word_bits)
+{
+    switch (word_bits)
+    {
+    case 8:
+        return pack_bitvectors<std::uint8_t>(bvs);
+    case 64:
+        return pack_bitvectors<std::uint64_t>(bvs);
+    default:
+        throw std::invalid_argument("word_bits must be either 8 or 64");
+    }
+}
+
+/// Threading and memory placement of the native loops, set from Python
+/// through set_num_threads and set_numa_policy. Both are process-wide.
+static std::atomic<unsigned int> g_num_threads{0};
+static std::atomic<int> g_numa_policy{0};
+
+enum NumaPolicy
+{
+    NUMA_NONE = 0,
+    NUMA_LOCAL = 1,
+    NUMA_INTERLEAVE = 2,
+};
+
+/// The number of threads of the native loops: the one set through
+/// set_num_threads, else the OpenMP default (OMP_NUM_THREADS or the CPUs
+/// available to the process) when built with OpenMP, else one per hardware
+/// thread.
+static unsigned int default_num_threads()
+{
+    const unsigned int n = g_num_threads.load();
+    if (n != 0)
+    {
+        return n;
+    }
+#ifdef _OPENMP
+    return static_cast<unsigned int>(std::max(1, omp_get_max_threads()));
+#else
+    return std::max(1u, std::thread::hardware_concurrency());
+#endif
+}
+
+#ifdef __linux__
+// Values of <numaif.h>, which is part of libnuma and not always installed
+constexpr int QUA_MPOL_INTERLEAVE = 3;
+
+/// Mask of the online NUMA nodes, parsed from sysfs ("0-1,3" style lists).
+static unsigned long online_numa_nodes()
+{
+    std::ifstream in("/sys/devices/system/node/online");
+    std::string list;
+    if (!(in >> list))
+    {
+        return 1ul;
+    }
+    unsigned long mask = 0;
+    std::size_t pos = 0;
+    while (pos < list.size())
+    {
+        std::size_t end = list.find(',', pos);
+        if (end == std::string::npos)
+        {
+            end = list.size();
+        }
+        const std::string range = list.substr(pos, end - pos);
+        const std::size_t dash = range.find('-');
+        const unsigned long first = std::stoul(range.substr(0, dash));
+        const unsigned long last = dash == std::string::npos ? first : std::stoul(range.substr(dash + 1));
+        for (unsigned long node = first; node <= last && node < 8 * sizeof(unsigned long); ++node)
+        {
+            mask |= 1ul << node;
+        }
+        pos = end + 1;
+    }
+    return mask != 0 ? mask : 1ul;
+}
+
+/// Pins the calling thread to the index-th CPU it is allowed to run on, so
+/// that consecutive workers spread over the cores (and the NUMA nodes).
+static void pin_current_thread(std::size_t index)
+{
+    cpu_set_t allowed;
+    if (sched_getaffinity(0, sizeof(allowed), &allowed) != 0 || CPU_COUNT(&allowed) == 0)
+    {
+        return;
+    }
+    std::size_t target = index % static_cast<std::size_t>(CPU_COUNT(&allowed));
+    for (int cpu = 0; cpu < CPU_SETSIZE; ++cpu)
+    {
+        if (CPU_ISSET(cpu, &allowed) && target-- == 0)
+        {
+            cpu_set_t single;
+            CPU_ZERO(&single);
+            CPU_SET(cpu, &single);
+            pthread_setaffinity_np(pthread_self(), sizeof(single), &single);
+            return;
+        }
+    }
+}
+#else
+static void pin_current_thread(std::size_t) {}
+#endif
+
+/// Sets the number of threads of the native loops, 0 for the default (see
+/// default_num_threads). The loops of this module always follow it; the
+/// OpenMP loops of the engine only do when the module is built with OpenMP
+/// (see CMakeLists.txt), as the OpenMP runtime is then shared with the
+/// engine. With 0, the OpenMP runtime is left alone, unless an earlier call
+/// changed it, in which case its initial thread count is restored.
+static void set_num_threads(unsigned int num_threads)
+{
+#ifdef _OPENMP
+    static std::mutex mutex;
+    static int initial = 0;
+    std::lock_guard<std::mutex> lock(mutex);
+    if (num_threads != 0)
+    {
+        if (initial == 0)
+        {
+            initial = omp_get_max_threads();
+        }
+        omp_set_num_threads(static_cast<int>(num_threads));
+    }
+    else if (initial != 0)
+    {
+        omp_set_num_threads(initial);
+        initial = 0;
+    }
+#endif
+    g_num_threads = num_threads;
+}
+
+/// Selects where the statevectors allocated by this module (see
+/// place_statevector) are placed: "none" leaves it to the kernel, "local"
+/// pins workers so every chunk is first touched by a thread of the node that
+/// processes it, "interleave" spreads pages round-robin over all nodes. The
+/// states the engine allocates itself are not affected.
+static void set_numa_policy(const std::string &policy)
+{
+    if (policy == "none")
+    {
+        g_numa_policy = NUMA_NONE;
+    }
+    else if (policy == "local")
+    {
+        g_numa_policy = NUMA_LOCAL;
+    }
+    else if (policy == "interleave")
+    {
+        g_numa_policy = NUMA_INTERLEAVE;
+    }
+    else
+    {
+        throw std::invalid_argument("numa must be 'interleave', 'local' or 'none'");
+    }
+}
+
+/// Runs worker(t) for t in [0, num_threads) on as many threads, pinned
+/// when a NUMA policy is set. The first exception raised by a worker is
+/// rethrown on the calling thread once every worker has joined.
+template <typename Worker>
+static void run_workers(unsigned int num_threads, Worker &&worker)
+{
+    const bool pin = g_numa_policy.load() != NUMA_NONE;
+    std::exception_ptr error;
+    std::mutex error_mutex;
+
+    std::vector<std::thread> workers;
+    workers.reserve(num_threads);
+    for (unsigned int t = 0; t < num_threads; ++t)
+    {
+        workers.emplace_back([&, t]()
+                             {
+            if (pin)
+            {
+                pin_current_thread(t);
+            }
+            try
+            {
+                worker(t);
+            }
+            catch (...)
+            {
+                std::lock_guard<std::mutex> lock(error_mutex);
+                if (!error)
+                {
+                    error = std::current_exception();
+                }
+            } });
+    }
+    for (auto &w : workers)
+    {
+        w.join();
+    }
+
+    if (error)
+    {
+        std::rethrow_exception(error);
+    }
+}
+
+/// Runs task(i) for i in [0, count) on a pool of num_threads workers
+/// (0 means one per hardware thread), handing indices out dynamically. The
+/// first exception raised by a task stops the pool and is rethrown.
+template <typename Task>
+static void parallel_for(std::size_t count, unsigned int num_threads, Task &&task)
+{
+    if (num_threads == 0)
+    {
+        num_threads = default_num_threads();
+    }
+    num_threads = static_cast<unsigned int>(std::min<std::size_t>(num_threads, count));
+
+    std::atomic<std::size_t> next{0};
+    run_workers(num_threads, [&](unsigned int)
+                {
+        for (std::size_t i = next++; i < count; i = next++)
+        {
+            try
+            {
+                task(i);
+            }
+            catch (...)
+            {
+                next = count;
+                throw;
+            }
+        } });
+}
+
+/// Splits [0, count) into num_threads contiguous ranges (0 means one per
+/// hardware thread) and runs task(first, last) for the t-th range on worker
+/// t, which is pinned to the t-th allowed CPU under a NUMA policy. The
+/// mapping is fixed, as with a static OpenMP schedule, so memory first
+/// touched by a worker is the memory the same worker processes later.
+template <typename Task>
+static void parallel_ranges(std::size_t count, unsigned int num_threads, Task &&task)
+{
+    if (num_threads == 0)
+    {
+        num_threads = default_num_threads();
+    }
+    num_threads = static_cast<unsigned int>(std::max<std::size_t>(1, std::min<std::size_t>(num_threads, count)));
+
+    run_workers(num_threads, [&](unsigned int t)
+                { task(count * t / num_threads, count * (t + 1) / num_threads); });
+}
+
+/// Builds the bitstrings of an amplitude request in a single native pass.
+/// Accepts a list of BitVector, a 2D (n, numqubits) array of 0/1 (uint8 or
+/// bool), or a 1D integer array of basis indices where bit j of an index
+/// gives the value of qubit j (at most 64 qubits).
+static std::vector<qua::from_proto::BitVector> to_bitvectors(const py::object &bitstrings, std::size_t numqubits)
+{
+    if (!py::isinstance<py::array>(bitstrings))
+    {
+        return bitstrings.cast<std::vector<qua::from_proto::BitVector>>();
+    }
+
+    py::array array = py::reinterpret_borrow<py::array>(bitstrings);
+    std::vector<qua::from_proto::BitVector> result;
+
+    if (array.ndim() == 2)
+    {
+        auto bits = py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast>::ensure(array);
+        auto view = bits.unchecked<2>();
+        if (static_cast<std::size_t>(view.shape(1)) != numqubits)
+        {
+            throw std::invalid_argument("bitstrings must have one column per qubit of the circuit");
+        }
+        result.reserve(view.shape(0));
+        for (py::ssize_t i = 0; i < view.shape(0); ++i)
+        {
+            qua::from_proto::BitVector &bv = result.emplace_back(numqubits);
+            for (std::size_t j = 0; j < numqubits; ++j)
+            {
+                if (view(i, j))
+                {
+                    bv[j] = true;
+                }
+            }
+        }
+        return result;
+    }
+
+    const char kind = array.dtype().kind();
+    if (array.ndim() == 1 && (kind == 'i' || kind == 'u'))
+    {
+        if (numqubits > 64)
+        {
+            throw std::invalid_argument("basis indices address at most 64 qubits, pass a 2D array of bits instead");
+        }
+        auto indices = py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast>::ensure(array);
+        auto view = indices.unchecked<1>();
+        result.reserve(view.shape(0));
+        for (py::ssize_t i = 0; i < view.shape(0); ++i)
+        {
+            qua::from_proto::BitVector &bv = result.emplace_back(numqubits);
+            for (std::size_t j = 0; j < numqubits; ++j)
+            {
+                if ((view(i) >> j) & 1u)
+                {
+                    bv[j] = true;
+                }
+            }
+        }
+        return result;
+    }
+
+    throw std::invalid_argument("bitstrings must be a 2D array of bits or a 1D array of integer indices");
+}
+
+/// Executes a circuit on the Device backend in precision T.
+/// Returns (QCSResults, statevector or None).
+template <typename T, typename Device = qua::CPU>
+static py::tuple execute_native(qua::from_proto::Circuit &circuit, int shots, int seed,
+                             const py::object &bitstrings_obj,
+                             bool return_statevector)
+{
+    std::vector<qua::from_proto::BitVector> bitstrings = to_bitvectors(bitstrings_obj, circuit.numqubits());
+
+    // Explicitly define the tuple type
+    std::tuple<qua::from_proto::QCSResults, std::vector<std::complex<T>>> full_result;
+    {
+        py::gil_scoped_release release;
+        full_result = qua::Execute_ext<T, Device>(circuit,
+                                                  static_cast<unsigned long>(shots),
+                                                  static_cast<unsigned long>(seed),
+                                                  bitstrings);
+    }
+
+    // The engine always returns the statevector; it is only converted to
+    // NumPy when requested, and released here otherwise.
+    if (!return_statevector)
+    {
+        return py::make_tuple(std::move(std::get<0>(full_result)), py::none());
+    }
+
+    // Hand the statevector over to NumPy instead of building a list of complex
+    return py::make_tuple(std::move(std::get<0>(full_result)),
+                          as_numpy_array(std::move(std::get<1>(full_result))));
+}
+
+/// Executes independent circuits on a pool of threads, without the GIL.
+template <typename T>
+static std::vector<qua::from_proto::QCSResults> execute_batch_cpu(
+    std::vector<qua::from_proto::Circuit> &circuits, unsigned long shots,
+    std::vector<unsigned long> &seeds, unsigned int num_threads)
+{
+    if (seeds.size() != circuits.size())
+    {
+        throw std::invalid_argument("circuits and seeds must have the same length");
+    }
+
+    std::vector<qua::from_proto::QCSResults> results(circuits.size());
+    {
+        py::gil_scoped_release release;
+        parallel_for(circuits.size(), num_threads, [&](std::size_t i)
+                     {
+            std::vector<qua::from_proto::BitVector> bitstrings;
+            results[i] = std::get<0>(qua::Execute_ext<T>(
+                circuits[i], shots, seeds[i], bitstrings)); });
+    }
+    return results;
+}
+
+/// Evolves a fresh zero state through a circuit in precision T.
+/// Returns (StateVector, amplitudes).
+template <typename T>
+static py::tuple evolve_cpu(qua::from_proto::Circuit &circuit, unsigned long seed, bool stop_before_measure)
+{
+    auto [state, amplitudes] = [&]
+    {
+        py::gil_scoped_release release;
+        return qua::Evolve<T>(circuit, seed, stop_before_measure);
+    }();
+    return py::make_tuple(std::move(state), as_numpy_array(std::move(amplitudes)));
+}
+
+/// Continues the evolution of an existing state through a circuit in precision T.
+/// Returns (StateVector, amplitudes).
+template <typename T>
+static py::tuple evolve_next_cpu(qua::StateVector<T> &sv, qua::from_proto::Circuit &circuit,
+                                 unsigned long seed, bool stop_before_measure)
+{
+    auto [state, amplitudes] = [&]
+    {
+        py::gil_scoped_release release;
+        return qua::Evolve_next<T>(sv, circuit, seed, stop_before_measure);
+    }();
+    return py::make_tuple(std::move(state), as_numpy_array(std::move(amplitudes)));
+}
+
+/// Moves the statevector of a Simulator back into the state it was built
+/// from when leaving scope, so that the state is never left moved-from, even
+/// when the simulation throws.
+template <typename T>
+class StateGuard
+{
+public:
+    StateGuard(qua::StateVector<T, qua::CPU> &state, qua::Simulator<T, qua::CPU> &simulator)
+        : state_(state), simulator_(simulator) {}
+
+    StateGuard(const StateGuard &) = delete;
+    StateGuard &operator=(const StateGuard &) = delete;
+
+    ~StateGuard() { state_ = std::move(simulator_.GetStateVector()); }
+
+private:
+    qua::StateVector<T, qua::CPU> &state_;
+    qua::Simulator<T, qua::CPU> &simulator_;
+};
+
+/// Continues the evolution of sv through a circuit in place. Unlike
+/// Evolve_next, the amplitudes are not copied out of the state.
+template <typename T>
+static void simulate_inplace_cpu(qua::StateVector<T, qua::CPU> &sv, qua::from_proto::Circuit &circuit, unsigned long seed)
+{
+    py::gil_scoped_release release;
+    qua::Simulator<T, qua::CPU> simulator(circuit, std::move(sv), seed);
+    StateGuard<T> guard(sv, simulator);
+    simulator.SimulateCircuit();
+}
+
+/// Runs nshots independent trajectories through a sequence of circuits and
+/// returns the final classical state of each. Shots are split across
+/// num_threads workers (0 means one per hardware thread), each reusing a
+/// single statevector reset to |0...0> between its shots. Every circuit runs
+/// in place on that statevector, as in simulate_inplace_cpu, so no amplitudes
+/// are allocated or copied per shot.
+template <typename T>
+static std::vector<qua::from_proto::BitVector> evolve_shots_cpu(
+    std::vector<qua::from_proto::Circuit> &circuits, std::size_t nshots,
+    unsigned long seed, unsigned int num_threads)
+{
+    if (circuits.empty())
+    {
+        throw std::invalid_argument("at least one circuit is required");
+    }
+
+    std::size_t numqubits = 0;
+    for (auto &circuit : circuits)
+    {
+        numqubits = std::max<std::size_t>(numqubits, circuit.numqubits());
+    }
+
+    if (num_threads == 0)
+    {
+        num_threads = default_num_threads();
+    }
+    const std::size_t nworkers = std::max<std::size_t>(1, std::min<std::size_t>(num_threads, nshots));
+
+    std::vector<qua::from_proto::BitVector> cstates(nshots, qua::from_proto::BitVector(std::size_t{0}));
+    {
+        py::gil_scoped_release release;
+        parallel_for(nworkers, num_threads, [&](std::size_t worker)
+                     {
+            qua::StateVector<T, qua::CPU> sv(numqubits);
+            for (std::size_t shot = worker; shot < nshots; shot += nworkers)
+            {
+                sv.SetInitialState();
+                for (std::size_t k = 0; k < circuits.size(); ++k)
+                {
+                    // Distinct random stream for every shot and circuit
+                    const unsigned long shot_seed = seed + static_cast<unsigned long>(shot * circuits.size() + k);
+                    qua::Simulator<T, qua::CPU> simulator(circuits[k], std::move(sv), shot_seed);
+                    StateGuard<T> guard(sv, simulator);
+                    simulator.SimulateCircuit();
+                }
+                // The register is carried across the circuits, as by evolve, so
+                // it holds the bits written by every circuit of the sequence.
+                // Without classical bits there is none, the shot keeps an empty state
+                const auto &registers = sv.GetCStates();
+                if (!registers.empty())
+                {
+                    cstates[shot] = registers.front();
+                }
+            } });
+    }
+    return cstates;
+}
+
+/// Copies gate matrices in precision T, checking that every gate is a 1- or
+/// 2-qubit matrix matching its targets, all below numqubits.
+template <typename T>
+static std::vector<std::vector<std::complex<T>>> gate_matrices(
+    const std::vector<py::array_t<std::complex<double>, py::array::c_style | py::array::forcecast>> &matrices,
+    const std::vector<std::vector<std::size_t>> &targets, std::size_t numqubits)
+{
+    if (matrices.size() != targets.size())
+    {
+        throw std::invalid_argument("matrices and targets must have the same length");
+    }
+
+    std::vector<std::vector<std::complex<T>>> gates(matrices.size());
+    for (std::size_t g = 0; g < matrices.size(); ++g)
+    {
+        const std::size_t dim = std::size_t{1} << targets[g].size();
+        if (targets[g].empty() || targets[g].size() > 2 ||
+            (targets[g].size() == 2 && targets[g][0] == targets[g][1]) ||
+            matrices[g].ndim() != 2 || static_cast<std::size_t>(matrices[g].shape(0)) != dim ||
+            static_cast<std::size_t>(matrices[g].shape(1)) != dim)
+        {
+            throw std::invalid_argument("gates must be 1- or 2-qubit matrices matching their targets");
+        }
+        for (std::size_t q : targets[g])
+        {
+            if (q >= numqubits)
+            {
+                throw std::invalid_argument("gate target outside of the local block qubits");
+            }
+        }
+        const std::complex<double> *m = matrices[g].data();
+        gates[g].assign(m, m + dim * dim);
+    }
+    return gates;
+}
+
+/// Inserts a zero bit at position q of index.
+static inline std::size_t insert_zero_bit(std::size_t index, std::size_t q)
+{
+    const std::size_t low = (std::size_t{1} << q) - 1;
+    return ((index & ~low) << 1) | (index & low);
+}
+
+/// Applies a 1- or 2-qubit gate m to the amplitudes of psi whose index,
+/// with the target bits removed, lies in [first, last). The first target of
+/// a gate is the most significant index of its matrix, as in mimiqcircuits.
+template <typename T>
+static void apply_gate_range(std::complex<T> *psi, const std::complex<T> *m,
+                             const std::vector<std::size_t> &targets, std::size_t first, std::size_t last)
+{
+    if (targets.size() == 1)
+    {
+        const std::size_t mask = std::size_t{1} << targets[0];
+        for (std::size_t j = first; j < last; ++j)
+        {
+            const std::size_t i = insert_zero_bit(j, targets[0]);
+            const std::complex<T> a0 = psi[i], a1 = psi[i | mask];
+            psi[i] = m[0] * a0 + m[1] * a1;
+            psi[i | mask] = m[2] * a0 + m[3] * a1;
+        }
+        return;
+    }
+
+    const std::size_t hi = std::size_t{1} << targets[0];
+    const std::size_t lo = std::size_t{1} << targets[1];
+    const std::size_t offsets[4] = {0, lo, hi, hi | lo};
+    const std::size_t low_target = std::min(targets[0], targets[1]);
+    const std::size_t high_target = std::max(targets[0], targets[1]);
+    for (std::size_t j = first; j < last; ++j)
+    {
+        const std::size_t i = insert_zero_bit(insert_zero_bit(j, low_target), high_target);
+        std::complex<T> a[4];
+        for (int k = 0; k < 4; ++k)
+        {
+            a[k] = psi[i | offsets[k]];
+        }
+        for (int r = 0; r < 4; ++r)
+        {
+            psi[i | offsets[r]] = m[4 * r] * a[0] + m[4 * r + 1] * a[1] +
+                                  m[4 * r + 2] * a[2] + m[4 * r + 3] * a[3];
+        }
+    }
+}
+
+/// Applies a sequence of 1- and 2-qubit gates acting only on the
+/// block_qubits low-order qubits, one chunk of 2^block_qubits amplitudes at
+/// a time: the chunk stays cache-resident while every gate is applied to it,
+/// so the state is streamed through memory once for the whole sequence
+/// instead of once per gate.
+template <typename T>
+static void apply_local_gates(qua::StateVector<T, qua::CPU> &sv,
+                              const std::vector<py::array_t<std::complex<double>, py::array::c_style | py::array::forcecast>> &matrices,
+                              const std::vector<std::vector<std::size_t>> &targets,
+                              std::size_t block_qubits, unsigned int num_threads)
+{
+    const std::size_t numqubits = sv.NumQubits();
+    block_qubits = std::min(block_qubits, numqubits);
+
+    // Copy the matrices in precision T before releasing the GIL
+    const auto gates = gate_matrices<T>(matrices, targets, block_qubits);
+
+    std::complex<T> *data = state_data(sv);
+    const std::size_t chunk = std::size_t{1} << block_qubits;
+    const std::size_t nchunks = std::size_t{1} << (numqubits - block_qubits);
+
+    py::gil_scoped_release release;
+    parallel_for(nchunks, num_threads, [&](std::size_t c)
+                 {
+        std::complex<T> *psi = data + c * chunk;
+        for (std::size_t g = 0; g < gates.size(); ++g)
+        {
+            apply_gate_range(psi, gates[g].data(), targets[g], 0, chunk >> targets[g].size());
+        } });
+}
+
+/// Applies a sequence of 1- and 2-qubit gates, in order, in place to an
+/// array of amplitudes, each gate being split over the workers. The
+/// out-of-core storage runs it on the chunk of the state it holds in memory,
+/// whose size is not bound by the cache, so gates are not blocked.
+template <typename T>
+static void apply_gates(py::array_t<std::complex<T>, py::array::c_style> amplitudes,
+                        const std::vector<py::array_t<std::complex<double>, py::array::c_style | py::array::forcecast>> &matrices,
+                        const std::vector<std::vector<std::size_t>> &targets, unsigned int num_threads)
+{
+    const std::size_t size = static_cast<std::size_t>(amplitudes.size());
+    if (size == 0 || (size & (size - 1)) != 0)
+    {
+        throw std::invalid_argument("the number of amplitudes must be a power of 2");
+    }
+    std::size_t numqubits = 0;
+    while ((std::size_t{1} << numqubits) < size)
+    {
+        ++numqubits;
+    }
+
+    const auto gates = gate_matrices<T>(matrices, targets, numqubits);
+    std::complex<T> *psi = amplitudes.mutable_data();
+
+    py::gil_scoped_release release;
+    for (std::size_t g = 0; g < gates.size(); ++g)
+    {
+        // Ranges of 2^14 index groups balance the workers without contention
+        const std::size_t count = size >> targets[g].size();
+        const std::size_t range = std::min<std::size_t>(count, std::size_t{1} << 14);
+        parallel_for(count / range, num_threads, [&](std::size_t r)
+                     { apply_gate_range(psi, gates[g].data(), targets[g], r * range, (r + 1) * range); });
+    }
+}
+
+/// Places the pages of a statevector according to the NUMA policy and
+/// resets it to |0...0>. The pages are first released, then touched again in
+/// parallel by pinned workers, worker t zeroing the t-th contiguous range of
+/// the state: the range a static schedule over as many threads gives it,
+/// which is how the engine's OpenMP loops split the state. Under
+/// "interleave" the range is bound round-robin to every node first.
+template <typename T>
+static void place_statevector(qua::StateVector<T, qua::CPU> &sv, unsigned int num_threads)
+{
+    if constexpr (!state_data_available<T>)
+    {
+        // Without access to the pages, placement is left to the OS
+        sv.SetInitialState();
+        return;
+    }
+
+    const int policy = g_numa_policy.load();
+    std::complex<T> *data = state_data(sv);
+    const std::size_t size = std::size_t{1} << sv.NumQubits();
+
+    py::gil_scoped_release release;
+#ifdef __linux__
+    if (policy != NUMA_NONE)
+    {
+        const std::uintptr_t page = static_cast<std::uintptr_t>(sysconf(_SC_PAGESIZE));
+        const std::uintptr_t begin = (reinterpret_cast<std::uintptr_t>(data) + page - 1) & ~(page - 1);
+        const std::uintptr_t end = reinterpret_cast<std::uintptr_t>(data + size) & ~(page - 1);
+        if (end > begin)
+        {
+            void *range = reinterpret_cast<void *>(begin);
+            madvise(range, end - begin, MADV_DONTNEED);
+            if (policy == NUMA_INTERLEAVE)
+            {
+                const unsigned long nodes = online_numa_nodes();
+                syscall(SYS_mbind, range, end - begin, QUA_MPOL_INTERLEAVE, &nodes, 8 * sizeof(nodes), 0);
+            }
+        }
+    }
+#endif
+    parallel_ranges(size, num_threads, [&](std::size_t first, std::size_t last)
+                    {
+        std::fill(data + first, data + last, std::complex<T>(0));
+        if (first == 0)
+        {
+            data[0] = std::complex<T>(1);
+        } });
+}
+
+/// Builds a CPU statevector from amplitudes held elsewhere, typically a
+/// memory-mapped checkpoint, and its classical registers. The amplitudes are
+/// copied in parallel chunks, so a mapped file is read with several streams.
+template <typename T>
+static qua::StateVector<T, qua::CPU> statevector_from_buffer(
+    const py::array_t<std::complex<T>, py::array::c_style> &amplitudes,
+    std::vector<qua::from_proto::BitVector> cstates, unsigned int num_threads)
+{
+    const std::size_t size = static_cast<std::size_t>(amplitudes.size());
+    if (size == 0 || (size & (size - 1)) != 0)
+    {
+        throw std::invalid_argument("the number of amplitudes must be a power of 2");
+    }
+    std::size_t numqubits = 0;
+    while ((std::size_t{1} << numqubits) < size)
+    {
+        ++numqubits;
+    }
+
+    qua::StateVector<T, qua::CPU> sv(numqubits);
+    const std::complex<T> *source = amplitudes.data();
+    std::complex<T> *data = state_data(sv);
+    {
+        py::gil_scoped_release release;
+        const std::size_t chunk = std::size_t{1} << std::min<std::size_t>(numqubits, 20);
+        parallel_for(size / chunk, num_threads, [&](std::size_t c)
+                     { std::copy(source + c * chunk, source + (c + 1) * chunk, data + c * chunk); });
+    }
+    // GetCStates exposes the registers by reference
+    sv.GetCStates() = std::move(cstates);
+    return sv;
+}
+
+/// Keeps one preallocated CPU statevector alive across executions.
+/// Each Execute resets it to |0...0> and hands it to a Simulator, then takes
+/// it back, so no 2^n buffer is allocated after construction.
+template <typename T>
+class SimulatorSession
+{
+public:
+    explicit SimulatorSession(std::size_t numqubits)
+        : numqubits_(numqubits), state_(numqubits) {}
+
+    std::size_t NumQubits() const { return numqubits_; }
+
+    qua::StateVector<T, qua::CPU> &State() { return state_; }
+
+    qua::from_proto::QCSResults Execute(qua::from_proto::Circuit &circuit, unsigned long shots, unsigned long seed)
+    {
+        if (circuit.numqubits() > numqubits_)
+        {
+            throw std::invalid_argument("circuit has more qubits than the session statevector");
+        }
+
+        py::gil_scoped_release release;
+        state_.SetInitialState();
+        qua::Simulator<T, qua::CPU> simulator(circuit, std::move(state_), seed);
+        StateGuard<T> guard(state_, simulator);
+        simulator.SimulateCircuit();
+        simulator.Sampling(shots);
+        return simulator.GetResult();
+    }
+
+private:
+    std::size_t numqubits_;
+    qua::StateVector<T, qua::CPU> state_;
+};
+
+template <typename T>
+static void bind_simulator_session(py::module_ &m, const char *name)
+{
+    py::class_<SimulatorSession<T>>(m, name)
+        .def(py::init<std::size_t>(), py::arg("numqubits"))
+        .def("numqubits", &SimulatorSession<T>::NumQubits)
+        .def("execute", &SimulatorSession<T>::Execute, py::arg("circuit"), py::arg("shots"), py::arg("seed"))
+        .def("statevector", &SimulatorSession<T>::State, py::return_value_policy::reference_internal,
+             "The session statevector, valid as long as the session is alive");
+}
+
 PYBIND11_MODULE(_core, m)
 {
     m.doc() = "pybind11 wrapper for Quantanium";
@@ -106,6 +1037,12 @@ PYBIND11_MODULE(_core, m)
         .def(py::init<
              const std::string &>())
         .def("print", &qua::from_proto::BitVector::Print)
+        .def("__len__", &qua::from_proto::BitVector::Size)
+        .def("to_numpy", [](const qua::from_proto::BitVector &bv, int word_bits)
+             {
+            py::array packed = pack_bitvectors_as({bv}, word_bits);
+            return packed.attr("reshape")(-1); }, py::arg("word_bits") = 8,
+             "Returns the bits packed into uint8 (word_bits=8) or uint64 (word_bits=64) words")
         .def("__str__", [](const qua::from_proto::BitVector &bv)
              {
             std::stringstream ss;
@@ -132,17 +1069,24 @@ PYBIND11_MODULE(_core, m)
         .def("imag", [](const std::complex<double> &c)
              { return c.imag(); });
     // Wrap CuStateVec
-    py::class_<qua::StateVector<float, quantanium::CPU>>(m, "StateVectorF32_CPU")
+    py::class_<qua::StateVector<float, quantanium::CPU>>(m, "StateVectorF32_CPU", py::buffer_protocol())
         .def(py::init<>())
         .def(py::init<std::size_t>())
+        .def_buffer(&statevector_buffer<float>)
         .def("numqubits", &qua::StateVector<float, quantanium::CPU>::NumQubits)
-        .def("zerostate", &qua::StateVector<float, quantanium::CPU>::SetInitialState);
+        .def("zerostate", &qua::StateVector<float, quantanium::CPU>::SetInitialState)
+        .def("get_cstates", &qua::StateVector<float, quantanium::CPU>::GetCStates);
 
-    py::class_<qua::StateVector<double, quantanium::CPU>>(m, "StateVectorF64_CPU")
+    py::class_<qua::StateVector<double, quantanium::CPU>>(m, "StateVectorF64_CPU", py::buffer_protocol())
         .def(py::init<>())
         .def(py::init<std::size_t>())
+        .def_buffer(&statevector_buffer<double>)
         .def("numqubits", &qua::StateVector<double, quantanium::CPU>::NumQubits)
-        .def("zerostate", &qua::StateVector<double, quantanium::CPU>::SetInitialState);
+        .def("zerostate", &qua::StateVector<double, quantanium::CPU>::SetInitialState)
+        .def("get_cstates", &qua::StateVector<double, quantanium::CPU>::GetCStates);
+
+    // NumPy turns a failing buffer protocol into an object array, check this first
+    m.attr("HAS_STATEVECTOR_VIEWS") = py::bool_(state_data_available<float> && state_data_available<double>);
 
     py::class_<qua::Simulator<double, qua::CPU>>(m, "SimulatorDoubleCPU")
         .def(py::init<qua::from_proto::Circuit>())
@@ -155,6 +1099,9 @@ PYBIND11_MODULE(_core, m)
         .def("get_result", &qua::Simulator<double, qua::CPU>::GetResult)
         .def("sampling", &qua::Simulator<double, qua::CPU>::Sampling)
         .def("get_sv", &qua::Simulator<double, qua::CPU>::GetStateVector);
+    bind_simulator_session<double>(m, "SimulatorSessionDoubleCPU");
+    bind_simulator_session<float>(m, "SimulatorSessionFloatCPU");
+
     /*    #ifdef QUANTANIUM_USE_CUDA
         py::class_<qua::Simulator<double, qua::GPU>>(m, "SimulatorDoubleGPU")
             .def(py::init<qua::from_proto::Circuit>())
@@ -182,30 +1129,41 @@ PYBIND11_MODULE(_core, m)
     py::class_<qua::ProtoParser>(m, "ProtoParser")
         .def(py::init<>())
         .def("save_proto", &qua::ProtoParser::SaveProto)
-        .def("load_proto", &qua::ProtoParser::LoadProto);
+        .def("load_proto", &qua::ProtoParser::LoadProto, py::call_guard<py::gil_scoped_release>())
+        .def("load_proto_bytes", [](qua::ProtoParser &self, py::buffer data)
+             {
+            // Accepts bytes, bytearray or memoryview; the engine parses from a file
+            py::buffer_info info = data.request();
+            TemporaryFile file;
+            file.write(static_cast<const char *>(info.ptr),
+                       static_cast<std::size_t>(info.size * info.itemsize));
+            py::gil_scoped_release release;
+            return self.LoadProto(file.path()); }, py::arg("data"));
 
     py::class_<qua::ProtoResult>(m, "ProtoResult")
         .def(py::init<>())
         .def("save_proto", &qua::ProtoResult::SaveProto)
-        .def("load_proto", &qua::ProtoResult::LoadProto);
-
-    m.def("execute_double_cpu",
-          [](qua::from_proto::Circuit &circuit, int shots, int seed,
-             std::vector<qua::from_proto::BitVector> &bitstrings)
-          {
-              // Explicitly define the tuple type
-              std::tuple<quantanium::from_proto::QCSResults, std::vector<std::complex<double>>> full_result =
-                  qua::Execute_ext<double>(circuit,
-                                           static_cast<unsigned long>(shots),
-                                           static_cast<unsigned long>(seed),
-                                           bitstrings);
-
-              // Extract values correctly
-              quantanium::from_proto::QCSResults result = std::get<0>(full_result);
-              std::vector<std::complex<double>> sv = std::get<1>(full_result);
-
-              return py::make_tuple(result, sv);
-          });
+        .def("load_proto", &qua::ProtoResult::LoadProto)
+        .def("to_bytes", [](qua::ProtoResult &self, const qua::from_proto::QCSResults &results)
+             {
+            TemporaryFile file;
+            self.SaveProto(file.path(), results);
+            return py::bytes(file.read()); }, py::arg("results"));
+
+    m.def("execute_double_cpu", &execute_native<double>,
+          py::arg("circuit"), py::arg("shots"), py::arg("seed"), py::arg("bitstrings"),
+          py::arg("return_statevector") = true);
+
+    m.def("execute_float_cpu", &execute_native<float>,
+          py::arg("circuit"), py::arg("shots"), py::arg("seed"), py::arg("bitstrings"),
+          py::arg("return_statevector") = true);
+
+    m.def("execute_batch_double_cpu", &execute_batch_cpu<double>,
+          py::arg("circuits"), py::arg("shots"), py::arg("seeds"), py::arg("num_threads") = 0);
+
+    m.def("execute_batch_float_cpu", &execute_batch_cpu<float>,
+          py::arg("circuits"), py::arg("shots"), py::arg("seeds"), py::arg("num_threads") = 0);
+
     // m.def("execute_double_cpu",
     // [](qua::from_proto::Circuit& circuit,
     //     unsigned long              shots,
@@ -221,18 +1179,71 @@ PYBIND11_MODULE(_core, m)
     // );
 
 #if QUANTANIUM_USE_CUDA
-    m.def("execute_double_gpu", [](qua::from_proto::Circuit &circuit, unsigned long shots, unsigned long seed, std::vector<qua::from_proto::BitVector> &bitstrings)
-          {
-            auto result = qua::Execute_ext<double, qua::GPU>(circuit, shots, seed, bitstrings);
-            return result; }, py::arg("circuit"), py::arg("shots"), py::arg("seed"), py::arg("bitstrings"));
+    m.def("execute_double_gpu", &execute_native<double, qua::GPU>,
+          py::arg("circuit"), py::arg("shots"), py::arg("seed"), py::arg("bitstrings"),
+          py::arg("return_statevector") = true);
 #endif
-    m.def("evolve", [](qua::from_proto::Circuit &circuit, unsigned long seed, bool stop_before_measure)
-          { return qua::Evolve<double>(circuit, seed, stop_before_measure); }, py::arg("circuit"), py::arg("seed"), py::arg("stop_before_measure") = false);
+    m.def("evolve", &evolve_cpu<double>, py::arg("circuit"), py::arg("seed"), py::arg("stop_before_measure") = false);
+
+    m.def("evolve_float", &evolve_cpu<float>, py::arg("circuit"), py::arg("seed"), py::arg("stop_before_measure") = false);
+
+    m.def("evolve_next", &evolve_next_cpu<double>, py::arg("sv"), py::arg("circuit"), py::arg("seed"), py::arg("stop_before_measure") = false);
+
+    m.def("evolve_next_float", &evolve_next_cpu<float>, py::arg("sv"), py::arg("circuit"), py::arg("seed"), py::arg("stop_before_measure") = false);
+
+    // Classical states come back packed, one uint8 row per shot
+    m.def("evolve_shots", [](std::vector<qua::from_proto::Circuit> &circuits, std::size_t nshots, unsigned long seed, unsigned int num_threads)
+          { return pack_bitvectors<std::uint8_t>(evolve_shots_cpu<double>(circuits, nshots, seed, num_threads)); }, py::arg("circuits"), py::arg("nshots"), py::arg("seed"), py::arg("num_threads") = 0);
+
+    m.def("evolve_shots_float", [](std::vector<qua::from_proto::Circuit> &circuits, std::size_t nshots, unsigned long seed, unsigned int num_threads)
+          { return pack_bitvectors<std::uint8_t>(evolve_shots_cpu<float>(circuits, nshots, seed, num_threads)); }, py::arg("circuits"), py::arg("nshots"), py::arg("seed"), py::arg("num_threads") = 0);
+
+    m.def("simulate_inplace", &simulate_inplace_cpu<double>, py::arg("sv"), py::arg("circuit"), py::arg("seed"));
+
+    m.def("simulate_inplace_float", &simulate_inplace_cpu<float>, py::arg("sv"), py::arg("circuit"), py::arg("seed"));
+
+    m.def("apply_local_gates", &apply_local_gates<double>,
+          py::arg("sv"), py::arg("matrices"), py::arg("targets"), py::arg("block_qubits"), py::arg("num_threads") = 0,
+          "Applies gates on the block_qubits low-order qubits chunk by chunk, in place");
+
+    m.def("apply_local_gates_float", &apply_local_gates<float>,
+          py::arg("sv"), py::arg("matrices"), py::arg("targets"), py::arg("block_qubits"), py::arg("num_threads") = 0,
+          "Applies gates on the block_qubits low-order qubits chunk by chunk, in place");
+
+    m.def("apply_gates", &apply_gates<double>,
+          py::arg("amplitudes").noconvert(), py::arg("matrices"), py::arg("targets"), py::arg("num_threads") = 0,
+          "Applies gates in order to a complex128 array of amplitudes, in place");
+
+    m.def("apply_gates_float", &apply_gates<float>,
+          py::arg("amplitudes").noconvert(), py::arg("matrices"), py::arg("targets"), py::arg("num_threads") = 0,
+          "Applies gates in order to a complex64 array of amplitudes, in place");
+
+    m.def("set_num_threads", &set_num_threads, py::arg("num_threads"),
+          "Sets the number of threads of the native loops, 0 leaves it to OpenMP or uses every hardware thread");
+
+    m.def("set_numa_policy", &set_numa_policy, py::arg("policy"),
+          "Selects the NUMA placement of statevectors: 'interleave', 'local' or 'none'");
+
+    m.def("place_statevector", &place_statevector<double>, py::arg("sv"), py::arg("num_threads") = 0,
+          "Places the pages of the statevector following the NUMA policy and resets it to |0...0>");
+
+    m.def("place_statevector", &place_statevector<float>, py::arg("sv"), py::arg("num_threads") = 0);
+
+    m.def("statevector_from_buffer", &statevector_from_buffer<double>,
+          py::arg("amplitudes"), py::arg("cstates"), py::arg("num_threads") = 0,
+          "Builds a StateVectorF64_CPU from a complex128 array and its classical registers");
+
+    m.def("statevector_from_buffer_float", &statevector_from_buffer<float>,
+          py::arg("amplitudes"), py::arg("cstates"), py::arg("num_threads") = 0,
+          "Builds a StateVectorF32_CPU from a complex64 array and its classical registers");
+
+    m.def("to_bitvectors", &to_bitvectors, py::arg("bitstrings"), py::arg("numqubits"),
+          "Converts an array of bits or of basis indices into a list of BitVector");
 
-    m.def("evolve_next", [](qua::StateVector<double> &sv, qua::from_proto::Circuit &circuit, unsigned long seed, bool stop_before_measure)
-          { return qua::Evolve_next<double>(sv, circuit, seed, stop_before_measure); }, py::arg("sv"), py::arg("circuit"), py::arg("seed"), py::arg("stop_before_measure") = false);
+    m.def("pack_bitvectors", &pack_bitvectors_as, py::arg("bitvectors"), py::arg("word_bits") = 8,
+          "Packs a list of BitVector into a (len(bitvectors), words) uint8 or uint64 array");
 
-    m.def("load_open_qasm", &qua::LoadOpenQASM);
+    m.def("load_open_qasm", &qua::LoadOpenQASM, py::call_guard<py::gil_scoped_release>());
 
     py::class_<qua::BaseOperationStrategy<double, 1>>(
         m, "BaseOperationStrategyDouble")
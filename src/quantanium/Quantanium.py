@@ -3,12 +3,23 @@
 # Unauthorized copying of this file, via any medium is strictly prohibited.
 # Proprietary and confidential.
 #
+from __future__ import annotations
+
+import io
 import os
 import time
 import tempfile
 import platform
 import ctypes
+import functools
+import numbers
+import threading
+from collections import Counter
+
+from .cache import LRUCache, ResultCache
+
 
+@functools.lru_cache(maxsize=None)
 def _has_cuda_runtime():
     try:
         ctypes.CDLL("libcuda.so")
@@ -16,121 +27,497 @@ def _has_cuda_runtime():
     except OSError:
         return False
 
-HAS_CUDA = _has_cuda_runtime()
 
-if platform.system() == "Windows":
-    package_dir = os.path.dirname(__file__)  
-    dll_dir = os.path.abspath(
-        os.path.join(package_dir, os.pardir, "quantanium.libs")
+# Names bound in this module by `_load_engine`
+_ENGINE_NAMES = frozenset({
+    "Circuit", "ProtoParser", "ProtoResult", "BitVector", "QuantaniumQCSResults",
+    "QuantaniumBitVector", "evolve", "evolve_next", "evolve_float", "evolve_next_float",
+    "evolve_shots", "evolve_shots_float", "load_open_qasm", "pack_bitvectors",
+    "to_bitvectors", "LazyExpr", "LazyArg", "MimiqCircuit", "QCSResults", "mc", "np", "se",
+    "CompiledCircuit", "Session", "FinalState", "StateSampler", "sampling_plan",
+    "fuse_gates", "fuse_diagonals", "count_sweeps", "locality", "split_blocks", "LocalBlock",
+    "read_state", "write_state", "outofcore", "QUANTANIUM_SUPPORTED_OPERATIONS",
+})
+
+
+def __getattr__(name):
+    # HAS_CUDA is probed on first access instead of at import time
+    if name == "HAS_CUDA":
+        return _has_cuda_runtime()
+    # The engine names resolve from outside the module before any Quantanium
+    # instance exists
+    if name in _ENGINE_NAMES:
+        _load_engine()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_ENGINE_LOCK = threading.Lock()
+_ENGINE_LOADED = False
+
+
+def _load_engine():
+    """
+    Imports the native engine, mimiqcircuits and NumPy on first use.
+
+    Keeps `import quantanium` cheap for short-lived processes: the heavy
+    imports happen when the first Quantanium instance is constructed, or when
+    one of the engine names of the module is first accessed.
+    """
+    global _ENGINE_LOADED
+
+    if _ENGINE_LOADED:
+        return
+
+    with _ENGINE_LOCK:
+        if _ENGINE_LOADED:
+            return
+        globals().update(_import_engine())
+        _ENGINE_LOADED = True
+
+
+def _import_engine():
+    """
+    Returns:
+        dict: The engine names (see `_ENGINE_NAMES`) and their values.
+    """
+    if platform.system() == "Windows":
+        package_dir = os.path.dirname(__file__)
+        dll_dir = os.path.abspath(
+            os.path.join(package_dir, os.pardir, "quantanium.libs")
+        )
+        if not os.path.isdir(dll_dir):
+            raise FileNotFoundError(f"quantanium.libs not found at {dll_dir!r}")
+        os.add_dll_directory(dll_dir)
+    from ._core import (
+        Circuit,
+        ProtoParser,
+        ProtoResult,
+        BitVector,
+        evolve,
+        evolve_next,
+        evolve_float,
+        evolve_next_float,
+        evolve_shots,
+        evolve_shots_float,
+        load_open_qasm,
+        pack_bitvectors,
+        to_bitvectors,
     )
-    if not os.path.isdir(dll_dir):
-        raise FileNotFoundError(f"quantanium.libs not found at {dll_dir!r}")
-    os.add_dll_directory(dll_dir)
-from ._core import (
-    Circuit,
-    ProtoParser,
-    ProtoResult,
-    BitVector,
-    evolve,
-    evolve_next,
-    load_open_qasm,
-)
-from ._core import QCSResults as QuantaniumQCSResults
-from ._core import BitVector as QuantaniumBitVector
-from mimiqcircuits.lazy import LazyExpr, LazyArg
-from mimiqcircuits import Circuit as MimiqCircuit, QCSResults
-import mimiqcircuits as mc
-
-QUANTANIUM_SUPPORTED_OPERATIONS = {
-    mc.GateID,
-    mc.GateH,
-    mc.GateX,
-    mc.GateY,
-    mc.GateZ,
-    mc.GateT,
-    mc.GateTDG,
-    mc.GateS,
-    mc.GateSDG,
-    mc.GateP,
-    mc.GateRX,
-    mc.GateRY,
-    mc.GateRZ,
-    mc.GateU1,
-    mc.GateU2,
-    mc.GateU3,
-    mc.GateU,
-    mc.GateSX,
-    mc.GateCSX,
-    mc.GateSWAP,
-    mc.GateXXplusYY,
-    mc.GateCX,
-    mc.GateCY,
-    mc.GateCZ,
-    mc.GateCP,
-    mc.GateCS,
-    mc.GateCH,
-    mc.GateCU,
-    mc.GateCRX,
-    mc.GateCRY,
-    mc.GateCRZ,
-    mc.GateRNZ,
-    mc.Barrier,
-    mc.Block,
-    mc.Repeat,
-    mc.Measure,
-    mc.Reset,
-    mc.IfStatement,
-    mc.PauliString,
-    mc.RPauli,
-    mc.Amplitude,
-    mc.PauliNoise,
-    mc.PauliX,
-    mc.PauliY,
-    mc.PauliZ,
-    mc.ProjectiveNoiseX,
-    mc.ProjectiveNoiseY,
-    mc.ProjectiveNoiseZ,
-    mc.PhaseAmplitudeDamping,
-    mc.AmplitudeDamping,
-    mc.GeneralizedAmplitudeDamping,
-    mc.MixedUnitary,
-    mc.Depolarizing,
-    mc.ThermalNoise,
-    mc.Kraus,
-    mc.GateCustom,
-    mc.GateDecl,
-    mc.GateCall,
-    mc.HamiltonianTerm,
-    mc.Hamiltonian,
-    mc.Detector,
-    mc.ObservableInclude,
-    mc.Add,
-    mc.Multiply,
-    mc.Pow,
-    mc.Not,
-    mc.Tick,
-    mc.ShiftCoordinates,
-    mc.QubitCoordinates,
-    mc.MeasureReset,
-    mc.GateHXY,
-    mc.GateHYZ
-
-}
+    from ._core import QCSResults as QuantaniumQCSResults
+    from ._core import BitVector as QuantaniumBitVector
+    from .compiled import CompiledCircuit
+    from .session import Session
+    from .sampling import FinalState, StateSampler, sampling_plan
+    from .fusion import fuse_gates, fuse_diagonals, count_sweeps
+    from . import locality
+    from .blocking import split_blocks, LocalBlock
+    from .checkpoint import read_state, write_state
+    from . import outofcore
+    from mimiqcircuits.lazy import LazyExpr, LazyArg
+    from mimiqcircuits import Circuit as MimiqCircuit, QCSResults
+    import mimiqcircuits as mc
+    import numpy as np
+    import symengine as se
+
+    QUANTANIUM_SUPPORTED_OPERATIONS = {
+        mc.GateID,
+        mc.GateH,
+        mc.GateX,
+        mc.GateY,
+        mc.GateZ,
+        mc.GateT,
+        mc.GateTDG,
+        mc.GateS,
+        mc.GateSDG,
+        mc.GateP,
+        mc.GateRX,
+        mc.GateRY,
+        mc.GateRZ,
+        mc.GateU1,
+        mc.GateU2,
+        mc.GateU3,
+        mc.GateU,
+        mc.GateSX,
+        mc.GateCSX,
+        mc.GateSWAP,
+        mc.GateXXplusYY,
+        mc.GateCX,
+        mc.GateCY,
+        mc.GateCZ,
+        mc.GateCP,
+        mc.GateCS,
+        mc.GateCH,
+        mc.GateCU,
+        mc.GateCRX,
+        mc.GateCRY,
+        mc.GateCRZ,
+        mc.GateRNZ,
+        mc.Barrier,
+        mc.Block,
+        mc.Repeat,
+        mc.Measure,
+        mc.Reset,
+        mc.IfStatement,
+        mc.PauliString,
+        mc.RPauli,
+        mc.Amplitude,
+        mc.PauliNoise,
+        mc.PauliX,
+        mc.PauliY,
+        mc.PauliZ,
+        mc.ProjectiveNoiseX,
+        mc.ProjectiveNoiseY,
+        mc.ProjectiveNoiseZ,
+        mc.PhaseAmplitudeDamping,
+        mc.AmplitudeDamping,
+        mc.GeneralizedAmplitudeDamping,
+        mc.MixedUnitary,
+        mc.Depolarizing,
+        mc.ThermalNoise,
+        mc.Kraus,
+        mc.GateCustom,
+        mc.GateDecl,
+        mc.GateCall,
+        mc.HamiltonianTerm,
+        mc.Hamiltonian,
+        mc.Detector,
+        mc.ObservableInclude,
+        mc.Add,
+        mc.Multiply,
+        mc.Pow,
+        mc.Not,
+        mc.Tick,
+        mc.ShiftCoordinates,
+        mc.QubitCoordinates,
+        mc.MeasureReset,
+        mc.GateHXY,
+        mc.GateHYZ
+
+    }
+
+    names = locals()
+    return {name: names[name] for name in _ENGINE_NAMES}
+
+
+def _available_memory():
+    """
+    Returns the physical memory currently available in bytes, or None if it
+    cannot be determined on this platform.
+    """
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _bitstrings(packed, numbits):
+    """
+    Formats the rows of a packed uint8 bit array (little bit order) as
+    "0101..." strings of numbits characters, bit 0 first.
+    """
+    bits = np.unpackbits(packed, axis=1, count=numbits, bitorder="little")
+    return [row.tobytes().decode() for row in bits + ord("0")]
+
+
+def _has_statevector_views():
+    """
+    Returns whether the engine build exposes the memory of its statevectors.
+    """
+    from . import _core
+
+    return _core.HAS_STATEVECTOR_VIEWS
+
+
+def _statevector_view(state):
+    """
+    Returns a writable NumPy view on the amplitudes of a CPU statevector,
+    engine or out-of-core.
+    """
+    from . import _core
+
+    engine_state = isinstance(state, (_core.StateVectorF32_CPU, _core.StateVectorF64_CPU))
+    if engine_state and not _has_statevector_views():
+        raise RuntimeError("This engine build does not expose the statevector memory")
+    return np.asarray(state)
+
+
+def _requested_amplitudes(amplitudes, bitstrings, numqubits):
+    """
+    Returns the amplitudes of a results dictionary for the requested
+    bitstrings as a complex128 array, in request order. bitstrings is a list
+    of bitarrays, a 2D array of bits, or a 1D array of basis indices where
+    bit j of an index gives the value of qubit j.
+    """
+    if isinstance(bitstrings, np.ndarray) and bitstrings.ndim == 1:
+        bits = (bitstrings.astype(np.uint64)[:, None] >> np.arange(numqubits, dtype=np.uint64)) & 1
+        keys = _bitstrings(np.packbits(bits.astype(np.uint8), axis=1, bitorder="little"), numqubits)
+    elif isinstance(bitstrings, np.ndarray):
+        bits = (bitstrings != 0).astype(np.uint8)
+        keys = _bitstrings(np.packbits(bits, axis=1, bitorder="little"), numqubits)
+    else:
+        keys = [bitstring.to01() for bitstring in bitstrings]
+    return np.array([amplitudes[mc.BitString(key)] for key in keys], dtype=np.complex128)
+
+
+def _decomposition_key(op):
+    """
+    Returns a hashable key identifying an operation by type and parameters,
+    and by the key of the operation it wraps for wrappers, or None when the
+    operation cannot be cached (symbolic parameters, custom matrices, gate
+    calls, unknown wrappers, ...).
+    """
+    if isinstance(op, mc.Control):
+        inner = _decomposition_key(op.op)
+        return None if inner is None else (mc.Control, op.num_controls, inner)
+    if isinstance(op, mc.Power):
+        inner = _decomposition_key(op.op)
+        if inner is None:
+            return None
+        try:
+            return (mc.Power, float(op.exponent), inner)
+        except (TypeError, ValueError, RuntimeError):
+            return None
+    if isinstance(op, mc.Inverse):
+        inner = _decomposition_key(op.op)
+        return None if inner is None else (mc.Inverse, inner)
+    if isinstance(op, mc.Parallel):
+        inner = _decomposition_key(op.op)
+        return None if inner is None else (mc.Parallel, op.num_repeats, inner)
+    if isinstance(op, mc.RPauli):
+        try:
+            return (mc.RPauli, str(op.pauli), float(op.theta))
+        except (TypeError, ValueError, RuntimeError):
+            return None
+    # Other wrappers, and gates defined by more than their parameters, are
+    # not identified by a type and parameters key
+    if op.iswrapper() or isinstance(
+        op, (mc.GateCustom, mc.GateCall, mc.GateCustomDiagonal, mc.PauliString, mc.PolynomialOracle)
+    ):
+        return None
+    if isinstance(op, mc.Gate):
+        try:
+            params = tuple(float(p) for p in op.getparams())
+        except (TypeError, ValueError, RuntimeError):
+            return None
+        return (type(op), op.num_qubits, params)
+    return None
+
+
+def _relative_instructions(inst, lowered):
+    """
+    Expresses the instructions of lowered in terms of positions within the
+    qubits, bits and zvars of inst, or returns None if any of them acts on a
+    target outside of inst.
+    """
+    qubits = {q: k for k, q in enumerate(inst.get_qubits())}
+    bits = {b: k for k, b in enumerate(inst.get_bits())}
+    zvars = {z: k for k, z in enumerate(inst.get_zvars())}
+    try:
+        return [
+            (
+                sub.get_operation(),
+                tuple(qubits[q] for q in sub.get_qubits()),
+                tuple(bits[b] for b in sub.get_bits()),
+                tuple(zvars[z] for z in sub.get_zvars()),
+            )
+            for sub in lowered
+        ]
+    except KeyError:
+        return None
+
+
+def _supported(engine, op):
+    return True
+
+
+def _unsupported(engine, op):
+    return False
+
+
+def _unsupported_error(message):
+    def handler(engine, op):
+        raise ValueError(message)
+
+    return handler
+
+
+def _wrapped_support(engine, op):
+    inner = engine.unwrap(op)
+    if type(inner) in QUANTANIUM_SUPPORTED_OPERATIONS:
+        return not isinstance(inner, mc.GateSWAP)
+    return False
+
+
+def _expectation_value_support(engine, op):
+    if _wrapped_support(engine, op):
+        return True
+    if op.num_qubits <= 2:
+        return True
+    elif isinstance(op.get_operation(), mc.PauliString):
+        return True
+    else:
+        raise ValueError(
+            "Expectation value of non Pauli strings more than 2 qubits is not supported."
+        )
+
+
+def _custom_gate_support(engine, op):
+    if op.num_qubits() <= 2:
+        return True
+    else:
+        raise ValueError(
+            "Custom gates with more than 2 qubits are not supported by the local executor."
+        )
 
 
 class Quantanium:
-    def __init__(self, use_gpu: bool = False):
+    def __init__(
+        self,
+        use_gpu: bool = False,
+        decomposition_cache_size: int = 1024,
+        precision: str = "double",
+        result_cache_size: int = 0,
+        result_cache_bytes: int = None,
+        result_cache_path: str = None,
+        fusion: int = 0,
+        reorder_qubits: bool = False,
+        blocking: int = 0,
+        num_threads: int = 0,
+        numa: str = "none",
+        storage: str = "memory",
+        path: str = None,
+        chunk_qubits: int = None,
+    ):
         """
         Initialize the MIMIQ Quantanium engine.
+
+        Args:
+            use_gpu (bool): Whether to run on the GPU backend.
+            decomposition_cache_size (int): Maximum number of distinct operations
+                whose decomposition is memoized, 0 disables the cache.
+            precision (str): "double" (complex128) or "single" (complex64) amplitudes.
+                Single precision halves memory and bandwidth and is CPU only.
+            result_cache_size (int): Maximum number of executions whose results are
+                cached by `execute`, 0 (the default) disables the cache.
+            result_cache_bytes (int): Memory budget of the result cache, None for no limit.
+            result_cache_path (str): Directory where cached results are persisted
+                across processes, None to keep them in memory only.
+            fusion (int): Maximum number of qubits of the gates built by fusing
+                consecutive gates, and runs of diagonal gates, before execution,
+                1 or 2. 0 (the default) disables gate fusion.
+            reorder_qubits (bool): Whether `execute` relabels the qubits of large
+                circuits so that the most used ones sit in low-order, cache-local
+                positions of the statevector. Results and `get_statevector` are
+                reported in the original qubit order.
+            blocking (int): Number of low-order qubits of the cache-resident chunks
+                used for blocked execution on CPU, 0 (the default) disables it.
+                Runs of gates acting only on those qubits are then applied chunk
+                by chunk, in a single pass over the statevector (see `evolve`).
+                Ignored when the engine build does not expose the statevector memory.
+            num_threads (int): Number of threads of the CPU engine. 0 (the default)
+                leaves the OpenMP runtime alone, so it follows OMP_NUM_THREADS or
+                the CPUs available to the process. The parallel loops of this
+                package always follow it; the engine's own execute and evolve only
+                do when `_core` is built with OpenMP, the default when CMake finds it.
+            numa (str): Placement on NUMA machines of the statevectors this
+                package allocates: those of `evolve` without stop_before_measure,
+                which are then simulated in place, of blocked execution and of
+                sessions. "interleave" spreads their pages round-robin over all
+                nodes, "local" pins the worker threads and has each one first
+                touch the part of the state it processes, "none" (the default)
+                leaves placement to the OS. The statevectors the engine allocates
+                itself, such as those of `execute`, are always left to the OS, as
+                are all of them when the engine build does not expose their memory.
+                Threading and placement are process-wide settings of the engine,
+                applied by each instance before it runs. To also pin the OpenMP
+                threads of the engine, call `Quantanium.bind_openmp_threads`
+                before the first execution.
+            storage (str): Where the statevector of `execute` and `evolve` lives,
+                "memory" (the default) or "mmap" for out-of-core simulation, the
+                amplitudes then living in the file at `path` and only a chunk
+                of them in memory (see `quantanium.outofcore`). Out-of-core
+                execution runs on CPU, for MimiqCircuits whose measurements
+                are all terminal.
+            path (str): The file backing the statevector with storage="mmap",
+                preferably on a local NVMe drive. It is replaced by each run.
+            chunk_qubits (int): Number of qubits of the in-memory chunk with
+                storage="mmap", None (the default) sizes it to a quarter of
+                the available memory.
         """
-        if use_gpu and not HAS_CUDA:
+        if use_gpu and not _has_cuda_runtime():
             raise RuntimeError("CUDA requested but not available on this system.")
-        self.use_gpu = use_gpu and HAS_CUDA
+        if precision not in ("single", "double"):
+            raise ValueError("precision must be either 'single' or 'double'")
+        if use_gpu and precision == "single":
+            raise ValueError("Single precision is only available on the CPU backend.")
+        if fusion not in (0, 1, 2):
+            raise ValueError("fusion must be 0, 1 or 2 qubits")
+        if numa not in ("interleave", "local", "none"):
+            raise ValueError("numa must be 'interleave', 'local' or 'none'")
+        if use_gpu and numa != "none":
+            raise ValueError("NUMA placement is only available on the CPU backend.")
+        if num_threads < 0:
+            raise ValueError("num_threads must be non-negative")
+        if blocking < 0:
+            raise ValueError("blocking must be a non-negative number of qubits")
+        if use_gpu and blocking:
+            raise ValueError("Blocked execution is only available on the CPU backend.")
+        if storage not in ("memory", "mmap"):
+            raise ValueError("storage must be either 'memory' or 'mmap'")
+        if storage == "mmap":
+            if path is None:
+                raise ValueError("storage='mmap' requires the path of the backing file")
+            if use_gpu:
+                raise ValueError("Out-of-core storage is only available on the CPU backend.")
+            if reorder_qubits or blocking:
+                raise ValueError(
+                    "Out-of-core storage schedules its own chunks, "
+                    "it cannot be combined with reorder_qubits or blocking"
+                )
+            if chunk_qubits is not None and chunk_qubits < 2:
+                raise ValueError("chunk_qubits must be at least 2")
+        _load_engine()
+        self.use_gpu = use_gpu and _has_cuda_runtime()
+        self.precision = precision
         self._statevector = None
         self._cplx = None
         self._cstate = None
+        self._amplitudes = None
+        self._final_state = None
+        self._mapped_state = None
+        self.fusion = fusion
+        self.reorder_qubits = reorder_qubits
+        self.blocking = blocking
+        self.num_threads = num_threads
+        self.numa = numa
+        self.storage = storage
+        self.path = path
+        self.chunk_qubits = chunk_qubits
+        self._fusion_stats = None
+        self._decomposition_cache = LRUCache(decomposition_cache_size)
+        self._result_cache = None
+        if result_cache_size > 0:
+            self._result_cache = ResultCache(
+                result_cache_size, result_cache_bytes, result_cache_path
+            )
 
 
+    @staticmethod
+    def bind_openmp_threads():
+        """
+        Pins the OpenMP threads of the engine, one per core, spread over the
+        NUMA nodes, by setting the OMP_PROC_BIND=spread and OMP_PLACES=cores
+        environment variables of the process, unless they are already set.
+
+        Meant to go with numa="local", so that the engine's threads run where
+        the statevector was first touched. The OpenMP runtime reads these
+        variables when it starts, so this must be called before the first
+        execution in the process.
+        """
+        os.environ.setdefault("OMP_PROC_BIND", "spread")
+        os.environ.setdefault("OMP_PLACES", "cores")
+
     @staticmethod
     def unwrap(op):
         """
@@ -144,6 +531,7 @@ class Quantanium:
         Returns:
             The innermost unwrapped gate/operation (e.g., GateZ).
         """
+        _load_engine()
         seen = set()
 
         while True:
@@ -179,83 +567,223 @@ class Quantanium:
         return op
 
 
-    def issupported(self, op: mc.Operation) -> bool:
-        if type(op) in QUANTANIUM_SUPPORTED_OPERATIONS:
-            return True
-
-        if isinstance(op, mc.IfStatement):
-            return self.issupported(op.get_operation())
- 
-
+    # Maps an operation type to the function deciding whether it is supported,
+    # filled lazily by `_support_handler` the first time a type is seen.
+    _SUPPORT_DISPATCH = {}
 
-        op_name = self.unwrap(op)
-        if type(op_name) in QUANTANIUM_SUPPORTED_OPERATIONS:
-            if isinstance(op_name, mc.GateSWAP):
-                return False
-            return True
+    def issupported(self, op: mc.Operation) -> bool:
+        optype = type(op)
+        handler = Quantanium._SUPPORT_DISPATCH.get(optype)
+        if handler is None:
+            handler = Quantanium._support_handler(optype)
+            Quantanium._SUPPORT_DISPATCH[optype] = handler
+        return handler(self, op)
 
+    @staticmethod
+    def _support_handler(optype):
+        """
+        Computes, once per operation type, the function giving its support verdict.
+        """
+        _load_engine()
+        if optype in QUANTANIUM_SUPPORTED_OPERATIONS:
+            return _supported
 
-        if isinstance(op, mc.BondDim):
-            raise ValueError(
+        if issubclass(optype, mc.BondDim):
+            return _unsupported_error(
                 "Bond dimension is not supported by the statevector simulator."
             )
 
-        if isinstance(op, mc.SchmidtRank):
-            raise ValueError(
+        if issubclass(optype, mc.SchmidtRank):
+            return _unsupported_error(
                 "The Schmidt rank is not supported by the statevector simulator."
             )
 
-        if isinstance(op, mc.VonNeumannEntropy):
-            raise ValueError(
+        if issubclass(optype, mc.VonNeumannEntropy):
+            return _unsupported_error(
                 "The von Neumann entropy is not supported by the statevector simulator."
             )
 
-        if isinstance(op, mc.ExpectationValue):
-            if op.num_qubits <= 2:
-                return True
-            elif isinstance(op.get_operation(), mc.PauliString):
-                return True
-            else:
-                raise ValueError(
-                    "Expectation value of non Pauli strings more than 2 qubits is not supported."
-                )
+        if issubclass(optype, mc.PolynomialOracle):
+            return _unsupported_error(
+                "PolynomialOracle is not supported by the local executor."
+            )
 
-        if isinstance(op, mc.GateCustom):
-            if op.num_qubits() <= 2:
-                return True
-            else:
-                raise ValueError(
-                    "Custom gates with more than 2 qubits are not supported by the local executor."
-                )
+        if issubclass(optype, mc.ExpectationValue):
+            return _expectation_value_support
 
-        if isinstance(op, mc.PolynomialOracle):
-            raise ValueError("PolynomialOracle is not supported by the local executor.")
+        if issubclass(optype, mc.GateCustom):
+            return _custom_gate_support
 
-        return False
+        # Only wrappers depend on the operation they hold
+        if issubclass(optype, (mc.Power, mc.Inverse)) or hasattr(optype, "get_operation"):
+            return _wrapped_support
+
+        return _unsupported
 
     def _checkdecompose(self, c: MimiqCircuit, inst: mc.Instruction) -> bool:
         op = inst.get_operation()
 
         if self.issupported(op):
             c.push(inst)
-        elif (
-            isinstance(inst.get_operation(), mc.Gate)
+            return c
+
+        key = _decomposition_key(op)
+        if key is None:
+            return self._lower(c, inst)
+
+        entry = self._decomposition_cache.get(key)
+        if entry is None:
+            lowered = self._lower(MimiqCircuit(), inst)
+            entry = _relative_instructions(inst, lowered)
+            if entry is None:
+                for inst2 in lowered:
+                    c.push(inst2)
+                return c
+            self._decomposition_cache.put(key, entry)
+
+        # Remap the cached sub-operations onto the targets of this instruction
+        qubits, bits, zvars = inst.get_qubits(), inst.get_bits(), inst.get_zvars()
+        for sub_op, sub_qubits, sub_bits, sub_zvars in entry:
+            c.push(
+                mc.Instruction(
+                    sub_op,
+                    tuple(qubits[k] for k in sub_qubits),
+                    tuple(bits[k] for k in sub_bits),
+                    tuple(zvars[k] for k in sub_zvars),
+                )
+            )
+        return c
+
+    def _lower(self, c: MimiqCircuit, inst: mc.Instruction) -> MimiqCircuit:
+        """
+        Pushes the supported operations implementing an unsupported instruction.
+        """
+        op = inst.get_operation()
+
+        if (
+            isinstance(op, mc.Gate)
             and not isinstance(op, mc.GateCall)
             and inst.num_qubits() <= 2
         ):
-            c.push(mc.GateCustom(inst.get_operation().matrix()), *inst.get_qubits())
+            c.push(mc.GateCustom(op.matrix()), *inst.get_qubits())
         else:
             decomposed = inst.decompose()
             for inst2 in decomposed:
                 self._checkdecompose(c, inst2)
         return c
 
+    def decomposition_cache_stats(self) -> dict:
+        """
+        Returns the statistics of the decomposition cache.
+
+        Returns:
+            dict: The hits, misses, current size and maximum size of the cache.
+        """
+        return self._decomposition_cache.stats()
+
+    def fusion_stats(self) -> dict:
+        """
+        Returns the effect of gate fusion on the last converted circuit.
+
+        Returns:
+            dict: The number of operations sweeping the statevector before
+            ("sweeps_before") and after ("sweeps_after") fusion.
+
+        Raises:
+            RuntimeError: If gate fusion is disabled or no circuit was converted yet.
+        """
+        if self._fusion_stats is None:
+            raise RuntimeError(
+                "No fusion statistics. Construct Quantanium with fusion > 0 "
+                "and convert a circuit first."
+            )
+        return dict(self._fusion_stats)
+
+    def result_cache_stats(self) -> dict:
+        """
+        Returns the statistics of the result cache of `execute`.
+
+        Returns:
+            dict: The hits, misses, current size and maximum size of the cache.
+
+        Raises:
+            RuntimeError: If the result cache is disabled.
+        """
+        if self._result_cache is None:
+            raise RuntimeError(
+                "The result cache is disabled. Construct Quantanium with result_cache_size > 0."
+            )
+        return self._result_cache.stats()
+
     def _decompose_mimiq(self, c: MimiqCircuit):
         cnew = MimiqCircuit()
         for inst in c:
             self._checkdecompose(cnew, inst)
         return cnew
 
+    def _to_qua_circuit(self, circuit) -> Circuit:
+        """
+        Converts a MimiqCircuit, Circuit or path to a QASM file to a Circuit.
+        """
+        if isinstance(circuit, MimiqCircuit):
+            return self.convert_mimiq_to_qua_circuit(circuit)
+        elif isinstance(circuit, Circuit):
+            return circuit
+        elif isinstance(circuit, str):
+            return self.convert_qasm_to_qua_circuit(circuit)
+        else:
+            raise TypeError("circuit must be MimiqCircuit, Circuit, or str")
+
+    def compile(self, circuit: MimiqCircuit) -> CompiledCircuit:
+        """
+        Decompose a parametric circuit once, for repeated execution.
+
+        Gates whose angles depend on symengine symbols are kept as parameter
+        slots in the decomposed circuit. Only those gates are evaluated when
+        the returned handle is run with new values, which makes VQE/QAOA loops
+        skip the decomposition.
+
+        Args:
+            circuit (MimiqCircuit): The circuit to compile. Symbolic angles must
+                belong to natively supported gates (e.g. GateRX, GateRZ, GateU).
+
+        Returns:
+            CompiledCircuit: The handle to bind parameters and run the circuit.
+
+        Raises:
+            ValueError: If the instance uses out-of-core storage, which runs
+                MimiqCircuits only.
+        """
+        if self.storage == "mmap":
+            raise ValueError("Compiled circuits cannot run with storage='mmap'")
+        decomposed = self._decompose_mimiq(circuit)
+
+        slots = []
+        for index, inst in enumerate(decomposed):
+            op = inst.get_operation()
+            if isinstance(op, mc.Gate) and any(
+                se.sympify(p).free_symbols for p in op.getparams()
+            ):
+                slots.append(index)
+        return CompiledCircuit(self, decomposed, slots)
+
+    def session(self, numqubits: int) -> Session:
+        """
+        Create a simulator session holding a preallocated statevector.
+
+        Use it for streams of executions: the statevector is allocated once,
+        then reset and reused for every circuit of up to `numqubits` qubits.
+
+        Args:
+            numqubits (int): The number of qubits of the statevector to allocate.
+
+        Returns:
+            Session: The session, whose `execute` runs circuits on the shared state.
+        """
+        if self.use_gpu:
+            raise ValueError("Sessions are only available on the CPU backend.")
+        return Session(self, numqubits)
+
     def convert_qasm_to_qua_circuit(self, qasm_file: str) -> Circuit:
         """
         Convert a QASM file to a Circuit.
@@ -292,31 +820,209 @@ class Quantanium:
         Raises:
             Exception: If there is an error in the conversion process.
         """
-        tmp_name = None
         try:
-            # Create temp file, but don't delete it on close
-            with tempfile.NamedTemporaryFile(suffix=".pb", delete=False) as tmp:
-                # Write out the proto data
-                self._decompose_mimiq(mimiq_circuit).saveproto(tmp)
-                tmp.flush()
-                tmp_name = tmp.name   # capture path
-
-            # Now that tmp is closed (and unlocked), we can reopen it
-            qua_circuit = ProtoParser().load_proto(tmp_name)
+            # Serialize the proto data in memory and hand it to the bindings
+            qua_circuit = ProtoParser().load_proto_bytes(self._mimiq_proto(mimiq_circuit))
         except Exception as e:
             raise Exception(f"Error converting mimiq::Circuit to Circuit: {e}")
 
-        finally:
-            # Clean up the file if it exists
-            if tmp_name and os.path.exists(tmp_name):
-                try:
-                    os.remove(tmp_name)
-                except OSError:
-                    pass
-
         return qua_circuit
 
 
+    def _mimiq_proto(self, mimiq_circuit: MimiqCircuit, fuse: bool = True) -> bytes:
+        """
+        Returns the serialized proto of the decomposed, and fused if enabled,
+        mimiq::Circuit.
+        """
+        buffer = io.BytesIO()
+        self._prepare_mimiq(mimiq_circuit, fuse).saveproto(buffer)
+        return buffer.getvalue()
+
+    def _configure_native(self):
+        # The engine settings are process-wide, apply the ones of this instance
+        if self.use_gpu:
+            return
+        from . import _core
+
+        _core.set_num_threads(self.num_threads)
+        _core.set_numa_policy(self.numa)
+
+    def _prepare_mimiq(self, mimiq_circuit: MimiqCircuit, fuse: bool = True) -> MimiqCircuit:
+        decomposed = self._decompose_mimiq(mimiq_circuit)
+        if fuse and self.fusion:
+            # Diagonal gates commute, gather them first to fuse across other gates
+            fused = fuse_diagonals(decomposed, self.fusion)
+            fused = fuse_gates(fused, self.fusion)
+            self._fusion_stats = {
+                "sweeps_before": count_sweeps(decomposed),
+                "sweeps_after": count_sweeps(fused),
+            }
+            decomposed = fused
+        return decomposed
+
+    def _evolve_blocked(self, circuit: MimiqCircuit, seed, state=None):
+        """
+        Evolves state, or a fresh zero state, through circuit in place. Runs of
+        gates on the `blocking` low-order qubits are applied chunk by chunk,
+        the rest of the circuit is simulated by the engine.
+        """
+        from . import _core
+
+        if self.precision == "single":
+            simulate, apply_local = _core.simulate_inplace_float, _core.apply_local_gates_float
+        else:
+            simulate, apply_local = _core.simulate_inplace, _core.apply_local_gates
+
+        self._configure_native()
+        prepared = self._prepare_mimiq(circuit)
+        if state is None:
+            # Allocated at full size up front, segments may use fewer qubits
+            state = self._new_statevector(max(prepared.num_qubits(), 1))
+
+        for index, segment in enumerate(split_blocks(prepared, self.blocking)):
+            if isinstance(segment, LocalBlock):
+                apply_local(state, segment.matrices, segment.targets, self.blocking, self.num_threads)
+            else:
+                buffer = io.BytesIO()
+                segment.saveproto(buffer)
+                qua_segment = ProtoParser().load_proto_bytes(buffer.getbuffer())
+                simulate(state, qua_segment, seed + index)
+        return state
+
+    def _evolve_placed(self, qua_circuit, seed):
+        """
+        Evolves the held state, or a fresh placed one, through qua_circuit in
+        place, so that the pages keep the placement of `_new_statevector`.
+        """
+        from . import _core
+
+        simulate = _core.simulate_inplace_float if self.precision == "single" else _core.simulate_inplace
+        self._configure_native()
+        if self._statevector is None:
+            self._statevector = self._new_statevector(max(qua_circuit.numqubits(), 1))
+        simulate(self._statevector, qua_circuit, seed)
+
+    def _new_statevector(self, numqubits):
+        """
+        Allocates a |0...0> CPU statevector, placed following the NUMA policy.
+        """
+        from . import _core
+
+        if self.precision == "single":
+            state = _core.StateVectorF32_CPU(numqubits)
+        else:
+            state = _core.StateVectorF64_CPU(numqubits)
+        if self.numa != "none":
+            _core.place_statevector(state, self.num_threads)
+        else:
+            state.zerostate()
+        return state
+
+    def _execute_blocked(self, circuit, plan, nsamples, seed, return_statevector):
+        from . import __version__
+
+        if seed is None:
+            seed = int(time.time())
+        prefix, measures = plan
+
+        start = time.perf_counter()
+        try:
+            state = self._evolve_blocked(prefix, seed)
+        except Exception as e:
+            raise Exception(f"Error executing the Circuit: {e}")
+        amplitudes = _statevector_view(state)
+        self._cplx = amplitudes.copy() if return_statevector else None
+        self._amplitudes = None
+        elapsed = time.perf_counter() - start
+
+        result = QCSResults(
+            simulator="Quantanium",
+            version=__version__,
+            fidelities=[1.0],
+            avggateerrors=[0.0],
+            timings={"apply": elapsed},
+        )
+        final_state = FinalState(prefix, measures, circuit.num_bits(), result)
+        final_state.sampler = StateSampler(amplitudes, measures, final_state.numbits)
+        self._final_state = final_state
+
+        start = time.perf_counter()
+        result.cstates = final_state.sampler.sample(nsamples, seed)
+        result.timings["sample"] = time.perf_counter() - start
+        return result
+
+    def _new_mapped_statevector(self, numqubits):
+        """
+        Creates the |0...0> state in the backing file of the out-of-core storage.
+        """
+        chunk_qubits = self.chunk_qubits
+        if chunk_qubits is None:
+            itemsize = 8 if self.precision == "single" else 16
+            chunk_qubits = outofcore.default_chunk_qubits(numqubits, itemsize, _available_memory())
+        return outofcore.MappedStateVector(self.path, numqubits, self.precision, chunk_qubits)
+
+    def _evolve_mapped(self, circuit: MimiqCircuit, state=None):
+        """
+        Evolves state, or a fresh zero state, through a circuit of gates, in
+        place in the backing file: one pass over the file per stage of gates
+        found by `outofcore.schedule`.
+        """
+        from . import _core
+
+        apply_gates = _core.apply_gates_float if self.precision == "single" else _core.apply_gates
+
+        self._configure_native()
+        prepared = self._prepare_mimiq(circuit)
+        if state is None:
+            state = self._new_mapped_statevector(max(circuit.num_qubits(), 1))
+        stages = outofcore.schedule(outofcore.unitary_gates(prepared), state.chunk_qubits)
+        state.apply(stages, apply_gates, self.num_threads)
+        return state
+
+    def _execute_mapped(self, circuit, nsamples, bitstrings, seed, return_statevector):
+        from . import __version__
+
+        plan = None
+        if isinstance(circuit, MimiqCircuit) and bitstrings is None:
+            plan = sampling_plan(circuit)
+        if plan is None:
+            raise ValueError(
+                "Out-of-core storage executes MimiqCircuits whose measurements "
+                "are all terminal, without bitstrings."
+            )
+        if seed is None:
+            seed = int(time.time())
+        prefix, measures = plan
+
+        # Release the previous state, whose file is about to be replaced
+        self._final_state = None
+        self._cplx = None
+        self._amplitudes = None
+
+        start = time.perf_counter()
+        try:
+            state = self._evolve_mapped(prefix)
+        except Exception as e:
+            raise Exception(f"Error executing the Circuit: {e}")
+        self._cplx = np.asarray(state) if return_statevector else None
+        elapsed = time.perf_counter() - start
+
+        result = QCSResults(
+            simulator="Quantanium",
+            version=__version__,
+            fidelities=[1.0],
+            avggateerrors=[0.0],
+            timings={"apply": elapsed},
+        )
+        final_state = FinalState(prefix, measures, circuit.num_bits(), result)
+        final_state.sampler = outofcore.MappedSampler(state, measures, final_state.numbits)
+        self._final_state = final_state
+
+        start = time.perf_counter()
+        result.cstates = final_state.sampler.sample(nsamples, seed)
+        result.timings["sample"] = time.perf_counter() - start
+        return result
+
     def convert_qua_to_mimiq_circuit(self, qua_circuit: Circuit) -> MimiqCircuit:
         """
         Convert a Circuit to a mimiq::Circuit.
@@ -389,25 +1095,14 @@ class Quantanium:
         Raises:
             Exception: If there is an error in the conversion process.
         """
-        tmp_name = None
         try:
-            with tempfile.NamedTemporaryFile(suffix='.pb', delete=False) as tmp:
-                pp = ProtoResult()
-                pp.save_proto(tmp.name, qua_results)
-                tmp_name = tmp.name
-
+            # Serialize the native results into bytes, parsed from memory
+            serialized = ProtoResult().to_bytes(qua_results)
 
             mimiq_results = QCSResults()
-            mimiq_results = mimiq_results.loadproto(tmp_name)
+            mimiq_results = mimiq_results.loadproto(io.BytesIO(serialized))
         except Exception as e:
             raise Exception(f"Error converting QuantaniumQCSResults to Mimiq QCSResults: {e}")
-        finally:
-
-            if tmp_name and os.path.exists(tmp_name):
-                try:
-                    os.remove(tmp_name)
-                except OSError:
-                    pass
 
         return mimiq_results
 
@@ -424,6 +1119,7 @@ class Quantanium:
         entdim=None,
         seed=None,
         qasmincludes=None,
+        return_statevector=False,
     ):
         """
         Execute the given circuit, either locally or via the Mimiq server.
@@ -433,29 +1129,127 @@ class Quantanium:
             label (str): The label for the execution.
             algorithm (str): The algorithm to be used for execution.
             nsamples (int): The number of samples to generate.
-            bitstrings (list): List of bitstrings for conditional execution.
+            bitstrings (list or numpy.ndarray): Bitstrings whose amplitudes are computed.
+                Either a list of bitarrays, a 2D (n, numqubits) uint8/bool array of bits,
+                or a 1D integer array of basis indices where bit j of an index gives
+                the value of qubit j. The amplitudes are then also available, in
+                request order, through `get_amplitudes`.
             timelimit (int): The time limit for execution in seconds.
             bonddim (int): The bond dimension for the MPS algorithm.
             entdim (int): The entangling dimension for the MPS algorithm.
             seed (int): The seed for generating random numbers.
             qasmincludes (list): List of OPENQASM files to include in the execution.
+            return_statevector (bool): Whether to keep the final statevector, available
+                afterwards through `get_statevector`. Defaults to False, in which case it
+                is released as soon as the execution returns.
+
+        With the result cache enabled, seeded executions of a MimiqCircuit are
+        looked up by a fingerprint of the decomposed circuit, nsamples, seed and
+        bitstrings, and unseeded executions of a circuit seen before only
+        resample its final state (see `resample`).
 
         Returns:
             QCSResults or QCSResult: The result of the execution.
         """
+        permutation = None
+        if self.reorder_qubits and isinstance(circuit, MimiqCircuit) and not self.use_gpu:
+            permutation = locality.locality_permutation(circuit)
+        if permutation is not None:
+            circuit = locality.relabel(circuit, permutation)
+            if bitstrings is not None:
+                bitstrings = locality.to_physical_bitstrings(bitstrings, permutation)
+
+        plan = None
+        if (
+            self.blocking
+            and isinstance(circuit, MimiqCircuit)
+            and bitstrings is None
+            and _has_statevector_views()
+        ):
+            plan = sampling_plan(circuit)
+
+        if self.storage == "mmap":
+            result = self._execute_mapped(circuit, nsamples, bitstrings, seed, return_statevector)
+        elif plan is not None:
+            # Terminal measurements only: one blocked pass, then sampling
+            result = self._execute_blocked(circuit, plan, nsamples, seed, return_statevector)
+        elif (
+            self._result_cache is not None
+            and isinstance(circuit, MimiqCircuit)
+            and not self.use_gpu
+            and not return_statevector
+        ):
+            result = self._execute_cached(circuit, nsamples, bitstrings, seed)
+        else:
+            result = self._execute(
+                circuit, nsamples, bitstrings, seed, return_statevector=return_statevector
+            )
+
+        if permutation is not None:
+            # Classical bits are not relabeled, only qubit-indexed outputs are
+            result.amplitudes = locality.to_logical_amplitudes(result.amplitudes, permutation)
+            if self._cplx is not None:
+                self._cplx = locality.to_logical_statevector(self._cplx, permutation)
+        return result
+
+    def _execute_cached(self, circuit, nsamples, bitstrings, seed):
+        from . import __version__
+
+        proto = self._mimiq_proto(circuit)
+        # Persisted results must not be reused by another version of the engine
+        digest = ResultCache.fingerprint(proto, self.precision, __version__)
+
+        if seed is None:
+            # Random samples of a known circuit only need its final state
+            state = self._result_cache.get(digest)
+            if state is not None and bitstrings is None:
+                self._final_state = state
+                self._cplx = None
+                self._amplitudes = None
+                result = self.resample(nsamples)
+                self._result_cache.put(digest, state)
+                return result
+            result = self._execute(circuit, nsamples, bitstrings, seed, proto=proto)
+            if self._final_state is not None:
+                self._result_cache.put(digest, self._final_state)
+            return result
+
+        if bitstrings is None:
+            bits = None
+        elif isinstance(bitstrings, np.ndarray):
+            bits = (bitstrings.dtype.str, bitstrings.shape, bitstrings.tobytes())
+        else:
+            bits = tuple(bitstring.to01() for bitstring in bitstrings)
+        key = ResultCache.fingerprint(digest, nsamples, seed, bits)
+
+        entry = self._result_cache.get(key)
+        if entry is not None:
+            serialized, amplitudes = entry
+            result = QCSResults().loadproto(io.BytesIO(serialized))
+            self._cplx = None
+            self._amplitudes = amplitudes
+            self._record_sampling(circuit, result, bitstrings)
+            return result
+
+        result = self._execute(circuit, nsamples, bitstrings, seed, proto=proto)
+        buffer = io.BytesIO()
+        result.saveproto(buffer)
+        self._result_cache.put(key, (buffer.getvalue(), self._amplitudes), persist=True)
+        return result
+
+    def _execute(self, circuit, nsamples, bitstrings, seed, return_statevector=False, proto=None):
         if self.use_gpu:
-            from ._core import execute_double_gpu as execute_double
+            from ._core import execute_double_gpu as execute_native
+        elif self.precision == "single":
+            from ._core import execute_float_cpu as execute_native
         else:
-            from ._core import execute_double_cpu as execute_double
+            from ._core import execute_double_cpu as execute_native
 
-        if isinstance(circuit, MimiqCircuit):
-            qua_circuit = self.convert_mimiq_to_qua_circuit(circuit)
-        elif isinstance(circuit, Circuit):
-            qua_circuit = circuit
-        elif isinstance(circuit, str):
-            qua_circuit = self.convert_qasm_to_qua_circuit(circuit)
+        if proto is not None:
+            qua_circuit = ProtoParser().load_proto_bytes(proto)
         else:
-            raise TypeError("circuit must be either a Circuit or mimiq::Circuit")
+            qua_circuit = self._to_qua_circuit(circuit)
+        self._configure_native()
 
         try:
             if seed is None:
@@ -463,23 +1257,156 @@ class Quantanium:
 
             if bitstrings is None:
                 bs = []
+            elif isinstance(bitstrings, np.ndarray):
+                # Converted natively in a single pass by the bindings
+                bs = bitstrings
             else:
                 bs = [QuantaniumBitVector(bitstring.to01()) for bitstring in bitstrings]
 
-            if self.use_gpu:
-                qua_result = execute_double(qua_circuit, nsamples, seed, bs)
-                self._cplx = None
-            else:
-                qua_result, sv = execute_double(qua_circuit, nsamples, seed, bs)
-                self._cplx = sv
+            # Drop the previous statevector before allocating a new one
+            self._cplx = None
+            self._amplitudes = None
+            qua_result, self._cplx = execute_native(
+                qua_circuit, nsamples, seed, bs, return_statevector
+            )
 
             result = self.convert_qua_results_to_mimiq_results(qua_result)
+            if bitstrings is not None:
+                self._amplitudes = _requested_amplitudes(
+                    result.amplitudes, bitstrings, qua_circuit.numqubits()
+                )
 
         except Exception as e:
             raise Exception(f"Error executing the Circuit: {e}")
 
+        self._record_sampling(circuit, result, bitstrings)
         return result
 
+    def _record_sampling(self, circuit, result, bitstrings):
+        # Remember the unitary part of circuits whose measurements are all
+        # terminal, so that `resample` can draw from their final state
+        self._final_state = None
+        if self.use_gpu or bitstrings is not None or not isinstance(circuit, MimiqCircuit):
+            return
+        plan = sampling_plan(circuit)
+        if plan is None:
+            return
+        prefix, measures = plan
+        state = FinalState(prefix, measures, circuit.num_bits(), result)
+
+        # Without measurements the final state is already the one to sample from
+        if not measures and self._cplx is not None:
+            state.sampler = StateSampler(self._cplx, measures, state.numbits)
+        self._final_state = state
+
+    def resample(self, nsamples=1000, seed=None):
+        """
+        Draw new samples from the final state of the last executed circuit.
+
+        Available when the last circuit given to `execute` was a MimiqCircuit
+        whose measurements are all terminal. Its unitary part is simulated at
+        most once, on the first call, and every call after that only samples
+        the cached probability vector, so the cost no longer depends on the
+        circuit depth.
+
+        Args:
+            nsamples (int): The number of samples to draw.
+            seed (int): Seed of the sampler (default = fresh OS entropy).
+
+        Returns:
+            QCSResults: The samples, with the metadata of the last execution.
+
+        Raises:
+            RuntimeError: If the last execution cannot be resampled.
+        """
+        state = self._final_state
+        if state is None:
+            raise RuntimeError(
+                "No final state to resample. Run 'execute' on a MimiqCircuit "
+                "whose measurements are all terminal first."
+            )
+
+        if state.sampler is None:
+            evolve_first = evolve_float if self.precision == "single" else evolve
+            if state.prefix.num_qubits() == 0:
+                amplitudes = np.ones(1, dtype=np.complex128)
+            else:
+                try:
+                    _, amplitudes = evolve_first(self._to_qua_circuit(state.prefix), 0, False)
+                except Exception as e:
+                    raise RuntimeError(f"Error evolving the circuit: {e}")
+            state.sampler = StateSampler(amplitudes, state.measures, state.numbits)
+
+        start = time.perf_counter()
+        cstates = state.sampler.sample(nsamples, seed)
+        elapsed = time.perf_counter() - start
+        last = state.result
+
+        return QCSResults(
+            simulator=last.simulator,
+            version=last.version,
+            fidelities=list(last.fidelities),
+            avggateerrors=list(last.avggateerrors),
+            cstates=cstates,
+            timings={"sample": elapsed},
+        )
+
+    def execute_batch(self, circuits, nsamples=1000, seeds=None, num_threads=0):
+        """
+        Execute many circuits in a single native call.
+
+        All circuits are converted up front, then simulated by the engine on a
+        pool of threads without holding the GIL. Use this for parameter sweeps
+        instead of calling `execute` in a loop.
+
+        Args:
+            circuits (list): MimiqCircuit, Circuit or QASM file paths to execute.
+            nsamples (int): The number of samples to generate for each circuit.
+            seeds (int or list): One seed per circuit, or a base seed from which
+                seed + i is used for the i-th circuit (default = time.time()).
+            num_threads (int): Number of worker threads, 0 uses the `num_threads`
+                of the engine.
+
+        Returns:
+            list[QCSResults]: The results, in the same order as `circuits`.
+        """
+        qua_circuits = [self._to_qua_circuit(circuit) for circuit in circuits]
+        self._configure_native()
+
+        if seeds is None:
+            seeds = int(time.time())
+        if isinstance(seeds, numbers.Integral):
+            seeds = [int(seeds) + i for i in range(len(qua_circuits))]
+        elif len(seeds) != len(qua_circuits):
+            raise ValueError("seeds must have the same length as circuits")
+
+        try:
+            if self.use_gpu:
+                from ._core import execute_double_gpu
+
+                qua_results = [
+                    execute_double_gpu(qua_circuit, nsamples, seed, [], False)[0]
+                    for qua_circuit, seed in zip(qua_circuits, seeds)
+                ]
+            else:
+                if self.precision == "single":
+                    from ._core import execute_batch_float_cpu as execute_batch_native
+                else:
+                    from ._core import execute_batch_double_cpu as execute_batch_native
+
+                qua_results = execute_batch_native(
+                    qua_circuits, nsamples, [int(seed) for seed in seeds], num_threads
+                )
+
+            results = [
+                self.convert_qua_results_to_mimiq_results(qua_result)
+                for qua_result in qua_results
+            ]
+        except Exception as e:
+            raise Exception(f"Error executing the Circuits: {e}")
+
+        return results
+
     def evolve(
         self,
         circuit,
@@ -489,31 +1416,77 @@ class Quantanium:
         """
         Evolve the given circuit, with or without a provided statevector.
 
+        With blocked execution enabled, a MimiqCircuit evolved without
+        stop_before_measure continues the state in place, its runs of gates on
+        low-order qubits being applied chunk by chunk.
+
+        With storage="mmap", the state lives in the backing file and the
+        circuit must be a MimiqCircuit of gates only. The array returned maps
+        the file.
+
         Args:
             circuit: MimiqCircuit, Circuit or str.
             stop_before_measure (bool): Whether to stop before measurement.
             seed (int): Random seed (default = time.time_ns()).
         """
-        if isinstance(circuit, MimiqCircuit):
-            qua_circuit = self.convert_mimiq_to_qua_circuit(circuit)
-        elif isinstance(circuit, Circuit):
-            qua_circuit = circuit
-        elif isinstance(circuit, str):
-            qua_circuit = self.convert_qasm_to_qua_circuit(circuit)
-        else:
-            raise TypeError("circuit must be MimiqCircuit, Circuit, or str")
-
         if seed is None:
             seed = time.time_ns()
+        self._materialize()
+
+        if self.storage == "mmap":
+            if not isinstance(circuit, MimiqCircuit):
+                raise TypeError("Out-of-core storage evolves MimiqCircuits only")
+            if self._statevector is not None and self._statevector.numqubits() < circuit.num_qubits():
+                raise RuntimeError("Error evolving the circuit: it has more qubits than the state")
+            try:
+                self._statevector = self._evolve_mapped(circuit, self._statevector)
+            except Exception as e:
+                raise RuntimeError(f"Error evolving the circuit: {e}")
+            self._cplx = np.asarray(self._statevector)
+            return self._cplx
+
+        if (
+            self.blocking
+            and isinstance(circuit, MimiqCircuit)
+            and not stop_before_measure
+            and _has_statevector_views()
+        ):
+            if self._statevector is not None and self._statevector.numqubits() < circuit.num_qubits():
+                raise RuntimeError("Error evolving the circuit: it has more qubits than the state")
+            try:
+                self._statevector = self._evolve_blocked(circuit, seed, self._statevector)
+            except Exception as e:
+                raise RuntimeError(f"Error evolving the circuit: {e}")
+            self._cplx = np.array(_statevector_view(self._statevector))
+            return self._cplx
+
+        qua_circuit = self._to_qua_circuit(circuit)
+
+        if self.numa != "none" and not stop_before_measure and _has_statevector_views():
+            # Simulated in place, the state keeps the placement of _new_statevector
+            if self._statevector is not None and self._statevector.numqubits() < qua_circuit.numqubits():
+                raise RuntimeError("Error evolving the circuit: it has more qubits than the state")
+            try:
+                self._evolve_placed(qua_circuit, seed)
+            except Exception as e:
+                raise RuntimeError(f"Error evolving the circuit: {e}")
+            self._cplx = np.array(self._statevector)
+            return self._cplx
+
+        if self.precision == "single":
+            evolve_first, evolve_then = evolve_float, evolve_next_float
+        else:
+            evolve_first, evolve_then = evolve, evolve_next
 
         try:
+            self._configure_native()
             if self._statevector is not None:
-                self._statevector, sv_cplx = evolve_next(
+                self._statevector, sv_cplx = evolve_then(
                     self._statevector, qua_circuit, seed, stop_before_measure
                 )
                 self._cplx = sv_cplx
             else:
-                self._statevector, sv_cplx = evolve(
+                self._statevector, sv_cplx = evolve_first(
                     qua_circuit, seed, stop_before_measure
                 )
                 self._cplx = sv_cplx
@@ -525,6 +1498,73 @@ class Quantanium:
             return self._cplx
         return None
 
+    def evolve_shots(
+        self,
+        circuits,
+        nshots=1000,
+        seed=None,
+        num_threads=0,
+        max_memory=None,
+        return_cstates=False,
+    ):
+        """
+        Run many trajectories with mid-circuit measurements in a single native call.
+
+        Each shot starts from |0...0> and evolves through `circuits` in order,
+        like calling `zerostate` and then `evolve` on each circuit, but the loop
+        over shots runs natively on several threads. The internal state used
+        by `evolve` is left untouched.
+
+        Args:
+            circuits: A MimiqCircuit, Circuit or str, or a list of them applied in sequence.
+            nshots (int): The number of trajectories.
+            seed (int): Random seed (default = time.time_ns()).
+            num_threads (int): Number of worker threads, 0 uses the `num_threads`
+                of the engine.
+            max_memory (int): Bytes the per-thread statevectors may use, which caps
+                the number of threads. Defaults to the available physical memory.
+            return_cstates (bool): Return the classical state of every shot
+                instead of a histogram.
+
+        Returns:
+            collections.Counter or numpy.ndarray: Counts keyed by classical state
+            written as a "0101..." string (bit 0 first), or the packed classical
+            states as a (nshots, bytes) uint8 array, bit i of a shot being bit
+            i % 8 of byte i // 8 (see `numpy.unpackbits(..., bitorder="little")`).
+        """
+        if isinstance(circuits, (MimiqCircuit, Circuit, str)):
+            circuits = [circuits]
+        qua_circuits = [self._to_qua_circuit(circuit) for circuit in circuits]
+        if not qua_circuits:
+            raise ValueError("at least one circuit is required")
+
+        if seed is None:
+            seed = time.time_ns()
+
+        # Every worker holds its own statevector, run only as many as fit in memory
+        if max_memory is None:
+            max_memory = _available_memory()
+        if max_memory is not None:
+            numqubits = max(qua_circuit.numqubits() for qua_circuit in qua_circuits)
+            state_bytes = 2**numqubits * (8 if self.precision == "single" else 16)
+            num_threads = num_threads or self.num_threads or os.cpu_count() or 1
+            num_threads = max(1, min(num_threads, max_memory // state_bytes))
+
+        evolve_native = evolve_shots_float if self.precision == "single" else evolve_shots
+
+        try:
+            self._configure_native()
+            packed = evolve_native(qua_circuits, nshots, seed, num_threads)
+        except Exception as e:
+            raise RuntimeError(f"Error evolving the circuit: {e}")
+
+        if return_cstates:
+            return packed
+
+        numbits = max(qua_circuit.numbits() for qua_circuit in qua_circuits)
+        rows, counts = np.unique(packed, axis=0, return_counts=True)
+        return Counter(dict(zip(_bitstrings(rows, numbits), counts.tolist())))
+
     # def evolve(
     #         self,
     #         circuit,
@@ -576,30 +1616,167 @@ class Quantanium:
         Raises:
             RuntimeError: If the internal statevector is not initialized.
         """
+        self._materialize()
         if self._statevector is not None:    
             self._statevector.zerostate()
 
+    def save_state(self, path):
+        """
+        Writes the internal statevector and its classical registers to a file.
+
+        The amplitudes are written raw at a page-aligned offset, followed by
+        the packed classical states (see `quantanium.checkpoint`), so that
+        `load_state` can map the file instead of reading it.
+
+        Args:
+            path (str): The checkpoint file, replaced atomically if it exists.
+
+        Raises:
+            RuntimeError: If no statevector has been evolved or loaded yet, or
+                if the engine build does not expose the statevector memory.
+        """
+        if self._mapped_state is not None:
+            amplitudes, packed, numbits = self._mapped_state
+        elif self._statevector is not None:
+            amplitudes = _statevector_view(self._statevector)
+            cstates = self._statevector.get_cstates()
+            numbits = len(cstates[0]) if cstates else 0
+            packed = pack_bitvectors(cstates, 8) if cstates else np.zeros((0, 0), np.uint8)
+        else:
+            raise RuntimeError("Statevector is not available. Run 'evolve' first.")
+        write_state(path, amplitudes, packed, numbits)
+
+    def load_state(self, path, mmap=True):
+        """
+        Restores the internal statevector from a file written by `save_state`.
+
+        With mmap, the file is mapped rather than read: loading is immediate
+        and `get_statevector` reads the amplitudes from the page cache. The
+        engine state is built from the mapping, in parallel chunks, by the next
+        call needing it (`evolve`, `zerostate`, `get_statevector_view`,
+        `get_cstate`), and `evolve` continues from it.
+
+        Args:
+            path (str): The checkpoint file.
+            mmap (bool): Map the file instead of reading it in memory.
+
+        Raises:
+            ValueError: If the file is not a checkpoint of this precision.
+            RuntimeError: If the engine build does not expose the statevector
+                memory, which the in-memory state is restored into.
+        """
+        if self.use_gpu:
+            raise ValueError("Checkpoints are only available on the CPU backend.")
+        if self.storage != "mmap" and not _has_statevector_views():
+            raise RuntimeError("This engine build does not expose the statevector memory")
+        amplitudes, packed, numbits = read_state(path, mmap)
+        expected = np.complex64 if self.precision == "single" else np.complex128
+        if amplitudes.dtype != expected:
+            raise ValueError(
+                f"checkpoint holds {amplitudes.dtype} amplitudes, "
+                f"the engine runs in {self.precision} precision"
+            )
+        self._statevector = None
+        self._mapped_state = (amplitudes, packed, numbits)
+        self._cplx = amplitudes
+
+    def _materialize(self):
+        # Build the engine statevector from a loaded checkpoint, once
+        if self._mapped_state is None:
+            return
+        from . import _core
+
+        amplitudes, packed, numbits = self._mapped_state
+        cstates = [QuantaniumBitVector(bits) for bits in _bitstrings(packed, numbits)]
+        if self.storage == "mmap":
+            # Copied into the backing file, which may be the checkpoint itself
+            self._statevector = self._new_mapped_statevector(len(amplitudes).bit_length() - 1)
+            self._statevector.load(amplitudes, cstates)
+            self._mapped_state = None
+            return
+        if self.precision == "single":
+            from_buffer = _core.statevector_from_buffer_float
+        else:
+            from_buffer = _core.statevector_from_buffer
+        self._statevector = from_buffer(amplitudes, cstates, self.num_threads)
+        self._mapped_state = None
+
     def get_statevector(self):
         """
         Returns the statevector from the last execution.
 
         Returns:
-            list: A list of complex numbers representing the statevector.
+            numpy.ndarray: A complex128 (complex64 in single precision) array holding
+            the statevector. The array owns the buffer produced by the engine, no
+            copy is made.
+        """
+        if self._cplx is None:
+            raise RuntimeError(
+                "Statevector is not available. Run 'execute' with "
+                "return_statevector=True or 'evolve' first."
+            )
+        return self._cplx
+
+    def get_amplitudes(self):
+        """
+        Returns the amplitudes of the bitstrings requested by the last execution.
+
+        Returns:
+            numpy.ndarray: A complex128 array, in the order of the requested bitstrings.
+
+        Raises:
+            RuntimeError: If the last execution did not request any bitstring.
+        """
+        if self._amplitudes is None:
+            raise RuntimeError(
+                "Amplitudes are not available. Run 'execute' with bitstrings first."
+            )
+        return self._amplitudes
+
+    def get_statevector_view(self):
+        """
+        Returns a view on the live statevector held by the engine after `evolve`.
+
+        Unlike `get_statevector`, nothing is copied: the array shares the memory
+        of the statevector the engine currently holds, and writing into it
+        modifies the state that the next `evolve` continues from. `evolve`
+        generally replaces that statevector with a new one, so a view taken
+        before it may keep the previous amplitudes (and their memory alive)
+        rather than follow the evolution; call this method again after each
+        `evolve` to view the new state.
+
+        Returns:
+            numpy.ndarray: A writable complex array of 2^n amplitudes.
+
+        Raises:
+            RuntimeError: If no statevector has been evolved yet, or if the
+                engine build does not expose the statevector memory.
         """
-        if not hasattr(self, "_statevector"):
-            raise RuntimeError("Statevector is not available. Run 'execute' first.")
-        return self._cplx #self._statevector
+        self._materialize()
+        if self._statevector is None:
+            raise RuntimeError("Statevector is not available. Run 'evolve' first.")
+        return _statevector_view(self._statevector)
 
-    def get_cstate(self):
+    def get_cstate(self, packed=False, word_bits=8):
         """
         Returns the classical state from the last evolve.
 
+        Args:
+            packed (bool): Return the classical states packed in a NumPy array
+                instead of a list of BitVector.
+            word_bits (int): Word size of the packed array, 8 (uint8) or 64 (uint64).
+
         Returns:
-            list: A list of classical states.
+            list or numpy.ndarray: A list of classical states, or a (states, words)
+            array where bit i of a state is bit i % word_bits of word i // word_bits.
         """
-        if not hasattr(self, "_statevector"):
-            raise RuntimeError("Statevector is not available. Run 'execute' first.")
-        return self._statevector.get_cstates() 
+        self._materialize()
+        if self._statevector is None:
+            raise RuntimeError("Statevector is not available. Run 'evolve' first.")
+        cstates = self._statevector.get_cstates()
+        if packed:
+            return pack_bitvectors(cstates, word_bits)
+        return cstates
     
     def get_results(self, *args, **kwargs):
         raise RuntimeError("get_results is only available for remote execution.")
@@ -0,0 +1,72 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+import mimiqcircuits as mc
+
+from .fusion import gate_matrix
+
+
+class LocalBlock:
+    """
+    Consecutive 1- and 2-qubit gates acting only on low-order qubits, applied
+    chunk by chunk by `apply_local_gates`.
+    """
+
+    def __init__(self):
+        self.matrices = []
+        self.targets = []
+        self.instructions = []
+
+    def __len__(self):
+        return len(self.matrices)
+
+
+def split_blocks(circuit, block_qubits):
+    """
+    Splits a decomposed circuit into segments run by the engine and blocks of
+    gates on the block_qubits low-order qubits.
+
+    Only runs of at least two local gates become a `LocalBlock`, a single gate
+    costs one pass over the statevector either way.
+
+    Args:
+        circuit (MimiqCircuit): The circuit to split, already decomposed.
+        block_qubits (int): The number of low-order qubits of a chunk.
+
+    Returns:
+        list: MimiqCircuit and LocalBlock segments, in execution order.
+    """
+    segments = []
+    native = mc.Circuit()
+    block = LocalBlock()
+
+    for inst in list(circuit) + [None]:
+        matrix = None
+        if inst is not None:
+            qubits = inst.get_qubits()
+            if 0 < len(qubits) <= 2 and all(q < block_qubits for q in qubits):
+                matrix = gate_matrix(inst.get_operation())
+
+        if matrix is not None:
+            block.matrices.append(matrix)
+            block.targets.append(list(qubits))
+            block.instructions.append(inst)
+            continue
+
+        if len(block) > 1:
+            if len(native) > 0:
+                segments.append(native)
+                native = mc.Circuit()
+            segments.append(block)
+        else:
+            for local in block.instructions:
+                native.push(local)
+        block = LocalBlock()
+        if inst is not None:
+            native.push(inst)
+
+    if len(native) > 0:
+        segments.append(native)
+    return segments
@@ -0,0 +1,216 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+import os
+import hashlib
+import tempfile
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    A bounded mapping evicting the least recently used entry once full.
+
+    Lookups through `get` are counted, `stats` reports the hit and miss counts.
+    """
+
+    def __init__(self, maxsize: int = 1024, maxbytes: int = None, sizeof=None):
+        """
+        Args:
+            maxsize (int): The maximum number of entries, 0 disables the cache.
+            maxbytes (int): The maximum total size of the entries, None for no limit.
+            sizeof (callable): Returns the size in bytes of an entry, required
+                when maxbytes is given.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if maxbytes is not None and sizeof is None:
+            raise ValueError("sizeof is required when maxbytes is given")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._sizeof = sizeof
+        self._entries = OrderedDict()
+        self._sizes = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Returns the entry stored under key and marks it as most recently used.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Stores value under key, evicting the least recently used entries if needed.
+        """
+        if self.maxsize == 0:
+            return
+        self._discard(key)
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.nbytes += size
+        while len(self._entries) > self.maxsize or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        ):
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        if key in self._entries:
+            del self._entries[key]
+            self.nbytes -= self._sizes.pop(key)
+
+    def clear(self):
+        """
+        Removes every entry and resets the statistics.
+        """
+        self._entries.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: The hits, misses, current size and maximum size of the cache.
+        """
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+        if self.maxbytes is not None:
+            stats["nbytes"] = self.nbytes
+            stats["maxbytes"] = self.maxbytes
+        return stats
+
+
+class ResultCache:
+    """
+    Execution results keyed by a fingerprint of the circuit and the run options.
+
+    Results are kept serialized, so every hit returns a fresh object, in an
+    `LRUCache` bounded both in entries and in bytes. When a directory is
+    given, results are also written there and survive the process.
+    """
+
+    def __init__(self, maxsize: int = 128, maxbytes: int = None, path: str = None):
+        """
+        Args:
+            maxsize (int): The maximum number of entries kept in memory.
+            maxbytes (int): The memory budget of the entries, None for no limit.
+            path (str): Directory where results are persisted, None to keep them
+                in memory only.
+        """
+        self.path = path
+        self._entries = LRUCache(maxsize, maxbytes, sizeof=_entry_size)
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(*parts) -> str:
+        """
+        Returns a stable digest of parts, each being bytes or a value whose
+        `repr` identifies it.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, (bytes, bytearray, memoryview)):
+                part = repr(part).encode()
+            digest.update(len(part).to_bytes(8, "little"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Returns the entry stored under key, loading it from disk if needed.
+        """
+        entry = self._entries.get(key)
+        if entry is None and self.path is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._entries.put(key, entry)
+        return entry
+
+    def put(self, key, entry, persist=False):
+        """
+        Stores entry under key. With persist, a (bytes, numpy.ndarray or None)
+        entry is also written to disk.
+        """
+        self._entries.put(key, entry)
+        if persist and self.path is not None:
+            self._save(key, entry)
+
+    def clear(self):
+        """
+        Removes every entry held in memory, persisted results are kept.
+        """
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return self._entries.stats()
+
+    def _file(self, key, extension):
+        return os.path.join(self.path, key + extension)
+
+    def _load(self, key):
+        import numpy as np
+
+        try:
+            with open(self._file(key, ".pb"), "rb") as f:
+                serialized = f.read()
+        except FileNotFoundError:
+            return None
+        amplitudes = None
+        if os.path.exists(self._file(key, ".npy")):
+            amplitudes = np.load(self._file(key, ".npy"))
+        return serialized, amplitudes
+
+    def _save(self, key, entry):
+        import numpy as np
+
+        serialized, amplitudes = entry
+        if amplitudes is not None:
+            _atomic_write(self._file(key, ".npy"), lambda f: np.save(f, amplitudes))
+        # The results file is written last, it marks the entry as complete
+        _atomic_write(self._file(key, ".pb"), lambda f: f.write(serialized))
+
+
+def _entry_size(entry):
+    if isinstance(entry, tuple):
+        serialized, amplitudes = entry
+        return len(serialized) + (amplitudes.nbytes if amplitudes is not None else 0)
+    return entry.nbytes
+
+
+def _atomic_write(filename, write):
+    # Write next to the destination and rename, readers never see partial files
+    fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(filename))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_name, filename)
+    except BaseException:
+        os.remove(tmp_name)
+        raise
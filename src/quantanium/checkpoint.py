@@ -0,0 +1,136 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+"""
+Binary checkpoints of a statevector and its classical registers.
+
+Layout, all integers little endian:
+
+- a 4096-byte header: the magic b"QUASTATE", then uint32 version, itemsize
+  (8 for complex64, 16 for complex128), numqubits, number of classical
+  states and number of bits per classical state, then uint64 offsets of the
+  amplitudes and of the classical states;
+- the 2^numqubits amplitudes, raw, at a page-aligned offset;
+- the classical states packed as a (states, ceil(bits / 8)) uint8 array,
+  bit i of a state being bit i % 8 of byte i // 8, at a page-aligned offset.
+"""
+import os
+import struct
+import numpy as np
+
+MAGIC = b"QUASTATE"
+VERSION = 1
+ALIGNMENT = 4096
+_HEADER = struct.Struct("<8sIIIIIQQ")
+_DTYPES = {8: np.complex64, 16: np.complex128}
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _header(dtype, numqubits, nstates, numbits):
+    # Returns the packed header and the offset of the classical states
+    itemsize = np.dtype(dtype).itemsize
+    cstates_offset = _aligned(ALIGNMENT + itemsize * 2**numqubits)
+    header = _HEADER.pack(
+        MAGIC, VERSION, itemsize, numqubits, nstates, numbits, ALIGNMENT, cstates_offset,
+    )
+    return header, cstates_offset
+
+
+def write_state(path, amplitudes, cstates, numbits):
+    """
+    Writes a checkpoint.
+
+    Args:
+        path (str): The file to write.
+        amplitudes (numpy.ndarray): The complex64 or complex128 amplitudes.
+        cstates (numpy.ndarray): The packed classical states, a 2D uint8 array.
+        numbits (int): The number of bits of each classical state.
+    """
+    amplitudes = np.asarray(amplitudes)
+    if amplitudes.dtype.itemsize not in _DTYPES:
+        raise ValueError("amplitudes must be complex64 or complex128")
+    numqubits = int(amplitudes.size).bit_length() - 1
+    cstates = np.ascontiguousarray(cstates, dtype=np.uint8).reshape(len(cstates), (numbits + 7) // 8)
+
+    header, cstates_offset = _header(amplitudes.dtype, numqubits, len(cstates), numbits)
+    amplitudes_offset = ALIGNMENT
+
+    # Written next to the destination and renamed, a crash never leaves a
+    # truncated checkpoint in place of the previous one
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(ALIGNMENT, b"\0"))
+        amplitudes.tofile(f)
+        f.write(b"\0" * (cstates_offset - amplitudes_offset - amplitudes.nbytes))
+        cstates.tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_state(path, mmap=True):
+    """
+    Reads a checkpoint.
+
+    Args:
+        path (str): The file to read.
+        mmap (bool): Map the amplitudes instead of reading them in memory.
+
+    Returns:
+        tuple: (amplitudes, packed classical states, number of bits per state).
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path} is not a statevector checkpoint")
+    fields = _HEADER.unpack(header)
+    magic, version, itemsize, numqubits, nstates, numbits, amplitudes_offset, cstates_offset = fields
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a statevector checkpoint")
+    if version != VERSION:
+        raise ValueError(f"unsupported checkpoint version {version}")
+    if itemsize not in _DTYPES:
+        raise ValueError(f"unsupported amplitude size {itemsize}")
+
+    dtype = _DTYPES[itemsize]
+    if mmap:
+        amplitudes = np.memmap(path, dtype=dtype, mode="r", offset=amplitudes_offset, shape=(2**numqubits,))
+    else:
+        amplitudes = np.fromfile(path, dtype=dtype, count=2**numqubits, offset=amplitudes_offset)
+
+    nbytes = (numbits + 7) // 8
+    cstates = np.fromfile(path, dtype=np.uint8, count=nstates * nbytes, offset=cstates_offset)
+    return amplitudes, cstates.reshape(nstates, nbytes), numbits
+
+
+def create_state(path, numqubits, dtype):
+    """
+    Creates a checkpoint of the |0...0> state, without classical states, and
+    maps its amplitudes for writing.
+
+    The file is sparse: only the pages written later take disk space. It is
+    created next to path and renamed, so a mapping of a previous file at path
+    stays valid.
+
+    Args:
+        path (str): The file to create.
+        numqubits (int): The number of qubits of the state.
+        dtype: numpy.complex64 or numpy.complex128.
+
+    Returns:
+        numpy.memmap: The 2^numqubits amplitudes, mapped read-write.
+    """
+    header, cstates_offset = _header(dtype, numqubits, 0, 0)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(ALIGNMENT, b"\0"))
+        f.truncate(cstates_offset)
+    amplitudes = np.memmap(tmp_path, dtype=dtype, mode="r+", offset=ALIGNMENT, shape=(2**numqubits,))
+    amplitudes[0] = 1
+    os.replace(tmp_path, path)
+    return amplitudes
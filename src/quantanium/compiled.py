@@ -0,0 +1,111 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+import mimiqcircuits as mc
+import symengine as se
+
+
+class CompiledCircuit:
+    """
+    A circuit decomposed once, whose symbolic angles are kept as parameter
+    slots.
+
+    Rebinding the parameters only evaluates the instructions depending on a
+    symbol, the circuit is not decomposed again before its conversion to the
+    native format. Instances are obtained from `Quantanium.compile`.
+
+    Attributes:
+        parameters (tuple): The free symbols of the circuit, in the order
+            expected by `bind` and `run` when values are given as a sequence.
+    """
+
+    def __init__(self, engine, circuit, slots):
+        """
+        Args:
+            engine (Quantanium): The engine used to run the circuit.
+            circuit (MimiqCircuit): The decomposed circuit, with symbolic angles.
+            slots (list): The indices of the instructions depending on a symbol.
+        """
+        self._engine = engine
+        self._instructions = list(circuit.instructions)
+        self._slots = [(index, self._instructions[index]) for index in slots]
+        self._qua_circuit = None
+
+        symbols = set()
+        for _, inst in self._slots:
+            for param in inst.get_operation().getparams():
+                symbols |= se.sympify(param).free_symbols
+        self.parameters = tuple(sorted(symbols, key=str))
+
+    def __len__(self):
+        return len(self.parameters)
+
+    def _values(self, params):
+        if isinstance(params, dict):
+            missing = [p for p in self.parameters if p not in params]
+            if missing:
+                raise ValueError(f"Missing values for parameters {missing}")
+            return [params[p] for p in self.parameters]
+
+        params = list(params)
+        if len(params) != len(self.parameters):
+            raise ValueError(
+                f"Expected {len(self.parameters)} parameter values, got {len(params)}"
+            )
+        return params
+
+    def bind(self, params):
+        """
+        Evaluates the parameter slots with the given values and converts the
+        bound circuit to the native format.
+
+        Args:
+            params (dict or list): Values keyed by symbol, or a sequence ordered
+                as `parameters`.
+        """
+        if self._qua_circuit is not None and not self._slots:
+            return
+
+        values = dict(zip(self.parameters, self._values(params)))
+
+        instructions = list(self._instructions)
+        for index, inst in self._slots:
+            instructions[index] = mc.Instruction(
+                inst.get_operation().evaluate(values), inst.get_qubits()
+            )
+        self._qua_circuit = self._engine.convert_mimiq_to_qua_circuit(
+            mc.Circuit(instructions)
+        )
+
+    def run(
+        self,
+        params=(),
+        nsamples=1000,
+        seed=None,
+        bitstrings=None,
+        return_statevector=False,
+    ):
+        """
+        Binds the parameters and executes the compiled circuit.
+
+        Args:
+            params (dict or list): Values keyed by symbol, or a sequence ordered
+                as `parameters`.
+            nsamples (int): The number of samples to generate.
+            seed (int): The seed for generating random numbers.
+            bitstrings (list): List of bitstrings for amplitude computation.
+            return_statevector (bool): Whether to keep the final statevector.
+
+        Returns:
+            QCSResults: The result of the execution.
+        """
+        self.bind(params)
+        return self._engine.execute(
+            self._qua_circuit,
+            nsamples=nsamples,
+            seed=seed,
+            bitstrings=bitstrings,
+            return_statevector=return_statevector,
+        )
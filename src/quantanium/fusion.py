@@ -0,0 +1,260 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+import numpy as np
+import symengine as se
+import mimiqcircuits as mc
+
+
+def gate_matrix(op):
+    """
+    Returns the numeric matrix of a gate, or None if it has symbolic parameters.
+
+    As in mimiqcircuits, the first qubit of the gate is the most significant one.
+    """
+    if not isinstance(op, mc.Gate) or isinstance(op, mc.GateCall):
+        return None
+    if any(se.sympify(p).free_symbols for p in op.getparams()):
+        return None
+    try:
+        return np.array(
+            [[complex(x) for x in row] for row in op.matrix().tolist()],
+            dtype=np.complex128,
+        )
+    except (TypeError, ValueError, RuntimeError):
+        return None
+
+
+# Operations without qubits that never read the quantum state
+_CLASSICAL_OPERATIONS = (mc.AbstractClassical, mc.AbstractAnnotation, mc.Add, mc.Multiply, mc.Pow)
+
+
+def _reads_whole_state(inst):
+    """
+    Whether an instruction acts on no qubit but depends on the whole state,
+    like `Amplitude`. Gates cannot be moved across it.
+    """
+    return inst.num_qubits() == 0 and not isinstance(inst.get_operation(), _CLASSICAL_OPERATIONS)
+
+
+def _apply(unitary, matrix, axes):
+    # Left-multiplies the (2,)*m x 2^m unitary tensor by matrix acting on axes
+    k = len(axes)
+    tensor = np.tensordot(matrix.reshape((2,) * (2 * k)), unitary, axes=(range(k, 2 * k), axes))
+    return np.moveaxis(tensor, range(k), axes)
+
+
+class _Block:
+    def __init__(self, inst, matrix):
+        self.qubits = list(inst.get_qubits())
+        self.instructions = [(inst, matrix)]
+
+    def merge(self, other):
+        self.qubits += [q for q in other.qubits if q not in self.qubits]
+        self.instructions += other.instructions
+
+    def add(self, inst, matrix):
+        self.qubits += [q for q in inst.get_qubits() if q not in self.qubits]
+        self.instructions.append((inst, matrix))
+
+    def emit(self, circuit):
+        if len(self.instructions) == 1:
+            circuit.push(self.instructions[0][0])
+            return
+        m = len(self.qubits)
+        unitary = np.eye(2**m, dtype=np.complex128).reshape((2,) * m + (2**m,))
+        for inst, matrix in self.instructions:
+            axes = [self.qubits.index(q) for q in inst.get_qubits()]
+            unitary = _apply(unitary, matrix, axes)
+        circuit.push(mc.GateCustom(unitary.reshape(2**m, 2**m)), *self.qubits)
+
+
+def fuse_gates(circuit, max_qubits=2):
+    """
+    Merges consecutive gates acting on at most max_qubits qubits into GateCustom.
+
+    Gates are grouped greedily while scanning the circuit: a gate joins the open
+    blocks of its qubits if their union spans at most max_qubits qubits, any
+    other operation (measurement, noise, symbolic or wider gate) closes the
+    blocks it touches, and operations reading the whole state without acting
+    on qubits (`Amplitude`) close every block. A block of a single gate is
+    emitted unchanged.
+
+    Args:
+        circuit (MimiqCircuit): The circuit to fuse, already decomposed.
+        max_qubits (int): The maximum number of qubits of a fused gate.
+
+    Returns:
+        MimiqCircuit: The fused circuit, equivalent to the input one.
+    """
+    fused = mc.Circuit()
+    open_blocks = {}
+
+    def close(block):
+        for q in block.qubits:
+            del open_blocks[q]
+        block.emit(fused)
+
+    def close_all():
+        # In the order the blocks were opened
+        remaining = []
+        for block in open_blocks.values():
+            if block not in remaining:
+                remaining.append(block)
+        for block in remaining:
+            close(block)
+
+    for inst in circuit:
+        if _reads_whole_state(inst):
+            close_all()
+            fused.push(inst)
+            continue
+
+        qubits = inst.get_qubits()
+        touched = []
+        for q in qubits:
+            block = open_blocks.get(q)
+            if block is not None and block not in touched:
+                touched.append(block)
+
+        matrix = None
+        if isinstance(inst.get_operation(), mc.Gate) and len(qubits) <= max_qubits:
+            matrix = gate_matrix(inst.get_operation())
+
+        if matrix is None:
+            for block in touched:
+                close(block)
+            fused.push(inst)
+            continue
+
+        span = set(qubits)
+        for block in touched:
+            span.update(block.qubits)
+
+        if len(span) > max_qubits:
+            for block in touched:
+                close(block)
+            touched = []
+
+        if touched:
+            block = touched[0]
+            for other in touched[1:]:
+                for q in other.qubits:
+                    del open_blocks[q]
+                block.merge(other)
+            block.add(inst, matrix)
+        else:
+            block = _Block(inst, matrix)
+        for q in block.qubits:
+            open_blocks[q] = block
+
+    close_all()
+    return fused
+
+
+def gate_diagonal(op, atol=1e-12):
+    """
+    Returns the diagonal of a gate whose matrix is diagonal, None otherwise.
+    """
+    matrix = gate_matrix(op)
+    if matrix is None or not np.allclose(matrix, np.diag(np.diag(matrix)), rtol=0, atol=atol):
+        return None
+    return np.diag(matrix).copy()
+
+
+def _expand(diagonal, qubits, span):
+    # The diagonal acting on qubits, as a diagonal acting on the span qubits
+    tensor = diagonal.reshape((2,) * len(qubits))
+    order = sorted(range(len(qubits)), key=lambda i: span.index(qubits[i]))
+    tensor = tensor.transpose(order)
+    shape = [2 if q in qubits else 1 for q in span]
+    return np.broadcast_to(tensor.reshape(shape), (2,) * len(span)).reshape(-1)
+
+
+def fuse_diagonals(circuit, max_qubits=2):
+    """
+    Merges the diagonal gates of a circuit into diagonal GateCustom on at most
+    max_qubits qubits.
+
+    Diagonal gates commute with each other, so a diagonal gate is held back
+    until a non-diagonal operation touches one of its qubits, and every held
+    gate acting on the same qubits (or on a subset of them) is folded into it.
+    Operations reading the whole state without acting on qubits (`Amplitude`)
+    release every held gate.
+    Cost layers of QAOA circuits and the controlled phases of phase estimation
+    then cost one pass over the statevector per qubit pair instead of one per
+    gate.
+
+    Args:
+        circuit (MimiqCircuit): The circuit to fuse, already decomposed.
+        max_qubits (int): The maximum number of qubits of a fused diagonal.
+
+    Returns:
+        MimiqCircuit: The fused circuit, equivalent to the input one.
+    """
+    fused = mc.Circuit()
+    # Sorted qubits -> (diagonal on those qubits, instructions folded into it)
+    pending = {}
+
+    def emit(key):
+        diagonal, instructions = pending.pop(key)
+        if len(instructions) == 1:
+            fused.push(instructions[0])
+        else:
+            fused.push(mc.GateCustom(np.diag(diagonal)), *key)
+
+    for inst in circuit:
+        if _reads_whole_state(inst):
+            for key in list(pending):
+                emit(key)
+            fused.push(inst)
+            continue
+
+        qubits = list(inst.get_qubits())
+        diagonal = None
+        if isinstance(inst.get_operation(), mc.Gate):
+            diagonal = gate_diagonal(inst.get_operation())
+
+        if diagonal is None:
+            for key in [k for k in pending if not set(k).isdisjoint(qubits)]:
+                emit(key)
+            fused.push(inst)
+            continue
+
+        if len(qubits) > max_qubits:
+            # Commutes with every held diagonal, it can be applied right away
+            fused.push(inst)
+            continue
+
+        touched = [k for k in pending if not set(k).isdisjoint(qubits)]
+        span = sorted(set(qubits).union(*touched))
+        if len(span) > max_qubits:
+            # Only the held diagonals within the qubits of this gate still fold in
+            inside = [k for k in touched if set(k) <= set(qubits)]
+            for key in touched:
+                if key not in inside:
+                    emit(key)
+            touched = inside
+            span = sorted(qubits)
+
+        merged = _expand(diagonal, qubits, span)
+        instructions = []
+        for key in touched:
+            held, held_instructions = pending.pop(key)
+            merged = merged * _expand(held, list(key), span)
+            instructions += held_instructions
+        pending[tuple(span)] = (merged, instructions + [inst])
+
+    for key in list(pending):
+        emit(key)
+    return fused
+
+
+def count_sweeps(circuit):
+    """
+    Returns the number of operations of a circuit acting on the quantum state,
+    each being one pass over the 2^n amplitudes.
+    """
+    return sum(1 for inst in circuit if inst.num_qubits() > 0)
@@ -0,0 +1,148 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+"""
+Relabeling of qubits to keep the most used ones in low-order positions.
+
+A gate on qubit j pairs amplitudes 2^j apart in the statevector. Once the
+state is larger than the caches, gates on high qubits stream the whole vector
+from memory with a large stride, while gates on the low `local_qubits` qubits
+work on blocks that stay cache-resident. A permutation maps every logical
+qubit of a circuit to a physical position, physical[logical] = position.
+"""
+import numpy as np
+import mimiqcircuits as mc
+
+# 2^16 complex128 amplitudes fill 1 MiB, about the size of a per-core L2 cache
+LOCAL_QUBITS = 16
+
+
+def _usage(circuit, numqubits):
+    usage = np.zeros(numqubits, dtype=np.int64)
+    for inst in circuit:
+        for q in inst.get_qubits():
+            usage[q] += 1
+    return usage
+
+
+def _cost(usage, permutation, local_qubits):
+    # Number of qubit operands landing outside of the cache-local positions
+    return int(sum(count for q, count in enumerate(usage) if permutation[q] >= local_qubits))
+
+
+def _holds_amplitude(op):
+    # Amplitudes nested in blocks or wrappers, which `relabel` does not reach
+    if isinstance(op, mc.Block):
+        return any(
+            isinstance(inst.get_operation(), mc.Amplitude) or _holds_amplitude(inst.get_operation())
+            for inst in op.instructions
+        )
+    inner = getattr(op, "op", None)
+    return inner is not None and (isinstance(inner, mc.Amplitude) or _holds_amplitude(inner))
+
+
+def locality_permutation(circuit, local_qubits=LOCAL_QUBITS):
+    """
+    Returns the permutation placing the most used qubits of circuit in low-order
+    positions, or None when it would not reduce the number of operations on
+    non-local qubits, or when circuit holds an Amplitude nested in a block or
+    a wrapper.
+
+    Args:
+        circuit (MimiqCircuit): The circuit to analyse.
+        local_qubits (int): The number of low-order qubits considered cache-local.
+
+    Returns:
+        list or None: The physical position of every logical qubit.
+    """
+    numqubits = circuit.num_qubits()
+    if numqubits <= local_qubits:
+        return None
+    if any(_holds_amplitude(inst.get_operation()) for inst in circuit):
+        return None
+
+    usage = _usage(circuit, numqubits)
+    # Stable sort: equally used qubits keep their relative order
+    order = np.argsort(-usage, kind="stable")
+    permutation = [0] * numqubits
+    for position, q in enumerate(order):
+        permutation[int(q)] = position
+
+    identity = list(range(numqubits))
+    if _cost(usage, permutation, local_qubits) >= _cost(usage, identity, local_qubits):
+        return None
+    return permutation
+
+
+def relabel(circuit, permutation):
+    """
+    Returns circuit with every logical qubit q moved to permutation[q],
+    including the qubits of the bitstrings of Amplitude operations.
+    """
+    relabeled = mc.Circuit()
+    for inst in circuit:
+        op = inst.get_operation()
+        if isinstance(op, mc.Amplitude):
+            op = mc.Amplitude(to_physical_bitstrings([op.bs], permutation)[0])
+        relabeled.push(
+            mc.Instruction(
+                op,
+                tuple(permutation[q] for q in inst.get_qubits()),
+                inst.get_bits(),
+                inst.get_zvars(),
+            )
+        )
+    return relabeled
+
+
+def to_physical_bitstrings(bitstrings, permutation):
+    """
+    Maps bitstrings over logical qubits, in any format accepted by `execute`,
+    to the physical qubits.
+    """
+    numqubits = len(permutation)
+    if isinstance(bitstrings, np.ndarray):
+        if bitstrings.ndim == 2:
+            physical = np.zeros((len(bitstrings), numqubits), dtype=bitstrings.dtype)
+            physical[:, permutation[: bitstrings.shape[1]]] = bitstrings
+            return physical
+        indices = bitstrings.astype(np.uint64)
+        physical = np.zeros_like(indices)
+        for q, position in enumerate(permutation):
+            physical |= ((indices >> np.uint64(q)) & np.uint64(1)) << np.uint64(position)
+        return physical
+
+    converted = []
+    for bitstring in bitstrings:
+        logical = bitstring.to01().ljust(numqubits, "0")
+        physical = ["0"] * numqubits
+        for q, position in enumerate(permutation):
+            physical[position] = logical[q]
+        converted.append(mc.BitString("".join(physical)))
+    return converted
+
+
+def to_logical_amplitudes(amplitudes, permutation):
+    """
+    Maps the keys of a results amplitudes dictionary back to logical qubits.
+    """
+    logical = {}
+    for bitstring, amplitude in amplitudes.items():
+        physical = bitstring.to01()
+        logical[mc.BitString("".join(physical[p] for p in permutation))] = amplitude
+    return logical
+
+
+def to_logical_statevector(statevector, permutation):
+    """
+    Returns statevector, indexed by physical qubits, indexed by logical qubits.
+    """
+    n = len(permutation)
+    # Axis k of the tensor holds qubit n - 1 - k
+    tensor = statevector.reshape((2,) * n)
+    axes = [0] * n
+    for q, position in enumerate(permutation):
+        axes[n - 1 - q] = n - 1 - position
+    return np.ascontiguousarray(tensor.transpose(axes)).reshape(-1)
@@ -0,0 +1,292 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+"""
+Out-of-core statevectors, whose amplitudes live in a memory-mapped file.
+
+Only one chunk of 2^chunk_qubits amplitudes is held in memory at a time. The
+gates of a circuit are grouped into stages acting on at most chunk_qubits
+qubits; for each stage, the qubits it acts on are gathered into the chunk
+index, the file is streamed once, chunk by chunk, and every gate of the stage
+is applied to each chunk before it is written back.
+"""
+import numpy as np
+import mimiqcircuits as mc
+
+from .checkpoint import create_state
+from .fusion import gate_matrix
+from .sampling import measured_bitstrings
+
+# Chunk size used when the available memory cannot be determined
+CHUNK_QUBITS = 24
+
+
+def default_chunk_qubits(numqubits, itemsize, available):
+    """
+    Returns the number of qubits of the largest chunk taking at most a quarter
+    of the available memory, leaving room for the page cache of the file.
+
+    Args:
+        numqubits (int): The number of qubits of the state.
+        itemsize (int): The size of an amplitude in bytes.
+        available (int): The available memory in bytes, or None if unknown.
+    """
+    if available is None:
+        return min(numqubits, CHUNK_QUBITS)
+    chunk_qubits = (available // (4 * itemsize)).bit_length() - 1
+    return max(min(numqubits, chunk_qubits), min(numqubits, 2))
+
+
+def unitary_gates(circuit):
+    """
+    Yields the (matrix, qubits) pairs of the gates of a circuit, decomposing
+    the gates acting on more than 2 qubits. Barriers are skipped.
+
+    Raises:
+        ValueError: If the circuit holds non-unitary operations.
+    """
+    for inst in circuit:
+        op = inst.get_operation()
+        if isinstance(op, mc.Barrier):
+            continue
+        if not isinstance(op, mc.Gate):
+            raise ValueError(f"{op} is not supported by the out-of-core storage")
+
+        qubits = list(inst.get_qubits())
+        matrix = gate_matrix(op) if len(qubits) <= 2 else None
+        if matrix is not None:
+            yield matrix, qubits
+            continue
+
+        decomposed = list(inst.decompose())
+        if len(decomposed) == 1 and decomposed[0].get_operation() == op:
+            raise ValueError(f"{op} cannot be decomposed into 1- and 2-qubit gates")
+        yield from unitary_gates(decomposed)
+
+
+class Stage:
+    """
+    Gates applied in a single pass over the file, all acting on the qubits
+    gathered into the chunk index.
+    """
+
+    def __init__(self):
+        self.qubits = set()
+        self.matrices = []
+        self.targets = []
+
+    def __len__(self):
+        return len(self.matrices)
+
+    def add(self, matrix, qubits):
+        self.qubits.update(qubits)
+        self.matrices.append(matrix)
+        self.targets.append(list(qubits))
+
+
+def schedule(gates, chunk_qubits):
+    """
+    Groups gates into stages acting on at most chunk_qubits qubits, so the
+    file is read and written once per stage rather than once per gate.
+
+    Gates are taken in order. A gate that would take its stage beyond
+    chunk_qubits qubits is deferred to a later stage, with every following
+    gate sharing a qubit with a deferred one; the other gates commute with
+    the deferred ones and still join the stage.
+
+    Args:
+        gates (iterable): The (matrix, qubits) pairs, see `unitary_gates`.
+        chunk_qubits (int): The number of qubits of the in-memory chunk, at least 2.
+
+    Returns:
+        list[Stage]: The stages, in execution order.
+    """
+    pending = list(gates)
+    stages = []
+    while pending:
+        stage = Stage()
+        deferred = []
+        blocked = set()
+        for matrix, qubits in pending:
+            if len(stage) > 0 and (
+                blocked.intersection(qubits) or len(stage.qubits.union(qubits)) > chunk_qubits
+            ):
+                deferred.append((matrix, qubits))
+                blocked.update(qubits)
+            else:
+                stage.add(matrix, qubits)
+        stages.append(stage)
+        pending = deferred
+    return stages
+
+
+class MappedStateVector:
+    """
+    A statevector whose amplitudes live in a memory-mapped file.
+
+    The file is a checkpoint without classical states (see
+    `quantanium.checkpoint`), which `Quantanium.load_state` can read back. The
+    class follows the interface of the engine statevectors used by
+    `Quantanium` (numqubits, zerostate, get_cstates and the array protocol).
+    """
+
+    def __init__(self, path, numqubits, precision="double", chunk_qubits=CHUNK_QUBITS):
+        """
+        Creates the file holding the |0...0> state.
+
+        Args:
+            path (str): The file backing the amplitudes, replaced if it exists.
+            numqubits (int): The number of qubits of the state.
+            precision (str): "double" (complex128) or "single" (complex64).
+            chunk_qubits (int): The number of qubits of the in-memory chunk.
+        """
+        dtype = np.complex64 if precision == "single" else np.complex128
+        self.path = path
+        self.chunk_qubits = min(chunk_qubits, numqubits)
+        self._amplitudes = create_state(path, numqubits, dtype)
+        self._cstates = []
+
+    def numqubits(self):
+        return self._amplitudes.size.bit_length() - 1
+
+    def get_cstates(self):
+        return self._cstates
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self._amplitudes, dtype=dtype)
+
+    def _chunks(self):
+        chunk = 2**self.chunk_qubits
+        for start in range(0, self._amplitudes.size, chunk):
+            yield self._amplitudes[start:start + chunk]
+
+    def zerostate(self):
+        """
+        Resets the state to |0...0>.
+        """
+        for chunk in self._chunks():
+            chunk[:] = 0
+        self._amplitudes[0] = 1
+        self._amplitudes.flush()
+
+    def load(self, amplitudes, cstates=()):
+        """
+        Copies amplitudes of the same size, typically a mapped checkpoint,
+        into the file, chunk by chunk, along with their classical states.
+        """
+        if len(amplitudes) != self._amplitudes.size:
+            raise ValueError("amplitudes do not match the number of qubits of the state")
+        start = 0
+        for chunk in self._chunks():
+            chunk[:] = amplitudes[start:start + chunk.size]
+            start += chunk.size
+        self._amplitudes.flush()
+        self._cstates = list(cstates)
+
+    def apply(self, stages, kernel, num_threads=0):
+        """
+        Applies stages of gates, one pass over the file per stage.
+
+        Args:
+            stages (list[Stage]): The stages, see `schedule`.
+            kernel: The native function applying gates to an in-memory chunk,
+                `apply_gates` or `apply_gates_float`.
+            num_threads (int): Number of threads of the kernel, 0 for all.
+        """
+        for stage in stages:
+            if len(stage) > 0:
+                self._apply_stage(stage, kernel, num_threads)
+        self._amplitudes.flush()
+
+    def _apply_stage(self, stage, kernel, num_threads):
+        numqubits = self.numqubits()
+
+        # The chunk index holds the stage qubits, completed by the lowest ones
+        # so that the chunk is read in the longest contiguous runs
+        local = set(stage.qubits)
+        for qubit in range(numqubits):
+            if len(local) >= self.chunk_qubits:
+                break
+            local.add(qubit)
+        position = {qubit: index for index, qubit in enumerate(sorted(local))}
+        targets = [[position[q] for q in qubits] for qubits in stage.targets]
+
+        # Consecutive qubits of the same kind, from the most significant one,
+        # become one axis of the file; local axes are kept whole in the chunk
+        shape, is_local = [], []
+        for qubit in reversed(range(numqubits)):
+            if is_local and is_local[-1] == (qubit in position):
+                shape[-1] *= 2
+            else:
+                shape.append(2)
+                is_local.append(qubit in position)
+        view = self._amplitudes.reshape(shape)
+        outer_shape = [size for size, kept in zip(shape, is_local) if not kept]
+        buffer = np.empty(
+            [size for size, kept in zip(shape, is_local) if kept], dtype=self._amplitudes.dtype
+        )
+
+        # The last outer axis varies fastest, the file is walked in order
+        for outer in np.ndindex(*outer_shape):
+            digits = iter(outer)
+            block = view[tuple(slice(None) if kept else next(digits) for kept in is_local)]
+            np.copyto(buffer, block)
+            kernel(buffer.reshape(-1), stage.matrices, targets, num_threads)
+            block[...] = buffer
+
+
+class MappedSampler:
+    """
+    Draws basis states from a mapped statevector, streaming it chunk by chunk.
+
+    The probability of each chunk is computed once. Each batch of draws is
+    then resolved by reading only the chunks that were drawn, so the
+    cumulative probabilities of the whole state are never held in memory.
+    """
+
+    def __init__(self, state, measures, numbits):
+        """
+        Args:
+            state (MappedStateVector): The final state, kept mapped by the sampler.
+            measures (list): The (qubit, bit) pairs of the terminal measurements.
+            numbits (int): The number of classical bits of the circuit.
+        """
+        self._amplitudes = state._amplitudes
+        self._chunk = 2**state.chunk_qubits
+        self._cdf = np.cumsum(
+            [np.vdot(chunk, chunk).real for chunk in state._chunks()], dtype=np.float64
+        )
+        self.measures = list(measures)
+        self.numbits = numbits
+
+    def sample_indices(self, nsamples, seed=None):
+        """
+        Returns:
+            numpy.ndarray: nsamples basis indices drawn from the state.
+        """
+        rng = np.random.default_rng(seed)
+        draws = rng.random(nsamples) * self._cdf[-1]
+        chunks = np.minimum(np.searchsorted(self._cdf, draws, side="right"), len(self._cdf) - 1)
+
+        indices = np.empty(nsamples, dtype=np.uint64)
+        order = np.argsort(chunks, kind="stable")
+        drawn, starts = np.unique(chunks[order], return_index=True)
+        for c, first, last in zip(drawn, starts, list(starts[1:]) + [nsamples]):
+            selected = order[first:last]
+            amplitudes = self._amplitudes[c * self._chunk:(c + 1) * self._chunk]
+            cdf = np.cumsum(np.abs(amplitudes) ** 2, dtype=np.float64)
+            cdf += self._cdf[c - 1] if c > 0 else 0.0
+            local = np.searchsorted(cdf, draws[selected], side="right")
+            indices[selected] = c * self._chunk + np.minimum(local, len(cdf) - 1)
+        return indices
+
+    def sample(self, nsamples, seed=None):
+        """
+        Draws nsamples classical states, as the terminal measurements would.
+
+        Returns:
+            list[mimiqcircuits.BitString]: One classical state per sample.
+        """
+        return measured_bitstrings(self.sample_indices(nsamples, seed), self.measures, self.numbits)
@@ -0,0 +1,146 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+import io
+
+import numpy as np
+import mimiqcircuits as mc
+
+
+def sampling_plan(circuit):
+    """
+    Splits a circuit into its unitary part and its terminal measurements.
+
+    A circuit can be resampled from a single final state when it only holds
+    gates and `Measure` operations, and no gate acts on a qubit after it has
+    been measured.
+
+    Args:
+        circuit (MimiqCircuit): The circuit to analyse.
+
+    Returns:
+        tuple or None: (unitary circuit, list of (qubit, bit) measurements), or
+        None if the circuit has mid-circuit measurements or non-unitary operations.
+    """
+    prefix = mc.Circuit()
+    measures = []
+    measured = set()
+    for inst in circuit:
+        op = inst.get_operation()
+        if isinstance(op, mc.Measure):
+            qubit, bit = inst.get_qubits()[0], inst.get_bits()[0]
+            measures.append((qubit, bit))
+            measured.add(qubit)
+        elif isinstance(op, mc.Barrier):
+            continue
+        elif isinstance(op, mc.Gate) and measured.isdisjoint(inst.get_qubits()):
+            prefix.push(inst)
+        else:
+            return None
+    return prefix, measures
+
+
+def measured_bitstrings(indices, measures, numbits):
+    """
+    Converts sampled basis indices into the classical states the terminal
+    measurements would produce.
+
+    Args:
+        indices (numpy.ndarray): The sampled basis indices, bit j being qubit j.
+        measures (list): The (qubit, bit) pairs of the terminal measurements.
+        numbits (int): The number of classical bits of the circuit.
+
+    Returns:
+        list[mimiqcircuits.BitString]: One classical state per index.
+    """
+    indices = np.asarray(indices, dtype=np.uint64)
+    unique, inverse = np.unique(indices, return_inverse=True)
+
+    bits = np.zeros((len(unique), numbits), dtype=np.uint8)
+    for qubit, bit in measures:
+        bits[:, bit] = (unique >> np.uint64(qubit)) & np.uint64(1)
+
+    # Build one BitString per distinct outcome and share it across samples
+    outcomes = [mc.BitString(row.tobytes().decode()) for row in bits + ord("0")]
+    return [outcomes[i] for i in inverse.ravel()]
+
+
+class StateSampler:
+    """
+    Draws basis states from the probability vector of a final state.
+
+    The cumulative sum of the probabilities is computed once, each draw is
+    then a binary search, so sampling costs O(nsamples log 2^n) whatever the
+    circuit depth.
+    """
+
+    def __init__(self, amplitudes, measures, numbits):
+        """
+        Args:
+            amplitudes (numpy.ndarray): The final state, bit j of an index being qubit j.
+            measures (list): The (qubit, bit) pairs of the terminal measurements.
+            numbits (int): The number of classical bits of the circuit.
+        """
+        self._cdf = np.cumsum(np.abs(amplitudes) ** 2, dtype=np.float64)
+        self.measures = list(measures)
+        self.numbits = numbits
+
+    def sample_indices(self, nsamples, seed=None):
+        """
+        Returns:
+            numpy.ndarray: nsamples basis indices drawn from the state.
+        """
+        rng = np.random.default_rng(seed)
+        draws = rng.random(nsamples) * self._cdf[-1]
+        indices = np.searchsorted(self._cdf, draws, side="right")
+        return np.minimum(indices, len(self._cdf) - 1).astype(np.uint64)
+
+    def sample(self, nsamples, seed=None):
+        """
+        Draws nsamples classical states, as the terminal measurements would.
+
+        Returns:
+            list[mimiqcircuits.BitString]: One classical state per sample.
+        """
+        indices = self.sample_indices(nsamples, seed)
+        return measured_bitstrings(indices, self.measures, self.numbits)
+
+
+class FinalState:
+    """
+    The unitary part of an executed circuit, with its sampler once simulated.
+    """
+
+    def __init__(self, prefix, measures, numbits, result):
+        """
+        Args:
+            prefix (MimiqCircuit): The circuit without its terminal measurements.
+            measures (list): The (qubit, bit) pairs of the terminal measurements.
+            numbits (int): The number of classical bits of the circuit.
+            result (QCSResults): The results of the execution, whose metadata is
+                reported by resampled results.
+        """
+        self.prefix = prefix
+        self.measures = measures
+        self.numbits = numbits
+        self.result = result
+        self.sampler = None
+        self._held_nbytes = None
+
+    @property
+    def nbytes(self):
+        """
+        The memory held by the state: the serialized size of its prefix and of
+        its results, plus the probability vector of its sampler once simulated.
+        """
+        if self._held_nbytes is None:
+            self._held_nbytes = _serialized_size(self.prefix) + _serialized_size(self.result)
+        return self._held_nbytes + (self.sampler._cdf.nbytes if self.sampler is not None else 0)
+
+
+def _serialized_size(obj):
+    buffer = io.BytesIO()
+    obj.saveproto(buffer)
+    return buffer.tell()
@@ -0,0 +1,80 @@
+#
+# Copyright © 2023-2024, QPerfect. All rights reserved.
+# Unauthorized copying of this file, via any medium is strictly prohibited.
+# Proprietary and confidential.
+#
+import time
+from ._core import SimulatorSessionDoubleCPU, SimulatorSessionFloatCPU, place_statevector
+from .Quantanium import _statevector_view
+
+
+class Session:
+    """
+    A simulator keeping one preallocated statevector between executions.
+
+    The 2^n amplitudes are allocated once, when the session is created, and
+    reset to |0...0> before each execution. Any circuit of up to `numqubits`
+    qubits can then be executed without reallocating, page faulting and
+    zeroing a fresh state. Instances are obtained from `Quantanium.session`.
+    """
+
+    def __init__(self, engine, numqubits: int):
+        """
+        Args:
+            engine (Quantanium): The engine used to convert circuits and results.
+            numqubits (int): The number of qubits of the preallocated statevector.
+        """
+        self._engine = engine
+        engine._configure_native()
+        if engine.precision == "single":
+            self._native = SimulatorSessionFloatCPU(numqubits)
+        else:
+            self._native = SimulatorSessionDoubleCPU(numqubits)
+        if engine.numa != "none":
+            place_statevector(self._native.statevector(), engine.num_threads)
+
+    @property
+    def numqubits(self) -> int:
+        return self._native.numqubits()
+
+    def execute(self, circuit, nsamples=1000, seed=None):
+        """
+        Execute a circuit on the session statevector.
+
+        Args:
+            circuit: MimiqCircuit, Circuit or str, of at most `numqubits` qubits.
+            nsamples (int): The number of samples to generate.
+            seed (int): The seed for generating random numbers (default = time.time()).
+
+        Returns:
+            QCSResults: The result of the execution.
+        """
+        qua_circuit = self._engine._to_qua_circuit(circuit)
+        if qua_circuit.numqubits() > self.numqubits:
+            raise ValueError(
+                f"circuit has {qua_circuit.numqubits()} qubits, "
+                f"the session holds {self.numqubits}"
+            )
+
+        if seed is None:
+            seed = int(time.time())
+
+        try:
+            self._engine._configure_native()
+            qua_result = self._native.execute(qua_circuit, nsamples, seed)
+        except Exception as e:
+            raise Exception(f"Error executing the Circuit: {e}")
+
+        return self._engine.convert_qua_results_to_mimiq_results(qua_result)
+
+    def get_statevector_view(self):
+        """
+        Returns a writable view on the session statevector after the last execution.
+
+        Returns:
+            numpy.ndarray: The 2^numqubits amplitudes, sharing the session memory.
+
+        Raises:
+            RuntimeError: If the engine build does not expose the statevector memory.
+        """
+        return _statevector_view(self._native.statevector())
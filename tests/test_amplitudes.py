@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from bitarray import bitarray
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestAmplitudes(unittest.TestCase):
+    """
+    Unit tests for the amplitude requests given as lists or NumPy arrays.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+        self.circuit = Circuit()
+        self.circuit.push(GateH(), 0)
+        self.circuit.push(GateCX(), 0, 1)
+        self.circuit.push(GateX(), 2)
+        self.expected = {"001": 1 / np.sqrt(2), "111": 1 / np.sqrt(2)}
+
+    def _expected(self, bitstrings):
+        return np.array([self.expected.get(b, 0.0) for b in bitstrings])
+
+    def test_bit_array(self):
+        bitstrings = ["001", "111", "000", "101"]
+        bits = np.array([[int(c) for c in b] for b in bitstrings], dtype=np.uint8)
+        self.processor.execute(self.circuit, nsamples=1, seed=1, bitstrings=bits)
+
+        amplitudes = self.processor.get_amplitudes()
+        self.assertEqual(amplitudes.dtype, np.complex128)
+        np.testing.assert_allclose(amplitudes, self._expected(bitstrings), atol=1e-12)
+
+    def test_bool_array_matches_bitarrays(self):
+        bitstrings = ["001", "111", "010"]
+        bits = np.array([[c == "1" for c in b] for b in bitstrings])
+        self.processor.execute(self.circuit, nsamples=1, seed=1, bitstrings=bits)
+        from_array = self.processor.get_amplitudes()
+
+        self.processor.execute(
+            self.circuit, nsamples=1, seed=1,
+            bitstrings=[bitarray(b) for b in bitstrings])
+        np.testing.assert_allclose(from_array, self.processor.get_amplitudes())
+
+    def test_index_array(self):
+        # Bit j of the index is qubit j: 0b100 is "001", 0b111 is "111"
+        indices = np.array([0b100, 0b111, 0b000], dtype=np.int64)
+        self.processor.execute(self.circuit, nsamples=1, seed=1, bitstrings=indices)
+        np.testing.assert_allclose(
+            self.processor.get_amplitudes(),
+            self._expected(["001", "111", "000"]), atol=1e-12)
+
+    def test_bit_array_width_must_match(self):
+        bits = np.zeros((2, 4), dtype=np.uint8)
+        with self.assertRaises(Exception):
+            self.processor.execute(self.circuit, nsamples=1, seed=1, bitstrings=bits)
+
+    def test_index_array_limited_to_64_qubits(self):
+        circuit = Circuit()
+        circuit.push(GateH(), range(65))
+        with self.assertRaises(Exception):
+            self.processor.execute(
+                circuit, nsamples=1, seed=1, bitstrings=np.array([1], dtype=np.uint64))
+
+    def test_amplitudes_require_bitstrings(self):
+        self.processor.execute(self.circuit, nsamples=1, seed=1)
+        with self.assertRaises(RuntimeError):
+            self.processor.get_amplitudes()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from quantanium._core import BitVector, pack_bitvectors
+
+
+class TestBitVectorPacking(unittest.TestCase):
+    """
+    Unit tests for the packed NumPy export of BitVector.
+    """
+
+    def test_to_numpy_uint8(self):
+        bv = BitVector("1011000011")
+        packed = bv.to_numpy()
+
+        self.assertEqual(len(bv), 10)
+        self.assertEqual(packed.dtype, np.uint8)
+        self.assertEqual(packed.shape, (2,))
+        np.testing.assert_array_equal(
+            np.unpackbits(packed, count=10, bitorder="little"),
+            [1, 0, 1, 1, 0, 0, 0, 0, 1, 1])
+
+    def test_to_numpy_uint64(self):
+        packed = BitVector("1" * 70).to_numpy(word_bits=64)
+        self.assertEqual(packed.dtype, np.uint64)
+        self.assertEqual(packed.shape, (2,))
+        self.assertEqual(int(packed[0]), 2**64 - 1)
+        self.assertEqual(int(packed[1]), 2**6 - 1)
+
+    def test_pack_bitvectors_counts_with_unique(self):
+        bvs = [BitVector(s) for s in ("01", "11", "01", "01")]
+        packed = pack_bitvectors(bvs)
+
+        self.assertEqual(packed.shape, (4, 1))
+        rows, counts = np.unique(packed, axis=0, return_counts=True)
+        self.assertEqual(sorted(counts.tolist()), [1, 3])
+
+    def test_invalid_word_size(self):
+        with self.assertRaises(ValueError):
+            BitVector("01").to_numpy(word_bits=16)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import io
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from quantanium import _core
+from quantanium.blocking import split_blocks, LocalBlock
+from mimiqcircuits import *
+
+
+class TestBlocking(unittest.TestCase):
+    """
+    Unit tests for the cache-blocked execution mode.
+    """
+
+    def _circuit(self, n):
+        c = Circuit()
+        for q in range(n):
+            c.push(GateH(), q)
+        for layer in range(3):
+            for q in range(n):
+                c.push(GateRX(0.1 * (q + layer)), q)
+            for q in range(layer % 2, n - 1, 2):
+                c.push(GateCX(), q, q + 1)
+        return c
+
+    def test_split_blocks(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateCX(), 0, 1)
+        c.push(GateH(), 4)
+        c.push(GateX(), 1)
+        c.push(Measure(), 0, 0)
+        segments = split_blocks(c, 2)
+        self.assertIsInstance(segments[0], LocalBlock)
+        self.assertEqual(segments[0].targets, [[0], [0, 1]])
+        self.assertEqual(len(segments[1]), 3)
+
+    def test_execute_matches_unblocked(self):
+        c = self._circuit(8)
+        plain = Quantanium()
+        blocked = Quantanium(blocking=4)
+        plain.execute(c, nsamples=1, seed=1, return_statevector=True)
+        blocked.execute(c, nsamples=1, seed=1, return_statevector=True)
+        np.testing.assert_allclose(
+            blocked.get_statevector(), plain.get_statevector(), atol=1e-12
+        )
+
+    def test_execute_samples(self):
+        c = Circuit()
+        c.push(GateX(), 0)
+        c.push(GateX(), 1)
+        c.push(Measure(), range(3), range(3))
+        result = Quantanium(blocking=2).execute(c, nsamples=10, seed=1)
+        self.assertEqual(len(result.cstates), 10)
+        self.assertEqual(result.cstates[0].tolist(), [1, 1, 0])
+
+    def test_evolve_matches_unblocked(self):
+        plain = Quantanium()
+        blocked = Quantanium(blocking=3)
+        for _ in range(2):
+            expected = plain.evolve(self._circuit(6), seed=1)
+            result = blocked.evolve(self._circuit(6), seed=1)
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_failed_simulation_keeps_the_state(self):
+        state = _core.StateVectorF64_CPU(4)
+        state.zerostate()
+        # A 3-qubit custom gate is rejected by the engine, bypass the decomposition
+        c = Circuit()
+        c.push(GateCustom(np.eye(8)), 0, 1, 2)
+        buffer = io.BytesIO()
+        c.saveproto(buffer)
+        with self.assertRaises(Exception):
+            qua_circuit = _core.ProtoParser().load_proto_bytes(buffer.getvalue())
+            _core.simulate_inplace(state, qua_circuit, 1)
+
+        amplitudes = np.asarray(state)
+        self.assertEqual(len(amplitudes), 16)
+        self.assertEqual(amplitudes[0], 1)
+
+    def test_invalid_blocking(self):
+        with self.assertRaises(ValueError):
+            Quantanium(blocking=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
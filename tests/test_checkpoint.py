@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from quantanium import _core
+from mimiqcircuits import *
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Unit tests for saving and restoring the internal statevector.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "state.qua")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _layer(self, n, angle):
+        c = Circuit()
+        for q in range(n):
+            c.push(GateH(), q)
+            c.push(GateRZ(angle * (q + 1)), q)
+        for q in range(n - 1):
+            c.push(GateCX(), q, q + 1)
+        return c
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_round_trip(self):
+        processor = Quantanium()
+        expected = processor.evolve(self._layer(8, 0.1), seed=1).copy()
+        processor.save_state(self.path)
+
+        for mmap in (True, False):
+            restored = Quantanium()
+            restored.load_state(self.path, mmap=mmap)
+            np.testing.assert_array_equal(restored.get_statevector(), expected)
+            np.testing.assert_array_equal(restored.get_statevector_view(), expected)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_evolve_continues_from_loaded_state(self):
+        processor = Quantanium()
+        processor.evolve(self._layer(8, 0.1), seed=1)
+        expected = processor.evolve(self._layer(8, 0.2), seed=1).copy()
+
+        first = Quantanium()
+        first.evolve(self._layer(8, 0.1), seed=1)
+        first.save_state(self.path)
+        second = Quantanium()
+        second.load_state(self.path)
+        result = second.evolve(self._layer(8, 0.2), seed=1)
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_classical_state_is_restored(self):
+        c = Circuit()
+        c.push(GateX(), 0)
+        c.push(GateX(), 2)
+        c.push(Measure(), range(3), range(3))
+        processor = Quantanium()
+        processor.evolve(c, seed=1)
+        processor.save_state(self.path)
+
+        restored = Quantanium()
+        restored.load_state(self.path)
+        self.assertEqual(restored.get_cstate(), processor.get_cstate())
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_precision_mismatch(self):
+        processor = Quantanium(precision="single")
+        processor.evolve(self._layer(4, 0.1), seed=1)
+        processor.save_state(self.path)
+        with self.assertRaises(ValueError):
+            Quantanium().load_state(self.path)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a checkpoint")
+        with self.assertRaises(ValueError):
+            Quantanium().load_state(self.path)
+
+    @unittest.skipIf(_core.HAS_STATEVECTOR_VIEWS, "the engine exposes the statevector memory")
+    def test_load_needs_engine_support(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a checkpoint")
+        with self.assertRaises(RuntimeError):
+            Quantanium().load_state(self.path)
+
+    def test_save_without_state(self):
+        with self.assertRaises(RuntimeError):
+            Quantanium().save_state(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
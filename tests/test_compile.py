@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from symengine import symbols
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestCompile(unittest.TestCase):
+    """
+    Unit tests for Quantanium.compile and the rebinding of symbolic angles.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+        self.theta, self.phi = symbols("theta phi")
+        self.circuit = Circuit()
+        self.circuit.push(GateRX(self.theta), 0)
+        self.circuit.push(GateRZ(2 * self.phi), 1)
+        self.circuit.push(GateRY(self.phi + 0.5), 1)
+        self.circuit.push(Measure(), range(2), range(2))
+
+    def test_parameters_are_sorted_by_name(self):
+        compiled = self.processor.compile(self.circuit)
+        self.assertEqual(compiled.parameters, (self.phi, self.theta))
+
+    def test_run_matches_evaluated_circuit(self):
+        compiled = self.processor.compile(self.circuit)
+        for theta, phi in [(0.1, 0.2), (np.pi, 0.0), (1.3, -0.7)]:
+            values = {self.theta: theta, self.phi: phi}
+            result = compiled.run(values, nsamples=500, seed=3)
+            expected = self.processor.execute(
+                self.circuit.evaluate(values), nsamples=500, seed=3)
+            self.assertEqual(result.histogram(), expected.histogram())
+
+    def test_barrier_before_parametric_gate(self):
+        circuit = Circuit()
+        circuit.push(GateH(), 0)
+        circuit.push(Barrier(2), 0, 1)
+        circuit.push(GateRX(self.theta), 1)
+        circuit.push(Measure(), range(2), range(2))
+
+        compiled = self.processor.compile(circuit)
+        for theta in [0.0, np.pi, 0.4]:
+            result = compiled.run({self.theta: theta}, nsamples=500, seed=5)
+            expected = self.processor.execute(
+                circuit.evaluate({self.theta: theta}), nsamples=500, seed=5)
+            self.assertEqual(result.histogram(), expected.histogram())
+
+    def test_run_with_sequence(self):
+        compiled = self.processor.compile(self.circuit)
+        result = compiled.run([0.0, np.pi], nsamples=100, seed=1)
+        self.assertEqual(result.cstates[0].tolist()[0], 1)
+
+    def test_out_of_core_storage_is_rejected(self):
+        with tempfile.TemporaryDirectory() as directory:
+            processor = Quantanium(storage="mmap", path=os.path.join(directory, "state.qua"))
+            with self.assertRaises(ValueError):
+                processor.compile(self.circuit)
+
+    def test_missing_parameter(self):
+        compiled = self.processor.compile(self.circuit)
+        with self.assertRaises(ValueError):
+            compiled.run({self.theta: 0.1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestDecompositionCache(unittest.TestCase):
+    """
+    Unit tests for the memoized decomposition of unsupported operations.
+    """
+
+    def setUp(self):
+        self.circuit = Circuit()
+        for q in range(10):
+            self.circuit.push(GateCSWAP(), q, q + 1, q + 2)
+
+    def test_repeated_operations_hit_the_cache(self):
+        processor = Quantanium()
+        processor._decompose_mimiq(self.circuit)
+
+        stats = processor.decomposition_cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 9)
+        self.assertEqual(stats["size"], 1)
+
+    def test_cached_decomposition_matches_uncached(self):
+        cached = Quantanium()._decompose_mimiq(self.circuit)
+        uncached = Quantanium(decomposition_cache_size=0)._decompose_mimiq(self.circuit)
+
+        self.assertEqual(len(cached), len(uncached))
+        for a, b in zip(cached, uncached):
+            self.assertEqual(type(a.operation), type(b.operation))
+            self.assertEqual(a.qubits, b.qubits)
+
+    def test_wrappers_are_keyed_by_their_operation(self):
+        c = Circuit()
+        c.push(GateH(), range(4))
+        c.push(Parallel(2, GateRXX(0.3)), 0, 1, 2, 3)
+        c.push(Parallel(2, GateRYY(0.3)), 0, 1, 2, 3)
+
+        cached = Quantanium()
+        cached.execute(c, nsamples=1, seed=1, return_statevector=True)
+
+        uncached = Quantanium(decomposition_cache_size=0)
+        uncached.execute(c, nsamples=1, seed=1, return_statevector=True)
+        np.testing.assert_allclose(
+            cached.get_statevector(), uncached.get_statevector(), atol=1e-12)
+
+    def test_cache_is_bounded(self):
+        processor = Quantanium(decomposition_cache_size=2)
+        c = Circuit()
+        for theta in (0.1, 0.2, 0.3):
+            c.push(GateRXX(theta), 0, 1)
+        processor._decompose_mimiq(c)
+
+        self.assertEqual(processor.decomposition_cache_stats()["size"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
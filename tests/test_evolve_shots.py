@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestEvolveShots(unittest.TestCase):
+    """
+    Unit tests for Quantanium.evolve_shots, the native loop over trajectories.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+        self.nshots = 2000
+
+        self.prepare = Circuit()
+        self.prepare.push(GateX(), 2)
+        self.prepare.push(Measure(), 2, 0)
+
+        self.entangle = Circuit()
+        self.entangle.push(GateH(), 0)
+        self.entangle.push(GateCX(), 0, 1)
+        self.entangle.push(Measure(), 0, 1)
+        self.entangle.push(Measure(), 1, 2)
+
+    def test_histogram_over_circuit_sequence(self):
+        histogram = self.processor.evolve_shots(
+            [self.prepare, self.entangle], nshots=self.nshots, seed=1)
+
+        self.assertEqual(sum(histogram.values()), self.nshots)
+        self.assertEqual(set(histogram), {"100", "111"})
+        for count in histogram.values():
+            self.assertAlmostEqual(count / self.nshots, 0.5, delta=0.05)
+
+    def test_matches_python_loop_outcomes(self):
+        histogram = self.processor.evolve_shots(
+            [self.prepare, self.entangle], nshots=200, seed=3)
+
+        expected = set()
+        for seed in range(20):
+            processor = Quantanium()
+            processor.evolve(self.prepare, seed=2 * seed)
+            processor.evolve(self.entangle, seed=2 * seed + 1)
+            bits = np.unpackbits(
+                processor.get_cstate(packed=True)[0], count=3, bitorder="little")
+            expected.add("".join(str(b) for b in bits))
+        self.assertEqual(set(histogram), expected)
+
+    def test_register_after_last_circuit(self):
+        first = Circuit()
+        first.push(GateX(), 0)
+        first.push(Measure(), 0, 0)
+        second = Circuit()
+        second.push(GateX(), 0)
+        second.push(Measure(), 0, 0)
+        second.push(GateX(), 1)
+        second.push(Measure(), 1, 1)
+
+        # The second circuit overwrites bit 0 and sets bit 1
+        cstates = self.processor.evolve_shots(
+            [first, second], nshots=10, seed=1, return_cstates=True)
+        np.testing.assert_array_equal(cstates[:, 0], 0b10)
+        histogram = self.processor.evolve_shots([first, second], nshots=10, seed=1)
+        self.assertEqual(histogram, {"01": 10})
+
+    def test_return_cstates(self):
+        cstates = self.processor.evolve_shots(
+            self.prepare, nshots=10, seed=1, return_cstates=True)
+        self.assertEqual(cstates.shape, (10, 1))
+        self.assertEqual(cstates.dtype, np.uint8)
+        np.testing.assert_array_equal(cstates[:, 0], 1)
+
+    def test_circuit_without_classical_bits(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        cstates = self.processor.evolve_shots(c, nshots=10, seed=1, return_cstates=True)
+        self.assertEqual(cstates.shape, (10, 0))
+        self.assertEqual(self.processor.evolve_shots(c, nshots=10, seed=1), {"": 10})
+
+    def test_single_thread_is_deterministic(self):
+        a = self.processor.evolve_shots(
+            self.entangle, nshots=100, seed=5, num_threads=1, return_cstates=True)
+        b = self.processor.evolve_shots(
+            self.entangle, nshots=100, seed=5, num_threads=4, return_cstates=True)
+        np.testing.assert_array_equal(a, b)
+
+
+if __name__ == "__main__":
+    unittest.main()
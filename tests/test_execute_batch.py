@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestExecuteBatch(unittest.TestCase):
+    """
+    Unit tests for Quantanium.execute_batch, checked against Quantanium.execute.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+        self.nsamples = 200
+        self.circuits = []
+        for n in range(1, 5):
+            c = Circuit()
+            c.push(GateH(), 0)
+            c.push(GateCX(), 0, range(1, n + 1))
+            c.push(Measure(), range(n + 1), range(n + 1))
+            self.circuits.append(c)
+
+    def test_batch_matches_sequential_execution(self):
+        seeds = [11, 12, 13, 14]
+        batch = self.processor.execute_batch(
+            self.circuits, nsamples=self.nsamples, seeds=seeds)
+
+        self.assertEqual(len(batch), len(self.circuits))
+        for circuit, seed, result in zip(self.circuits, seeds, batch):
+            expected = self.processor.execute(
+                circuit, nsamples=self.nsamples, seed=seed)
+            self.assertEqual(result.histogram(), expected.histogram())
+
+    def test_base_seed_is_offset_per_circuit(self):
+        batch = self.processor.execute_batch(
+            self.circuits, nsamples=self.nsamples, seeds=5)
+        expected = self.processor.execute(
+            self.circuits[2], nsamples=self.nsamples, seed=7)
+        self.assertEqual(batch[2].histogram(), expected.histogram())
+
+    def test_numpy_base_seed(self):
+        batch = self.processor.execute_batch(
+            self.circuits, nsamples=self.nsamples, seeds=np.int64(5))
+        expected = self.processor.execute_batch(
+            self.circuits, nsamples=self.nsamples, seeds=5)
+        for result, other in zip(batch, expected):
+            self.assertEqual(result.histogram(), other.histogram())
+
+    def test_seed_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.processor.execute_batch(self.circuits, seeds=[1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
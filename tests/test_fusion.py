@@ -0,0 +1,139 @@
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from quantanium.fusion import fuse_gates, fuse_diagonals, count_sweeps
+from mimiqcircuits import *
+
+
+class TestFusion(unittest.TestCase):
+    """
+    Unit tests for the gate fusion pass.
+    """
+
+    def _circuit(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateRX(0.3), 0)
+        c.push(GateCX(), 0, 1)
+        c.push(GateRZ(0.7), 1)
+        c.push(GateCX(), 1, 2)
+        c.push(GateT(), 2)
+        c.push(GateU(0.1, 0.2, 0.3), 3)
+        return c
+
+    def test_consecutive_gates_are_merged(self):
+        fused = fuse_gates(self._circuit(), 2)
+        self.assertEqual(count_sweeps(self._circuit()), 7)
+        self.assertLess(count_sweeps(fused), 7)
+        for inst in fused:
+            self.assertLessEqual(inst.num_qubits(), 2)
+
+    def test_single_qubit_fusion(self):
+        fused = fuse_gates(self._circuit(), 1)
+        self.assertEqual(count_sweeps(fused), 6)
+
+    def test_measurements_close_blocks(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(Measure(), 0, 0)
+        c.push(GateH(), 0)
+        fused = fuse_gates(c, 2)
+        self.assertEqual(count_sweeps(fused), 3)
+
+    def test_fused_statevector_matches(self):
+        expected = Quantanium()
+        fused = Quantanium(fusion=2)
+        expected.execute(self._circuit(), nsamples=1, seed=1, return_statevector=True)
+        fused.execute(self._circuit(), nsamples=1, seed=1, return_statevector=True)
+        np.testing.assert_allclose(
+            fused.get_statevector(), expected.get_statevector(), atol=1e-12
+        )
+        stats = fused.fusion_stats()
+        self.assertLess(stats["sweeps_after"], stats["sweeps_before"])
+
+    def test_amplitude_closes_blocks(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateCX(), 0, 1)
+        c.push(Amplitude(BitString("11")), 0)
+        c.push(GateH(), 0)
+        fused = fuse_gates(c, 2)
+        # The amplitude is read after the gates preceding it, not before
+        self.assertEqual(len(fused), 3)
+        self.assertIsInstance(fused[1].operation, Amplitude)
+
+        expected = Quantanium().execute(c, nsamples=1, seed=1)
+        result = Quantanium(fusion=2).execute(c, nsamples=1, seed=1)
+        self.assertEqual(result.zstates, expected.zstates)
+
+    def test_invalid_fusion(self):
+        with self.assertRaises(ValueError):
+            Quantanium(fusion=3)
+
+
+class TestDiagonalFusion(unittest.TestCase):
+    """
+    Unit tests for the fusion of diagonal gates.
+    """
+
+    def _cost_layer(self, n):
+        c = Circuit()
+        for q in range(n):
+            c.push(GateH(), q)
+        for q in range(n):
+            c.push(GateRZ(0.1 * q), q)
+        for q in range(n - 1):
+            c.push(GateCP(0.2 * q), q, q + 1)
+            c.push(GateCZ(), q, q + 1)
+        for q in range(n):
+            c.push(GateRX(0.4), q)
+        return c
+
+    def test_amplitude_releases_held_diagonals(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateRZ(0.3), 0)
+        c.push(Amplitude(BitString("1")), 0)
+        c.push(GateRZ(0.5), 0)
+        fused = fuse_diagonals(c, 2)
+        self.assertEqual(len(fused), 4)
+        self.assertIsInstance(fused[2].operation, Amplitude)
+
+        expected = Quantanium().execute(c, nsamples=1, seed=1)
+        result = Quantanium(fusion=2).execute(c, nsamples=1, seed=1)
+        self.assertEqual(result.zstates, expected.zstates)
+
+    def test_diagonal_runs_are_merged(self):
+        c = self._cost_layer(4)
+        fused = fuse_diagonals(c, 2)
+        # H and RX layers are kept, the diagonals fold into one gate per pair
+        self.assertEqual(count_sweeps(fused), 4 + 3 + 4)
+
+    def test_diagonals_commute_across_wider_diagonals(self):
+        c = Circuit()
+        c.push(GateT(), 0)
+        c.push(GateCZ(), 0, 1)
+        c.push(GateS(), 0)
+        fused = fuse_diagonals(c, 1)
+        self.assertEqual(count_sweeps(fused), 2)
+
+    def test_non_diagonal_gates_are_kept(self):
+        c = Circuit()
+        c.push(GateRZ(0.1), 0)
+        c.push(GateH(), 0)
+        c.push(GateRZ(0.2), 0)
+        self.assertEqual(count_sweeps(fuse_diagonals(c, 2)), 3)
+
+    def test_fused_statevector_matches(self):
+        expected = Quantanium()
+        fused = Quantanium(fusion=2)
+        c = self._cost_layer(5)
+        expected.execute(c, nsamples=1, seed=1, return_statevector=True)
+        fused.execute(c, nsamples=1, seed=1, return_statevector=True)
+        np.testing.assert_allclose(
+            fused.get_statevector(), expected.get_statevector(), atol=1e-12
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
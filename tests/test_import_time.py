@@ -0,0 +1,51 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    `import quantanium` must stay cheap: the native engine, mimiqcircuits and
+    the CUDA probe are only loaded when a Quantanium instance is created.
+    """
+
+    def _run(self, code):
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_import_does_not_load_engine(self):
+        proc = self._run(
+            "import sys, quantanium\n"
+            "heavy = [m for m in ('quantanium._core', 'mimiqcircuits', 'numpy') if m in sys.modules]\n"
+            "print(','.join(heavy))"
+        )
+        self.assertEqual(proc.stdout.strip(), "")
+
+        # Report the cumulative import time of the package, in microseconds
+        for line in proc.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[2] == "quantanium":
+                print(f"import quantanium: {int(fields[1]) / 1000:.1f} ms")
+
+    def test_construction_loads_engine(self):
+        proc = self._run(
+            "import sys, quantanium\n"
+            "quantanium.Quantanium()\n"
+            "print('quantanium._core' in sys.modules, 'mimiqcircuits' in sys.modules)"
+        )
+        self.assertEqual(proc.stdout.strip(), "True True")
+
+    def test_engine_names_resolve_before_construction(self):
+        proc = self._run(
+            "from quantanium.Quantanium import QUANTANIUM_SUPPORTED_OPERATIONS, MimiqCircuit, mc\n"
+            "print(mc.GateH in QUANTANIUM_SUPPORTED_OPERATIONS, MimiqCircuit is mc.Circuit)"
+        )
+        self.assertEqual(proc.stdout.strip(), "True True")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestIsSupported(unittest.TestCase):
+    """
+    Unit tests for the per-type dispatch of Quantanium.issupported.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+
+    def test_native_operations(self):
+        for op in (GateH(), GateRX(0.1), GateCX(), Measure(), Reset()):
+            self.assertTrue(self.processor.issupported(op))
+
+    def test_wrapped_operations(self):
+        self.assertTrue(self.processor.issupported(Power(GateX(), 0.5)))
+        self.assertTrue(self.processor.issupported(Inverse(GateT())))
+        self.assertFalse(self.processor.issupported(Inverse(GateSWAP())))
+
+    def test_controlled_operations(self):
+        # Controlled gates are supported when the gate they control is
+        self.assertTrue(self.processor.issupported(GateCCX()))
+        self.assertTrue(self.processor.issupported(Control(2, GateH())))
+        self.assertFalse(self.processor.issupported(GateCSWAP()))
+
+    def test_decomposed_operations(self):
+        self.assertFalse(self.processor.issupported(GateRXX(0.1)))
+        self.assertFalse(self.processor.issupported(Power(GateSWAP(), 0.5)))
+
+    def test_unsupported_operations_raise(self):
+        with self.assertRaises(ValueError):
+            self.processor.issupported(BondDim())
+
+    def test_verdict_is_computed_once_per_type(self):
+        self.processor.issupported(GateCCX())
+        handler = Quantanium._SUPPORT_DISPATCH[GateCCX]
+        self.processor.issupported(GateCCX())
+        self.assertIs(Quantanium._SUPPORT_DISPATCH[GateCCX], handler)
+
+
+if __name__ == "__main__":
+    unittest.main()
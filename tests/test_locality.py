@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+from bitarray import bitarray
+from quantanium import Quantanium
+from quantanium.locality import locality_permutation, relabel, to_logical_statevector
+from mimiqcircuits import *
+
+
+class TestLocality(unittest.TestCase):
+    """
+    Unit tests for the qubit-locality reordering of execute.
+    """
+
+    def _circuit(self, n):
+        # Most of the work happens on the highest qubits
+        c = Circuit()
+        for q in range(n):
+            c.push(GateH(), q)
+        for _ in range(5):
+            c.push(GateRX(0.3), n - 1)
+            c.push(GateCX(), n - 1, n - 2)
+            c.push(GateRZ(0.2), n - 2)
+        return c
+
+    def test_frequent_qubits_move_to_low_positions(self):
+        permutation = locality_permutation(self._circuit(6), local_qubits=2)
+        self.assertEqual(sorted(permutation), list(range(6)))
+        self.assertEqual({permutation[5], permutation[4]}, {0, 1})
+
+    def test_unprofitable_permutation_is_skipped(self):
+        self.assertIsNone(locality_permutation(self._circuit(6), local_qubits=6))
+        c = Circuit()
+        c.push(GateCX(), 0, 1)
+        c.push(GateH(), 5)
+        self.assertIsNone(locality_permutation(c, local_qubits=2))
+
+    def test_statevector_is_restored(self):
+        n = 6
+        c = self._circuit(n)
+        permutation = locality_permutation(c, local_qubits=2)
+
+        processor = Quantanium()
+        processor.execute(c, nsamples=1, seed=1, return_statevector=True)
+        expected = processor.get_statevector()
+        processor.execute(relabel(c, permutation), nsamples=1, seed=1, return_statevector=True)
+        restored = to_logical_statevector(processor.get_statevector(), permutation)
+        np.testing.assert_allclose(restored, expected, atol=1e-12)
+
+    def test_execute_reports_logical_order(self):
+        n = 18
+        c = self._circuit(n)
+        c.push(Measure(), range(n), range(n))
+        bitstrings = [bitarray("1" + "0" * (n - 1)), bitarray("0" * (n - 1) + "1")]
+
+        plain = Quantanium()
+        reordered = Quantanium(reorder_qubits=True)
+        expected = plain.execute(c, nsamples=1, seed=1, bitstrings=bitstrings)
+        result = reordered.execute(c, nsamples=1, seed=1, bitstrings=bitstrings)
+
+        np.testing.assert_allclose(reordered.get_amplitudes(), plain.get_amplitudes(), atol=1e-12)
+        self.assertEqual(
+            sorted(k.to01() for k in result.amplitudes),
+            sorted(k.to01() for k in expected.amplitudes),
+        )
+
+    def test_amplitude_bitstring_is_relabeled(self):
+        n = 18
+        c = self._circuit(n)
+        c.push(Amplitude(BitString("0" * (n - 1) + "1")), 0)
+        permutation = locality_permutation(c)
+
+        amplitude = relabel(c, permutation)[-1].get_operation()
+        self.assertEqual(amplitude.bs.to01().index("1"), permutation[n - 1])
+
+        expected = Quantanium().execute(c, nsamples=1, seed=1)
+        result = Quantanium(reorder_qubits=True).execute(c, nsamples=1, seed=1)
+        np.testing.assert_allclose(
+            np.array(result.zstates), np.array(expected.zstates), atol=1e-12)
+
+    def test_nested_amplitude_disables_reordering(self):
+        block = Circuit()
+        block.push(Amplitude(BitString("1")), 0)
+        c = self._circuit(6)
+        c.push(Block(block), 0)
+        self.assertIsNone(locality_permutation(c, local_qubits=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
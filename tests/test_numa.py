@@ -0,0 +1,62 @@
+import os
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from quantanium import _core
+from mimiqcircuits import *
+
+
+class TestThreadingOptions(unittest.TestCase):
+    """
+    Unit tests for the num_threads and numa options of the CPU engine.
+    """
+
+    def _circuit(self, n):
+        c = Circuit()
+        for q in range(n):
+            c.push(GateH(), q)
+            c.push(GateRZ(0.1 * q), q)
+        for q in range(n - 1):
+            c.push(GateCX(), q, q + 1)
+        return c
+
+    def test_results_do_not_depend_on_placement(self):
+        expected = Quantanium().evolve(self._circuit(10), seed=1)
+        for numa in ("none", "local", "interleave"):
+            for num_threads in (1, 2, 0):
+                processor = Quantanium(num_threads=num_threads, numa=numa)
+                result = processor.evolve(self._circuit(10), seed=1)
+                np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    def test_successive_evolves_continue_the_placed_state(self):
+        plain = Quantanium()
+        plain.evolve(self._circuit(8), seed=1)
+        expected = plain.evolve(self._circuit(8), seed=1)
+
+        processor = Quantanium(numa="local", num_threads=2)
+        processor.evolve(self._circuit(8), seed=1)
+        result = processor.evolve(self._circuit(8), seed=1)
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_session_state_is_placed(self):
+        processor = Quantanium(numa="interleave", num_threads=2)
+        session = processor.session(6)
+        view = session.get_statevector_view()
+        self.assertEqual(view[0], 1)
+        self.assertEqual(np.count_nonzero(view), 1)
+
+    def test_local_placement_leaves_environment_alone(self):
+        environ = dict(os.environ)
+        Quantanium(numa="local")
+        self.assertEqual(dict(os.environ), environ)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            Quantanium(numa="spread")
+        with self.assertRaises(ValueError):
+            Quantanium(num_threads=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
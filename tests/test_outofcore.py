@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from quantanium import _core
+from quantanium.outofcore import schedule, unitary_gates
+from mimiqcircuits import *
+
+
+class TestOutOfCore(unittest.TestCase):
+    """
+    Unit tests for the out-of-core, memory-mapped storage of the statevector.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "state.qua")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _circuit(self, n):
+        c = Circuit()
+        for layer in range(3):
+            for q in range(n):
+                c.push(GateU(0.1 * q, 0.2 * layer, 0.3), q)
+            for q in range(layer % 2, n - 1, 2):
+                c.push(GateCX(), q, (q + 3) % n)
+        c.push(GateCCX(), 0, n // 2, n - 1)
+        return c
+
+    def test_schedule_groups_gates_by_chunk(self):
+        gates = list(unitary_gates(self._circuit(8)))
+        self.assertEqual(len(schedule(gates, 8)), 1)
+        stages = schedule(gates, 4)
+        self.assertLess(len(stages), len(gates))
+        self.assertEqual(sum(len(stage) for stage in stages), len(gates))
+        for stage in stages:
+            self.assertLessEqual(len(stage.qubits), 4)
+
+    def test_evolve_matches_in_memory(self):
+        expected = Quantanium().evolve(self._circuit(9), seed=1)
+        for chunk_qubits in (2, 3, 5, 9):
+            processor = Quantanium(storage="mmap", path=self.path, chunk_qubits=chunk_qubits)
+            result = processor.evolve(self._circuit(9), seed=1)
+            np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    def test_execute_samples_the_file(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateCX(), 0, range(1, 6))
+        c.push(Measure(), range(6), range(6))
+        processor = Quantanium(storage="mmap", path=self.path, chunk_qubits=3)
+        result = processor.execute(c, nsamples=2000, seed=1)
+        histogram = result.histogram()
+        self.assertEqual(set(k.to01() for k in histogram), {"000000", "111111"})
+        self.assertGreater(min(histogram.values()), 800)
+
+        resampled = processor.resample(nsamples=100, seed=2)
+        self.assertEqual(len(resampled.cstates), 100)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_backing_file_is_a_checkpoint(self):
+        processor = Quantanium(storage="mmap", path=self.path, chunk_qubits=3)
+        expected = np.array(processor.evolve(self._circuit(6), seed=1))
+
+        restored = Quantanium()
+        restored.load_state(self.path)
+        np.testing.assert_array_equal(restored.get_statevector(), expected)
+
+    def test_unsupported_circuits(self):
+        processor = Quantanium(storage="mmap", path=self.path)
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(Measure(), 0, 0)
+        c.push(GateX(), 0)
+        with self.assertRaises(ValueError):
+            processor.execute(c)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            Quantanium(storage="disk", path=self.path)
+        with self.assertRaises(ValueError):
+            Quantanium(storage="mmap")
+        with self.assertRaises(ValueError):
+            Quantanium(storage="mmap", path=self.path, blocking=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestResample(unittest.TestCase):
+    """
+    Unit tests for resampling the final state of the last execution.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+
+    def _ghz(self, n):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateCX(), 0, range(1, n))
+        c.push(Measure(), range(n), range(n))
+        return c
+
+    def test_samples_follow_the_final_state(self):
+        self.processor.execute(self._ghz(3), nsamples=10, seed=1)
+        result = self.processor.resample(nsamples=2000, seed=3)
+        self.assertEqual(len(result.cstates), 2000)
+        histogram = result.histogram()
+        self.assertEqual(set(k.to01() for k in histogram), {"000", "111"})
+        self.assertGreater(min(histogram.values()), 800)
+
+    def test_resample_is_reproducible(self):
+        self.processor.execute(self._ghz(4), nsamples=10, seed=1)
+        first = self.processor.resample(nsamples=100, seed=5)
+        second = self.processor.resample(nsamples=100, seed=5)
+        self.assertEqual(first.histogram(), second.histogram())
+
+    def test_measurement_maps_qubits_to_bits(self):
+        c = Circuit()
+        c.push(GateX(), 0)
+        c.push(Measure(), 0, 2)
+        c.push(Measure(), 1, 0)
+        self.processor.execute(c, nsamples=10, seed=1)
+        result = self.processor.resample(nsamples=10, seed=1)
+        self.assertEqual(result.cstates[0].tolist(), [0, 0, 1])
+
+    def test_mid_circuit_measurement_is_not_resampled(self):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(Measure(), 0, 0)
+        c.push(GateX(), 0)
+        self.processor.execute(c, nsamples=10, seed=1)
+        with self.assertRaises(RuntimeError):
+            self.processor.resample()
+
+    def test_requires_an_execution(self):
+        with self.assertRaises(RuntimeError):
+            self.processor.resample()
+
+
+if __name__ == "__main__":
+    unittest.main()
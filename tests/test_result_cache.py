@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from quantanium import Quantanium
+from quantanium.cache import LRUCache
+from mimiqcircuits import *
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Unit tests for the opt-in result cache of execute.
+    """
+
+    def _ghz(self, n):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateCX(), 0, range(1, n))
+        c.push(Measure(), range(n), range(n))
+        return c
+
+    def test_disabled_by_default(self):
+        with self.assertRaises(RuntimeError):
+            Quantanium().result_cache_stats()
+
+    def test_seeded_executions_hit_the_cache(self):
+        processor = Quantanium(result_cache_size=8)
+        first = processor.execute(self._ghz(3), nsamples=100, seed=4)
+        second = processor.execute(self._ghz(3), nsamples=100, seed=4)
+        self.assertEqual(first.histogram(), second.histogram())
+
+        stats = processor.result_cache_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_key_includes_seed_and_nsamples(self):
+        processor = Quantanium(result_cache_size=8)
+        processor.execute(self._ghz(3), nsamples=100, seed=4)
+        processor.execute(self._ghz(3), nsamples=100, seed=5)
+        processor.execute(self._ghz(3), nsamples=50, seed=4)
+        self.assertEqual(processor.result_cache_stats()["hits"], 0)
+
+    def test_unseeded_executions_resample(self):
+        processor = Quantanium(result_cache_size=8)
+        processor.execute(self._ghz(3), nsamples=100)
+        result = processor.execute(self._ghz(3), nsamples=200)
+        self.assertEqual(len(result.cstates), 200)
+        self.assertEqual(processor.result_cache_stats()["hits"], 1)
+
+    def test_final_states_count_their_results(self):
+        processor = Quantanium(result_cache_size=8, result_cache_bytes=2**20)
+        processor.execute(self._ghz(3), nsamples=100)
+        # The state is not simulated yet, its circuit and results are held
+        self.assertGreater(processor.result_cache_stats()["nbytes"], 0)
+
+    def test_results_persist_on_disk(self):
+        with tempfile.TemporaryDirectory() as path:
+            first = Quantanium(result_cache_size=8, result_cache_path=path)
+            expected = first.execute(self._ghz(3), nsamples=100, seed=4)
+
+            second = Quantanium(result_cache_size=8, result_cache_path=path)
+            result = second.execute(self._ghz(3), nsamples=100, seed=4)
+            self.assertEqual(result.histogram(), expected.histogram())
+            self.assertEqual(second.result_cache_stats()["size"], 1)
+
+
+class TestLRUCacheBudget(unittest.TestCase):
+    """
+    Unit tests for the memory budget of LRUCache.
+    """
+
+    def test_evicts_to_fit_the_budget(self):
+        cache = LRUCache(maxsize=10, maxbytes=10, sizeof=len)
+        cache.put("a", b"xxxx")
+        cache.put("b", b"xxxx")
+        cache.put("c", b"xxxx")
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.stats()["nbytes"], 8)
+
+    def test_oversized_entries_are_not_stored(self):
+        cache = LRUCache(maxsize=10, maxbytes=4, sizeof=len)
+        cache.put("a", b"xxxxx")
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
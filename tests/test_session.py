@@ -0,0 +1,71 @@
+import io
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from quantanium import _core
+from quantanium._core import ProtoParser
+from mimiqcircuits import *
+
+
+class TestSession(unittest.TestCase):
+    """
+    Unit tests for simulator sessions reusing a preallocated statevector.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+        self.session = self.processor.session(4)
+
+    def _ghz(self, n):
+        c = Circuit()
+        c.push(GateH(), 0)
+        c.push(GateCX(), 0, range(1, n))
+        c.push(Measure(), range(n), range(n))
+        return c
+
+    def test_results_match_execute(self):
+        for n in (2, 3, 4):
+            circuit = self._ghz(n)
+            result = self.session.execute(circuit, nsamples=300, seed=7)
+            expected = self.processor.execute(circuit, nsamples=300, seed=7)
+            self.assertEqual(result.histogram(), expected.histogram())
+
+    def test_state_is_reset_between_executions(self):
+        c = Circuit()
+        c.push(GateX(), 0)
+        c.push(Measure(), 0, 0)
+        for _ in range(3):
+            result = self.session.execute(c, nsamples=10, seed=1)
+            self.assertEqual(result.cstates[0].tolist(), [1])
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_statevector_is_not_reallocated(self):
+        self.session.execute(self._ghz(2), nsamples=1, seed=1)
+        before = self.session.get_statevector_view().__array_interface__["data"][0]
+        self.session.execute(self._ghz(4), nsamples=1, seed=1)
+        after = self.session.get_statevector_view().__array_interface__["data"][0]
+        self.assertEqual(before, after)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_failed_execution_keeps_the_state(self):
+        # A 3-qubit custom gate is rejected by the engine, bypass the decomposition
+        c = Circuit()
+        c.push(GateCustom(np.eye(8)), 0, 1, 2)
+        buffer = io.BytesIO()
+        c.saveproto(buffer)
+        with self.assertRaises(Exception):
+            qua_circuit = ProtoParser().load_proto_bytes(buffer.getvalue())
+            self.session._native.execute(qua_circuit, 1, 1)
+
+        result = self.session.execute(self._ghz(4), nsamples=300, seed=7)
+        expected = self.processor.execute(self._ghz(4), nsamples=300, seed=7)
+        self.assertEqual(result.histogram(), expected.histogram())
+        self.assertEqual(np.count_nonzero(self.session.get_statevector_view()), 2)
+
+    def test_too_many_qubits(self):
+        with self.assertRaises(ValueError):
+            self.session.execute(self._ghz(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+from quantanium import Quantanium
+from quantanium import _core
+from mimiqcircuits import *
+
+
+class TestStatevector(unittest.TestCase):
+    """
+    Unit tests for the statevector returned by the Quantanium backend.
+    """
+
+    def setUp(self):
+        self.processor = Quantanium()
+        self.circuit = Circuit()
+        self.circuit.push(GateH(), 0)
+        self.circuit.push(GateCX(), 0, 1)
+
+    def test_execute_returns_numpy_statevector(self):
+        self.processor.execute(
+            self.circuit, nsamples=10, seed=1, return_statevector=True)
+        sv = self.processor.get_statevector()
+
+        self.assertIsInstance(sv, np.ndarray)
+        self.assertEqual(sv.dtype, np.complex128)
+        self.assertEqual(sv.shape, (4,))
+        np.testing.assert_allclose(
+            sv, np.array([1, 0, 0, 1]) / np.sqrt(2), atol=1e-12)
+
+    def test_execute_skips_statevector_by_default(self):
+        self.processor.execute(self.circuit, nsamples=10, seed=1)
+
+        with self.assertRaises(RuntimeError):
+            self.processor.get_statevector()
+
+    def test_evolve_returns_numpy_statevector(self):
+        sv = self.processor.evolve(self.circuit)
+
+        self.assertIsInstance(sv, np.ndarray)
+        self.assertAlmostEqual(float(np.sum(np.abs(sv) ** 2)), 1.0, places=12)
+
+    @unittest.skipUnless(_core.HAS_STATEVECTOR_VIEWS, "the engine does not expose the statevector memory")
+    def test_statevector_view_shares_engine_memory(self):
+        self.processor.evolve(self.circuit)
+        view = self.processor.get_statevector_view()
+
+        self.assertTrue(view.flags.writeable)
+        np.testing.assert_allclose(view, self.processor.get_statevector())
+
+        # Writing into the view changes the state the next evolve starts from
+        view[:] = 0
+        view[0] = 1
+        c = Circuit()
+        c.push(GateX(), 0)
+        self.processor.evolve(c)
+        probabilities = np.abs(self.processor.get_statevector_view()) ** 2
+        self.assertAlmostEqual(float(probabilities.sum()), 1.0, places=12)
+        self.assertAlmostEqual(float(probabilities.max()), 1.0, places=12)
+
+    @unittest.skipIf(_core.HAS_STATEVECTOR_VIEWS, "the engine exposes the statevector memory")
+    def test_statevector_view_needs_engine_support(self):
+        self.processor.evolve(self.circuit)
+        with self.assertRaises(RuntimeError):
+            self.processor.get_statevector_view()
+
+    def test_single_precision(self):
+        processor = Quantanium(precision="single")
+        processor.execute(
+            self.circuit, nsamples=10, seed=1, return_statevector=True)
+        sv = processor.get_statevector()
+
+        self.assertEqual(sv.dtype, np.complex64)
+        np.testing.assert_allclose(
+            sv, np.array([1, 0, 0, 1]) / np.sqrt(2), atol=1e-6)
+
+        sv = processor.evolve(self.circuit)
+        self.assertEqual(sv.dtype, np.complex64)
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            Quantanium(precision="half")
+
+
+if __name__ == "__main__":
+    unittest.main()
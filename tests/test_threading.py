@@ -0,0 +1,55 @@
+import sys
+import threading
+import time
+import unittest
+from quantanium import Quantanium
+from mimiqcircuits import *
+
+
+class TestThreadedSimulations(unittest.TestCase):
+    """
+    The long-running native calls release the GIL, so Python threads keep
+    running while a Quantanium instance executes a circuit.
+    """
+
+    def setUp(self):
+        self.circuit = Circuit()
+        for _ in range(10):
+            for q in range(22):
+                self.circuit.push(GateH(), q)
+            self.circuit.push(GateCX(), 0, range(1, 22))
+        self.circuit.push(Measure(), range(22), range(22))
+
+    def test_execute_releases_gil(self):
+        processor = Quantanium()
+        processor.execute(self.circuit, nsamples=10, seed=0)
+
+        done = threading.Event()
+
+        def run():
+            processor.execute(self.circuit, nsamples=10, seed=1)
+            done.set()
+
+        worker = threading.Thread(target=run)
+        start = time.perf_counter()
+        worker.start()
+
+        # With the GIL held by the native call, this loop would stall for its
+        # whole duration
+        last = start
+        longest_gap = 0.0
+        while not done.is_set():
+            now = time.perf_counter()
+            longest_gap = max(longest_gap, now - last)
+            last = now
+            time.sleep(0)
+        worker.join()
+        duration = time.perf_counter() - start
+
+        if duration < 50 * sys.getswitchinterval():
+            self.skipTest("execution too fast to observe the GIL")
+        self.assertLess(longest_gap, duration / 4)
+
+
+if __name__ == "__main__":
+    unittest.main()